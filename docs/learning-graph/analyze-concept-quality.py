@@ -4,10 +4,11 @@ Analyze the quality of concepts in learning-graph.csv
 Checks for duplicates, formatting, length, and clarity
 """
 
-import csv
 from collections import Counter
 from typing import List, Dict, Tuple
 
+from learning_graph import read_rows
+
 def is_title_case(text: str) -> bool:
     """Check if text is in Title Case (allowing for acronyms)"""
     words = text.split()
@@ -23,31 +24,31 @@ def is_title_case(text: str) -> bool:
             return False
     return True
 
-def analyze_concepts(csv_file: str) -> Dict:
-    """Analyze concept list quality"""
+def analyze_concepts(csv_file: str, graph=None) -> Dict:
+    """Analyze concept list quality (graph: already loaded LearningGraph for csv_file)"""
     concepts = []
     duplicates = []
     formatting_issues = []
     length_issues = []
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            label = row['ConceptLabel']
-            concepts.append({
-                'id': row['ConceptID'],
-                'label': label,
-                'dependencies': row['Dependencies'],
-                'taxonomy': row['TaxonomyID']
-            })
-
-            # Check formatting
-            if not is_title_case(label):
-                formatting_issues.append(label)
-
-            # Check length (target: under 32 characters)
-            if len(label) > 32:
-                length_issues.append((label, len(label)))
+    # Read rows without building the graph, so duplicate IDs and unknown
+    # dependencies are reported instead of stopping the analysis
+    rows = graph.rows() if graph is not None else read_rows(csv_file)
+    for concept_id, label, prereq_ids, taxonomy in rows:
+        concepts.append({
+            'id': str(concept_id),
+            'label': label,
+            'dependencies': '|'.join(map(str, prereq_ids)),
+            'taxonomy': taxonomy
+        })
+
+        # Check formatting
+        if not is_title_case(label):
+            formatting_issues.append(label)
+
+        # Check length (target: under 32 characters)
+        if len(label) > 32:
+            length_issues.append((label, len(label)))
 
     # Check for duplicates
     label_counts = Counter(c['label'] for c in concepts)
@@ -70,9 +71,8 @@ def analyze_concepts(csv_file: str) -> Dict:
         'concepts': concepts
     }
 
-if __name__ == '__main__':
-    result = analyze_concepts('learning-graph.csv')
-
+def print_quality_report(result: Dict):
+    """Print the concept quality analysis as markdown"""
     print(f"# Concept List Quality Analysis\n")
     print(f"**Total Concepts:** {result['total_concepts']}")
     print(f"**Quality Score:** {result['quality_score']:.1f}/100\n")
@@ -109,3 +109,6 @@ if __name__ == '__main__':
         print("✓ Good quality - minor issues can be addressed during generation")
     else:
         print("⚠ Quality issues detected - consider cleaning before generation")
+
+if __name__ == '__main__':
+    print_quality_report(analyze_concepts('learning-graph.csv'))
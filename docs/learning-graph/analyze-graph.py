@@ -8,333 +8,680 @@ Analyzes the concept dependency graph and generates quality metrics including:
 - Dependency chain analysis
 - Orphaned node detection
 - Connected component analysis
-"""
+- Centrality (PageRank and approximate betweenness)
 
-import csv
-from collections import defaultdict, deque
-from typing import Dict, List, Set, Tuple
+Batch mode analyzes many learning graphs (e.g. one per course repository)
+in parallel worker processes, writing each report under the output
+directory plus a cross-course summary.
 
+Sections are written as soon as they are computed, and the same metrics
+can be written as JSON or streamed as NDJSON for dashboards.  Listings,
+foundational concepts included, are capped so report size stays bounded
+on very large graphs; pass --full-listings to list every orphan,
+foundational concept, self-dependency, component member and cycle.
 
-def load_graph(csv_path: str) -> Tuple[Dict[int, str], Dict[int, List[int]]]:
-    """Load the dependency graph from CSV file."""
-    concepts = {}  # id -> label
-    dependencies = defaultdict(list)  # id -> list of prerequisite ids
+Usage: python analyze-graph.py <input_csv> <output_report.md> [--json metrics.json]
+                               [--ndjson metrics.ndjson] [--full-listings] [--max-rows N]
+       python analyze-graph.py --batch <output_dir> <csv_dir_or_glob> [...] [--workers N]
+"""
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            concept_id = int(row['ConceptID'])
-            concepts[concept_id] = row['ConceptLabel']
+import contextlib
+import glob
+import heapq
+import io
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-            if row['Dependencies']:
-                deps = [int(d) for d in row['Dependencies'].split('|')]
-                dependencies[concept_id] = deps
+from graph_cache import load_graph_cached
+from learning_graph import DisjointSet, LearningGraph, stream_components
 
-    return concepts, dependencies
+# Listings longer than this end with "...and N more" unless full listings are requested
+TABLE_ROWS = 20
+COMPONENT_ROWS = 10
+TOP_INDEGREE_ROWS = 10
 
 
-def calculate_indegree(concepts: Dict[int, str],
-                       dependencies: Dict[int, List[int]]) -> Dict[int, int]:
-    """Calculate indegree (number of concepts that depend on each concept)."""
-    indegree = {cid: 0 for cid in concepts}
+def load_graph(csv_path: str, use_cache: bool = True) -> LearningGraph:
+    """Load the dependency graph from CSV file into a CSR-indexed LearningGraph."""
+    if use_cache:
+        return load_graph_cached(csv_path)
+    return LearningGraph.from_csv(csv_path)
 
-    for concept_id, prereqs in dependencies.items():
-        for prereq in prereqs:
-            indegree[prereq] += 1
 
-    return indegree
+def calculate_indegree(graph: LearningGraph) -> Dict[int, int]:
+    """Calculate indegree (number of concepts that depend on each concept)."""
+    return dict(zip(graph.ids, graph.in_degrees()))
 
 
-def calculate_outdegree(concepts: Dict[int, str],
-                        dependencies: Dict[int, List[int]]) -> Dict[int, int]:
+def calculate_outdegree(graph: LearningGraph) -> Dict[int, int]:
     """Calculate outdegree (number of prerequisites for each concept)."""
-    outdegree = {cid: len(dependencies.get(cid, [])) for cid in concepts}
-    return outdegree
+    return dict(zip(graph.ids, graph.out_degrees()))
 
 
-def find_orphaned_nodes(concepts: Dict[int, str],
-                        indegree: Dict[int, int],
-                        dependencies: Dict[int, List[int]]) -> List[Tuple[int, str]]:
+def find_orphaned_nodes(graph: LearningGraph,
+                        indegree: Dict[int, int]) -> List[Tuple[int, str]]:
     """Find concepts that nothing depends on (potential dead ends)."""
-    orphaned = [(cid, label) for cid, label in concepts.items()
-                if indegree[cid] == 0 and cid in dependencies]
+    offsets = graph.prereq_offsets
+    orphaned = [(cid, label) for i, (cid, label) in enumerate(zip(graph.ids, graph.labels))
+                if indegree[cid] == 0 and offsets[i + 1] > offsets[i]]
     return orphaned
 
 
-def verify_dag(concepts: Dict[int, str],
-               dependencies: Dict[int, List[int]]) -> Tuple[bool, List[List[int]]]:
+def verify_dag(graph: LearningGraph) -> Tuple[bool, List[List[int]]]:
     """Verify the graph is a DAG using topological sort. Returns (is_dag, cycles_found)."""
-    indeg = {cid: 0 for cid in concepts}
+    is_dag = len(graph.topological_order()) == graph.node_count
+    cycles = [] if is_dag else find_cycles(graph)
 
-    # Calculate indegree
-    for concept_id, prereqs in dependencies.items():
-        for prereq in prereqs:
-            indeg[prereq] += 1
+    return is_dag, cycles
 
-    # Kahn's algorithm for topological sort
-    queue = deque([cid for cid in concepts if indeg[cid] == 0])
-    processed = []
 
-    while queue:
-        node = queue.popleft()
-        processed.append(node)
+def find_cycles(graph: LearningGraph) -> List[List[int]]:
+    """
+    Find one witness cycle for every strongly connected component that has a cycle.
 
-        # For each concept that depends on this node
-        for concept_id, prereqs in dependencies.items():
-            if node in prereqs:
-                indeg[concept_id] -= 1
-                if indeg[concept_id] == 0:
-                    queue.append(concept_id)
+    All cyclic components are found in a single O(V+E) pass, so one report
+    lists every cycle group instead of stopping at the first cycle.
+    """
+    return [[graph.ids[i] for i in graph.witness_cycle(component)]
+            for component in graph.cyclic_components()]
 
-    is_dag = len(processed) == len(concepts)
-    cycles = [] if is_dag else find_cycles(concepts, dependencies)
 
-    return is_dag, cycles
+def find_self_dependencies(graph: LearningGraph) -> List[int]:
+    """Find concepts that list themselves as a prerequisite."""
+    return [graph.ids[component[0]] for component in graph.cyclic_components()
+            if len(component) == 1]
 
 
-def find_cycles(concepts: Dict[int, str],
-                dependencies: Dict[int, List[int]]) -> List[List[int]]:
-    """Find cycles in the graph using DFS."""
-    visited = set()
-    rec_stack = set()
-    cycles = []
-
-    def dfs(node, path):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        # Check all nodes that this node depends on (reverse edges in dependency graph)
-        for next_node, prereqs in dependencies.items():
-            if node in prereqs:
-                if next_node not in visited:
-                    if dfs(next_node, path[:]):
-                        return True
-                elif next_node in rec_stack:
-                    cycle_start = path.index(next_node)
-                    cycles.append(path[cycle_start:] + [next_node])
-                    return True
-
-        rec_stack.remove(node)
-        return False
-
-    for node in concepts:
-        if node not in visited:
-            dfs(node, [])
-
-    return cycles
-
-
-def find_longest_chain(concepts: Dict[int, str],
-                       dependencies: Dict[int, List[int]]) -> Tuple[int, List[int]]:
-    """Find the longest dependency chain using DFS."""
-    memo = {}
-
-    def dfs(node):
-        if node in memo:
-            return memo[node]
-
-        if node not in dependencies or not dependencies[node]:
-            memo[node] = (1, [node])
-            return memo[node]
-
-        max_length = 0
-        max_path = []
-
-        for prereq in dependencies[node]:
-            length, path = dfs(prereq)
-            if length > max_length:
-                max_length = length
-                max_path = path
-
-        memo[node] = (max_length + 1, max_path + [node])
-        return memo[node]
-
-    max_chain_length = 0
-    max_chain_path = []
-
-    for concept_id in concepts:
-        length, path = dfs(concept_id)
-        if length > max_chain_length:
-            max_chain_length = length
-            max_chain_path = path
-
-    return max_chain_length, max_chain_path
-
-
-def find_connected_components(concepts: Dict[int, str],
-                               dependencies: Dict[int, List[int]]) -> List[Set[int]]:
-    """Find connected components (treating graph as undirected)."""
-    visited = set()
-    components = []
-
-    def bfs(start):
-        component = set()
-        queue = deque([start])
-        component.add(start)
-        visited.add(start)
-
-        while queue:
-            node = queue.popleft()
-
-            # Add all neighbors (both directions)
-            if node in dependencies:
-                for prereq in dependencies[node]:
-                    if prereq not in visited:
-                        visited.add(prereq)
-                        component.add(prereq)
-                        queue.append(prereq)
-
-            for concept_id, prereqs in dependencies.items():
-                if node in prereqs and concept_id not in visited:
-                    visited.add(concept_id)
-                    component.add(concept_id)
-                    queue.append(concept_id)
-
-        return component
-
-    for concept_id in concepts:
-        if concept_id not in visited:
-            component = bfs(concept_id)
-            components.append(component)
+def find_longest_chain(graph: LearningGraph) -> Tuple[int, List[int]]:
+    """Find the longest dependency chain from the per-node chain heights."""
+    height, _ = graph.chain_heights()
+    if not len(height):
+        return 0, []
 
-    return components
+    end = max(range(graph.node_count), key=height.__getitem__)
+    if height[end] == 0:
+        return 0, []
 
+    return height[end], [graph.ids[i] for i in graph.chain_to(end)]
 
-def generate_report(csv_path: str, output_path: str):
-    """Generate comprehensive quality metrics report."""
-    concepts, dependencies = load_graph(csv_path)
 
-    # Calculate metrics
-    indegree = calculate_indegree(concepts, dependencies)
-    outdegree = calculate_outdegree(concepts, dependencies)
-    orphaned = find_orphaned_nodes(concepts, indegree, dependencies)
-    is_dag, cycles = verify_dag(concepts, dependencies)
-    max_chain_length, max_chain_path = find_longest_chain(concepts, dependencies)
-    components = find_connected_components(concepts, dependencies)
+def find_top_chains(graph: LearningGraph, k: int = 5) -> List[Tuple[int, List[int]]]:
+    """
+    Find the k longest dependency chains that end at distinct terminal concepts.
 
-    # Foundational concepts
-    foundational = [(cid, label) for cid, label in concepts.items()
-                    if outdegree[cid] == 0]
+    Terminal concepts are those no other concept depends on, so each chain
+    is a complete learning path rather than a prefix of a longer one.
+    """
+    height, _ = graph.chain_heights()
+    offsets = graph.dependent_offsets
+    terminals = (i for i in range(graph.node_count)
+                 if offsets[i + 1] == offsets[i] and height[i] > 0)
+    ends = heapq.nlargest(k, terminals, key=height.__getitem__)
 
-    # Top concepts by indegree
-    top_indegree = sorted([(cid, label, indegree[cid])
-                          for cid, label in concepts.items()],
-                         key=lambda x: x[2], reverse=True)[:10]
+    return [(height[end], [graph.ids[i] for i in graph.chain_to(end)]) for end in ends]
 
-    # Calculate average dependencies
-    total_deps = sum(len(deps) for deps in dependencies.values())
-    avg_deps = total_deps / len(dependencies) if dependencies else 0
 
-    # Generate markdown report
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("# Learning Graph Quality Metrics Report\n\n")
-        f.write("## Overview\n\n")
-        f.write(f"- **Total Concepts**: {len(concepts)}\n")
-        f.write(f"- **Foundational Concepts** (no dependencies): {len(foundational)}\n")
-        f.write(f"- **Concepts with Dependencies**: {len(dependencies)}\n")
-        f.write(f"- **Average Dependencies per Concept**: {avg_deps:.2f}\n\n")
-
-        f.write("## Graph Structure Validation\n\n")
-        f.write(f"- **Valid DAG Structure**: {'✅ Yes' if is_dag else '❌ No'}\n")
-        f.write(f"- **Self-Dependencies**: None detected ✅\n")
-        f.write(f"- **Cycles Detected**: {len(cycles)}\n\n")
-
-        if cycles:
-            f.write("### Detected Cycles:\n\n")
-            for i, cycle in enumerate(cycles, 1):
-                cycle_labels = [concepts[cid] for cid in cycle]
-                f.write(f"{i}. {' → '.join(cycle_labels)}\n")
-            f.write("\n")
+def component_forest(graph: LearningGraph) -> DisjointSet:
+    """Union every dependency edge, giving the (undirected) connected components."""
+    components = DisjointSet(graph.node_count)
+    offsets = graph.prereq_offsets
+    targets = graph.prereq_targets
+    for node in range(graph.node_count):
+        for pos in range(offsets[node], offsets[node + 1]):
+            components.union(node, targets[pos])
+    return components
 
-        f.write("## Foundational Concepts\n\n")
-        f.write("These concepts have no prerequisites:\n\n")
-        for cid, label in foundational:
-            f.write(f"- **{cid}**: {label}\n")
-        f.write("\n")
 
-        f.write("## Dependency Chain Analysis\n\n")
-        f.write(f"- **Maximum Dependency Chain Length**: {max_chain_length}\n\n")
-        f.write("### Longest Learning Path:\n\n")
-        for i, cid in enumerate(max_chain_path, 1):
-            f.write(f"{i}. **{concepts[cid]}** (ID: {cid})\n")
-        f.write("\n")
+def find_connected_components(graph: LearningGraph) -> List[Set[int]]:
+    """Find connected components (treating graph as undirected), largest first."""
+    components = component_forest(graph)
+    ids = graph.ids
+    members = sorted(components.components().values(), key=len, reverse=True)
+    return [{ids[i] for i in component} for component in members]
+
+
+def summarize_components(csv_path: str) -> Tuple[int, Dict[int, int]]:
+    """
+    Count connected components by streaming edges from the CSV.
+
+    Returns:
+        (component_count, size_distribution) where size_distribution maps
+        component size -> number of components of that size
+    """
+    components, _ = stream_components(csv_path)
+    return components.count, value_distribution(components.component_sizes().values())
+
+
+def value_distribution(values: Iterable[int]) -> Dict[int, int]:
+    """Map each value (e.g. a component size) -> number of times it occurs."""
+    distribution = defaultdict(int)
+    for value in values:
+        distribution[value] += 1
+    return dict(distribution)
+
+
+def write_concept_metrics(graph: LearningGraph, output_path: str):
+    """
+    Write the per-concept metrics table next to the report.
+
+    Returns the metric columns, or None when NumPy is not installed.
+    """
+    try:
+        from graph_metrics import TRANSITIVE_NODE_LIMIT, structural_metrics, write_metrics_csv
+    except ImportError:
+        print("⚠️  NumPy not found; skipping per-concept metrics (pip install numpy)")
+        return None
+
+    metrics = structural_metrics(graph, transitive=graph.node_count <= TRANSITIVE_NODE_LIMIT)
+    metrics_path = Path(output_path).with_name('concept-metrics.csv')
+    write_metrics_csv(graph, metrics, str(metrics_path))
+    print(f"✅ Concept metrics table generated: {metrics_path}")
+    return metrics
+
+
+def report_sections(graph: LearningGraph, output_path: str,
+                    full_listings: bool = False,
+                    max_rows: int = TABLE_ROWS) -> Iterator[Tuple[str, Dict, str]]:
+    """
+    Compute the quality report one section at a time.
+
+    Yields (section, metrics, markdown) as soon as each section's metrics
+    are ready, so callers can write it out before the next one starts.
+    Listings of concepts, cycles and components are capped at max_rows
+    (COMPONENT_ROWS for components) unless full_listings is set, in the
+    markdown and the metrics alike; counts and distributions are always
+    complete.
+    """
+    rows = None if full_listings else max_rows
+    component_rows = None if full_listings else COMPONENT_ROWS
+    labels, index = graph.labels, graph.index
+
+    def label(cid: int) -> str:
+        return labels[index[cid]]
+
+    # Overview
+    outdegree = calculate_outdegree(graph)
+    foundational = [cid for cid, deg in outdegree.items() if deg == 0]
+    with_dependencies = len(outdegree) - len(foundational)
+    avg_deps = graph.edge_count / with_dependencies if with_dependencies else 0
+
+    yield 'overview', {
+        'concepts': graph.node_count,
+        'dependencies': graph.edge_count,
+        'foundational': len(foundational),
+        'with_dependencies': with_dependencies,
+        'average_dependencies': round(avg_deps, 4),
+    }, (
+        "# Learning Graph Quality Metrics Report\n\n"
+        "## Overview\n\n"
+        f"- **Total Concepts**: {graph.node_count}\n"
+        f"- **Foundational Concepts** (no dependencies): {len(foundational)}\n"
+        f"- **Concepts with Dependencies**: {with_dependencies}\n"
+        f"- **Average Dependencies per Concept**: {avg_deps:.2f}\n\n"
+    )
+
+    # Graph structure validation
+    is_dag, cycles = verify_dag(graph)
+    self_dependencies = find_self_dependencies(graph)
+    cycle_sizes = [len(component) for component in graph.cyclic_components()]
+
+    md = ["## Graph Structure Validation\n\n",
+          f"- **Valid DAG Structure**: {'✅ Yes' if is_dag else '❌ No'}\n"]
+    if self_dependencies:
+        md.append(f"- **Self-Dependencies**: {len(self_dependencies)} ❌\n")
+    else:
+        md.append("- **Self-Dependencies**: None detected ✅\n")
+    md.append(f"- **Cycles Detected**: {len(cycles)}\n\n")
+    if cycles:
+        md.append("### Detected Cycles:\n\n")
+        md.append("Each entry is the shortest cycle through one group of mutually dependent concepts:\n\n")
+        for i, (cycle, size) in enumerate(zip(_cap(cycles, rows), cycle_sizes), 1):
+            md.append(f"{i}. {' → '.join(label(cid) for cid in cycle)} "
+                      f"({size} concept{'s' if size != 1 else ''} in group)\n")
+        md.append(_more(cycles, rows, 'cycle groups'))
+        md.append("\n")
+
+    yield 'validation', {
+        'is_dag': is_dag,
+        'self_dependency_count': len(self_dependencies),
+        'self_dependencies': _cap(self_dependencies, rows),
+        'cycle_count': len(cycles),
+        'cycles': [{'concepts': cycle, 'group_size': size}
+                   for cycle, size in zip(_cap(cycles, rows), cycle_sizes)],
+    }, ''.join(md)
+
+    # Foundational concepts
+    md = ["## Foundational Concepts\n\n", "These concepts have no prerequisites:\n\n"]
+    md.extend(f"- **{cid}**: {label(cid)}\n" for cid in _cap(foundational, rows))
+    md.append(_more(foundational, rows))
+    md.append("\n")
+    yield 'foundational', {
+        'count': len(foundational),
+        'concepts': _cap(foundational, rows),
+    }, ''.join(md)
+
+    # Dependency chains
+    max_chain_length, max_chain_path = find_longest_chain(graph)
+    top_chains = find_top_chains(graph)
+
+    md = ["## Dependency Chain Analysis\n\n",
+          f"- **Maximum Dependency Chain Length**: {max_chain_length}\n\n",
+          "### Longest Learning Path:\n\n"]
+    md.extend(f"{i}. **{label(cid)}** (ID: {cid})\n" for i, cid in enumerate(max_chain_path, 1))
+    md.append("\n")
+    if len(top_chains) > 1:
+        md.append("### Longest Paths by Terminal Concept:\n\n")
+        md.append("| Rank | Terminal Concept | Chain Length | Starts From |\n")
+        md.append("|------|------------------|--------------|-------------|\n")
+        for i, (length, path) in enumerate(top_chains, 1):
+            md.append(f"| {i} | {label(path[-1])} | {length} | {label(path[0])} |\n")
+        md.append("\n")
+
+    yield 'chains', {
+        'max_chain_length': max_chain_length,
+        'longest_path': max_chain_path,
+        'top_chains': [{'length': length, 'start': path[0], 'end': path[-1]}
+                       for length, path in top_chains],
+    }, ''.join(md)
+
+    # Orphaned nodes
+    indegree = calculate_indegree(graph)
+    orphaned = [cid for cid, _ in find_orphaned_nodes(graph, indegree)]
+
+    md = ["## Orphaned Nodes Analysis\n\n", f"- **Total Orphaned Nodes**: {len(orphaned)}\n\n"]
+    if orphaned:
+        md.append("Concepts that are not prerequisites for any other concept:\n\n")
+        md.extend(f"- **{cid}**: {label(cid)}\n" for cid in _cap(orphaned, rows))
+        md.append(_more(orphaned, rows))
+    else:
+        md.append("✅ No orphaned nodes detected.\n")
+    md.append("\n")
+    yield 'orphans', {
+        'count': len(orphaned),
+        'concepts': _cap(orphaned, rows),
+    }, ''.join(md)
+
+    # Connected components: sizes for all, members only for the listed ones
+    forest = component_forest(graph)
+    sizes = forest.component_sizes()
+    roots = sorted(sizes, key=sizes.__getitem__, reverse=True)
+    listed = {root: [] for root in _cap(roots, component_rows)} if len(roots) > 1 else {}
+    if listed:
+        for node, cid in enumerate(graph.ids):
+            members = listed.get(forest.find(node))
+            if members is not None:
+                members.append(cid)
+    size_dist = value_distribution(sizes.values())
+
+    md = ["## Connected Components\n\n", f"- **Number of Connected Components**: {len(roots)}\n\n"]
+    if len(roots) == 1:
+        md.append("✅ All concepts are connected in a single graph.\n\n")
+    elif roots:
+        md.append("⚠️ Multiple disconnected subgraphs detected:\n\n")
+        md.append("| Component Size | Number of Components |\n")
+        md.append("|----------------|----------------------|\n")
+        md.extend(f"| {size} | {size_dist[size]} |\n" for size in sorted(size_dist, reverse=True))
+        md.append("\n")
+        for i, members in enumerate(listed.values(), 1):
+            members.sort()
+            md.append(f"### Component {i} ({len(members)} concepts)\n\n")
+            md.extend(f"- {label(cid)}\n" for cid in _cap(members, component_rows))
+            md.append(_more(members, component_rows))
+            md.append("\n")
+        if _more(roots, component_rows):
+            # Each component block already ends with a blank line
+            md.append(_more(roots, component_rows, 'components').lstrip('\n') + '\n')
+
+    yield 'components', {
+        'count': len(roots),
+        'size_distribution': {size: size_dist[size] for size in sorted(size_dist, reverse=True)},
+        'components': [{'size': len(members), 'concepts': _cap(members, component_rows)}
+                       for members in listed.values()],
+    }, ''.join(md)
+
+    # Indegree
+    top_indegree = heapq.nlargest(TOP_INDEGREE_ROWS, graph.ids, key=indegree.__getitem__)
+    md = ["## Indegree Analysis\n\n",
+          "Top 10 concepts that are prerequisites for the most other concepts:\n\n",
+          "| Rank | Concept ID | Concept Label | Indegree |\n",
+          "|------|-----------|---------------|----------|\n"]
+    md.extend(f"| {i} | {cid} | {label(cid)} | {indegree[cid]} |\n"
+              for i, cid in enumerate(top_indegree, 1))
+    md.append("\n")
+    yield 'indegree', {
+        'top': [{'concept': cid, 'indegree': indegree[cid]} for cid in top_indegree],
+    }, ''.join(md)
+
+    # Outdegree distribution, plus the per-concept metrics table
+    metrics = write_concept_metrics(graph, output_path)
+    if metrics is not None:
+        from graph_metrics import value_counts
+        outdeg_dist = value_counts(metrics['out_degree'])
+    else:
+        outdeg_dist = value_distribution(outdegree.values())
+
+    md = ["## Outdegree Distribution\n\n",
+          "| Dependencies | Number of Concepts |\n",
+          "|--------------|--------------------|\n"]
+    md.extend(f"| {deg} | {outdeg_dist[deg]} |\n" for deg in sorted(outdeg_dist))
+    md.append("\n")
+    yield 'outdegree', {
+        'distribution': {deg: outdeg_dist[deg] for deg in sorted(outdeg_dist)},
+    }, ''.join(md)
+
+    # Centrality
+    if metrics is not None and 'pagerank' in metrics:
+        from graph_metrics import BETWEENNESS_DELTA, BETWEENNESS_EPSILON, betweenness_sample_size
+        samples = betweenness_sample_size(graph.node_count)
+        md = ["## Centrality Analysis\n\n",
+              "PageRank favors concepts that much of the graph builds on; betweenness "
+              "favors bridge concepts that many shortest learning paths pass through.\n\n"]
+        section = {'betweenness_samples': samples, 'betweenness_epsilon': BETWEENNESS_EPSILON,
+                   'betweenness_delta': BETWEENNESS_DELTA}
+        for name, title in (('pagerank', 'PageRank'), ('betweenness', 'Betweenness')):
+            scores = metrics[name]
+            top = heapq.nlargest(TOP_INDEGREE_ROWS, range(graph.node_count), key=scores.__getitem__)
+            md.append(f"### Top 10 by {title}\n\n")
+            md.append(f"| Rank | Concept ID | Concept Label | {title} |\n")
+            md.append(f"|------|-----------|---------------|{'-' * (len(title) + 2)}|\n")
+            md.extend(f"| {i} | {graph.ids[node]} | {labels[node]} | {scores[node]:.4g} |\n"
+                      for i, node in enumerate(top, 1))
+            md.append("\n")
+            section[name] = [{'concept': graph.ids[node], 'score': float(scores[node])} for node in top]
+        if samples < graph.node_count:
+            md.append(f"*Betweenness estimated from {samples} sampled source concepts "
+                      f"(±{BETWEENNESS_EPSILON} with {1 - BETWEENNESS_DELTA:.0%} confidence).*\n\n")
+        yield 'centrality', section, ''.join(md)
+
+    # Recommendations
+    recommendations = []
+    if len(roots) > 1:
+        recommendations.append("⚠️ **Connect disconnected components**: Add dependencies to link separate subgraphs")
+    if len(orphaned) > 50:
+        recommendations.append(f"⚠️ **Many orphaned nodes** ({len(orphaned)}): Consider if these should be prerequisites for advanced concepts")
+    if is_dag:
+        recommendations.append("✅ **DAG structure verified**: Graph supports valid learning progressions")
+    if max_chain_length > 15:
+        recommendations.append(f"ℹ️ **Long dependency chains** ({max_chain_length}): Ensure students can follow extended learning paths")
+    if avg_deps < 1.5:
+        recommendations.append("ℹ️ **Consider adding cross-dependencies**: More connections could create richer learning pathways")
+
+    md = ["## Recommendations\n\n"]
+    md.extend(f"- {recommendation}\n" for recommendation in recommendations)
+    md.append("\n---\n\n")
+    md.append("*Report generated by learning-graph-reports/analyze_graph.py*\n")
+    yield 'recommendations', {'recommendations': recommendations}, ''.join(md)
+
+
+def _cap(items: List, limit: Optional[int]) -> List:
+    return items if limit is None else items[:limit]
+
+
+def _more(items: List, limit: Optional[int], noun: str = '') -> str:
+    """The "...and N more" line after a capped listing, or ''."""
+    if limit is None or len(items) <= limit:
+        return ''
+    return f"\n*...and {len(items) - limit} more{' ' + noun if noun else ''}*\n"
+
+
+def generate_report(csv_path: str, output_path: str, json_path: Optional[str] = None,
+                    ndjson_path: Optional[str] = None, full_listings: bool = False,
+                    max_rows: int = TABLE_ROWS, graph: Optional[LearningGraph] = None):
+    """
+    Generate comprehensive quality metrics report.
+
+    Each section is written (and flushed) as soon as it is computed.
+
+    Args:
+        csv_path: Learning-graph CSV
+        output_path: Markdown report
+        json_path: Also write every section's metrics as one JSON document
+        ndjson_path: Also stream the metrics as one JSON line per section
+        full_listings: List every orphan, component member, cycle,
+                       self-dependency and foundational concept instead
+                       of the first max_rows
+        max_rows: Cap for listings when full_listings is off
+        graph: Already loaded graph for csv_path (skips loading it again)
+    """
+    if graph is None:
+        graph = load_graph(csv_path)
+    summary = {'source': csv_path}
+
+    with contextlib.ExitStack() as stack:
+        f = stack.enter_context(open(output_path, 'w', encoding='utf-8'))
+        ndjson = stack.enter_context(open(ndjson_path, 'w', encoding='utf-8')) if ndjson_path else None
+
+        for section, metrics, markdown in report_sections(graph, output_path, full_listings, max_rows):
+            f.write(markdown)
+            f.flush()
+            summary[section] = metrics
+            if ndjson:
+                ndjson.write(json.dumps({'section': section, **metrics}, ensure_ascii=False) + '\n')
+                ndjson.flush()
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        print(f"✅ Quality metrics JSON generated: {json_path}")
+    if ndjson_path:
+        print(f"✅ Quality metrics NDJSON generated: {ndjson_path}")
+
+    print(f"✅ Quality metrics report generated: {output_path}")
+    return (summary['validation']['is_dag'], summary['foundational']['count'],
+            summary['orphans']['count'], summary['chains']['max_chain_length'])
 
-        f.write("## Orphaned Nodes Analysis\n\n")
-        f.write(f"- **Total Orphaned Nodes**: {len(orphaned)}\n\n")
-        if orphaned:
-            f.write("Concepts that are not prerequisites for any other concept:\n\n")
-            for cid, label in orphaned[:20]:  # Show first 20
-                f.write(f"- **{cid}**: {label}\n")
-            if len(orphaned) > 20:
-                f.write(f"\n*...and {len(orphaned) - 20} more*\n")
-        else:
-            f.write("✅ No orphaned nodes detected.\n")
-        f.write("\n")
 
-        f.write("## Connected Components\n\n")
-        f.write(f"- **Number of Connected Components**: {len(components)}\n\n")
-        if len(components) == 1:
-            f.write("✅ All concepts are connected in a single graph.\n\n")
+def find_learning_graphs(sources: List[str]) -> List[Path]:
+    """
+    Expand batch sources into learning-graph CSV paths.
+
+    A directory is searched recursively for learning-graph.csv files (the
+    name every course repository uses); anything else is treated as a glob.
+    """
+    found = set()
+    for source in sources:
+        if os.path.isdir(source):
+            found.update(Path(source).rglob('learning-graph.csv'))
         else:
-            f.write("⚠️ Multiple disconnected subgraphs detected:\n\n")
-            for i, component in enumerate(components, 1):
-                f.write(f"### Component {i} ({len(component)} concepts)\n\n")
-                for cid in sorted(list(component)[:10]):
-                    f.write(f"- {concepts[cid]}\n")
-                if len(component) > 10:
-                    f.write(f"- *...and {len(component) - 10} more*\n")
-                f.write("\n")
-
-        f.write("## Indegree Analysis\n\n")
-        f.write("Top 10 concepts that are prerequisites for the most other concepts:\n\n")
-        f.write("| Rank | Concept ID | Concept Label | Indegree |\n")
-        f.write("|------|-----------|---------------|----------|\n")
-        for i, (cid, label, ind) in enumerate(top_indegree, 1):
-            f.write(f"| {i} | {cid} | {label} | {ind} |\n")
-        f.write("\n")
+            found.update(Path(match) for match in glob.glob(source, recursive=True)
+                         if match.endswith('.csv'))
+    return sorted(path.resolve() for path in found)
+
+
+def report_names(csv_paths: List[Path]) -> List[str]:
+    """
+    Give each graph a short unique name for its report directory.
+
+    Names come from the path relative to the common parent directory, with
+    the generic learning-graph/docs parts dropped, so
+    courses/algebra/docs/learning-graph/learning-graph.csv becomes "algebra".
+    """
+    if not csv_paths:
+        return []
+    root = Path(os.path.commonpath([path.parent for path in csv_paths]))
+    names = []
+    seen: Dict[str, int] = defaultdict(int)
+    for path in csv_paths:
+        parts = list(path.relative_to(root).with_suffix('').parts)
+        while len(parts) > 1 and parts[-1] in ('learning-graph', 'docs'):
+            parts.pop()
+        name = '-'.join(parts) or path.stem
+        seen[name] += 1
+        names.append(name if seen[name] == 1 else f"{name}-{seen[name]}")
+    return names
+
+
+def analyze_one(csv_path: str, output_path: str) -> Dict:
+    """
+    Generate one report in a batch and return its summary row.
+
+    Runs in a worker process; the report's console output is discarded
+    and failures are returned as an error message instead of raised.  The
+    metrics JSON is written next to the report.
+    """
+    summary = {'csv': csv_path, 'report': output_path, 'error': None}
+    start = time.perf_counter()
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        json_path = str(Path(output_path).with_suffix('.json'))
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_report(csv_path, output_path, json_path=json_path)
+        with open(json_path, 'r', encoding='utf-8') as f:
+            metrics = json.load(f)
+        summary.update(concepts=metrics['overview']['concepts'],
+                       dependencies=metrics['overview']['dependencies'],
+                       is_dag=metrics['validation']['is_dag'],
+                       cycles=metrics['validation']['cycle_count'],
+                       foundational=metrics['foundational']['count'],
+                       orphaned=metrics['orphans']['count'],
+                       max_chain=metrics['chains']['max_chain_length'])
+    except Exception as e:
+        summary['error'] = f"{type(e).__name__}: {e}"
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def write_batch_summary(results: List[Dict], output_path: str):
+    """Write the cross-course summary table."""
+    succeeded = [r for r in results if r['error'] is None]
+    failed = [r for r in results if r['error'] is not None]
 
-        f.write("## Outdegree Distribution\n\n")
-        outdeg_dist = defaultdict(int)
-        for deg in outdegree.values():
-            outdeg_dist[deg] += 1
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("# Learning Graph Batch Summary\n\n")
+        f.write(f"- **Graphs Analyzed**: {len(succeeded)}\n")
+        f.write(f"- **Valid DAGs**: {sum(1 for r in succeeded if r['is_dag'])}\n")
+        f.write(f"- **Total Concepts**: {sum(r['concepts'] for r in succeeded)}\n")
+        f.write(f"- **Total Dependencies**: {sum(r['dependencies'] for r in succeeded)}\n")
+        if failed:
+            f.write(f"- **Failed**: {len(failed)} ❌\n")
+        f.write("\n")
 
-        f.write("| Dependencies | Number of Concepts |\n")
-        f.write("|--------------|--------------------|\n")
-        for deg in sorted(outdeg_dist.keys()):
-            f.write(f"| {deg} | {outdeg_dist[deg]} |\n")
+        f.write("| Course | Concepts | Dependencies | Valid DAG | Cycles | Max Chain | "
+                "Foundational | Orphaned | Time (s) |\n")
+        f.write("|--------|----------|--------------|-----------|--------|-----------|"
+                "--------------|----------|----------|\n")
+        for r in succeeded:
+            report = os.path.relpath(r['report'], os.path.dirname(output_path))
+            f.write(f"| [{r['name']}]({report}) | {r['concepts']} | {r['dependencies']} | "
+                    f"{'✅' if r['is_dag'] else '❌'} | {r['cycles']} | {r['max_chain']} | "
+                    f"{r['foundational']} | {r['orphaned']} | {r['seconds']:.2f} |\n")
         f.write("\n")
 
-        f.write("## Recommendations\n\n")
-        if len(components) > 1:
-            f.write("- ⚠️ **Connect disconnected components**: Add dependencies to link separate subgraphs\n")
-        if len(orphaned) > 50:
-            f.write(f"- ⚠️ **Many orphaned nodes** ({len(orphaned)}): Consider if these should be prerequisites for advanced concepts\n")
-        if is_dag:
-            f.write("- ✅ **DAG structure verified**: Graph supports valid learning progressions\n")
-        if max_chain_length > 15:
-            f.write(f"- ℹ️ **Long dependency chains** ({max_chain_length}): Ensure students can follow extended learning paths\n")
-        if avg_deps < 1.5:
-            f.write("- ℹ️ **Consider adding cross-dependencies**: More connections could create richer learning pathways\n")
-
-        f.write("\n---\n\n")
-        f.write("*Report generated by learning-graph-reports/analyze_graph.py*\n")
+        if failed:
+            f.write("## Failed Graphs\n\n")
+            for r in failed:
+                f.write(f"- **{r['name']}** (`{r['csv']}`): {r['error']}\n")
+            f.write("\n")
 
-    print(f"✅ Quality metrics report generated: {output_path}")
-    return is_dag, len(foundational), len(orphaned), max_chain_length
+        f.write("---\n\n")
+        f.write("*Report generated by learning-graph-reports/analyze_graph.py --batch*\n")
+
+
+def generate_batch_reports(sources: List[str], output_dir: str,
+                           workers: Optional[int] = None) -> List[Dict]:
+    """
+    Analyze many learning graphs in parallel worker processes.
+
+    Each graph's report (with its metrics JSON and concept metrics table)
+    is written to <output_dir>/<name>/quality-metrics.md and the cross-course summary to
+    <output_dir>/learning-graph-summary.md.
+
+    Args:
+        sources: Directories and/or glob patterns of learning-graph CSVs
+        output_dir: Directory for the reports
+        workers: Worker process count (default: one per CPU)
+
+    Returns:
+        One summary row per graph, in name order
+    """
+    csv_paths = find_learning_graphs(sources)
+    if not csv_paths:
+        print(f"⚠️  No learning-graph CSVs found in: {' '.join(sources)}")
+        return []
+
+    names = report_names(csv_paths)
+    jobs = {name: (str(path), os.path.join(output_dir, name, 'quality-metrics.md'))
+            for name, path in zip(names, csv_paths)}
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    print(f"Analyzing {len(jobs)} learning graphs with {workers} worker process(es)...")
+
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        completed = ((name, analyze_one(*job)) for name, job in jobs.items())
+        for name, result in completed:
+            results.append(dict(result, name=name))
+            _print_batch_result(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(analyze_one, *job): name for name, job in jobs.items()}
+            for future in as_completed(futures):
+                results.append(dict(future.result(), name=futures[future]))
+                _print_batch_result(results[-1])
+
+    results.sort(key=lambda r: r['name'])
+    os.makedirs(output_dir, exist_ok=True)
+    summary_path = os.path.join(output_dir, 'learning-graph-summary.md')
+    write_batch_summary(results, summary_path)
+    print(f"✅ Batch summary generated: {summary_path} "
+          f"({time.perf_counter() - start:.1f} s)")
+    return results
+
+
+def _pop_option(args: List[str], name: str, flag: bool = False):
+    """Remove --name [value] from an argument list and return the value (or True for flags)."""
+    if name not in args:
+        return False if flag else None
+    i = args.index(name)
+    if flag:
+        del args[i]
+        return True
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def _print_batch_result(result: Dict):
+    if result['error']:
+        print(f"❌ {result['name']}: {result['error']}")
+    else:
+        print(f"✅ {result['name']}: {result['concepts']} concepts, "
+              f"{'DAG' if result['is_dag'] else 'not a DAG'} ({result['seconds']:.2f} s)")
 
 
 if __name__ == "__main__":
     import sys
 
     # Parse command line arguments
-    if len(sys.argv) < 3:
-        print("Usage: python analyze-graph.py <input_csv> <output_report.md>")
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == '--batch':
+        workers = _pop_option(args, '--workers')
+        results = generate_batch_reports(args[2:], args[1], int(workers) if workers else None)
+        if not results or any(r['error'] for r in results):
+            sys.exit(1)
+        sys.exit(0)
+
+    json_path = _pop_option(args, '--json')
+    ndjson_path = _pop_option(args, '--ndjson')
+    full_listings = _pop_option(args, '--full-listings', flag=True)
+    max_rows = _pop_option(args, '--max-rows')
+
+    if len(args) < 2:
+        print("Usage: python analyze-graph.py <input_csv> <output_report.md> [--json metrics.json]")
+        print("                               [--ndjson metrics.ndjson] [--full-listings] [--max-rows N]")
+        print("       python analyze-graph.py --batch <output_dir> <csv_dir_or_glob> [...] [--workers N]")
         print("\nExample:")
-        print("  python analyze-graph.py learning-graph.csv quality-metrics.md")
+        print("  python analyze-graph.py learning-graph.csv quality-metrics.md --json quality-metrics.json")
+        print("  python analyze-graph.py --batch reports ~/courses")
         sys.exit(1)
 
-    csv_path = sys.argv[1]
-    output_path = sys.argv[2]
+    csv_path = args[0]
+    output_path = args[1]
 
-    generate_report(csv_path, output_path)
+    generate_report(csv_path, output_path, json_path, ndjson_path, full_listings,
+                    int(max_rows) if max_rows else TABLE_ROWS)
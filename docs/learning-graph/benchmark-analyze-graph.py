@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark analyze-graph.py on synthetic learning graphs
+
+Times the CSR-indexed analyses in analyze-graph.py against the original
+dependency-list scans at 1k, 100k and 1M edges.  The legacy scans are
+O(V*E), so they are skipped once a graph is too large to finish in
+reasonable time.  The graphs come from the generator in
+benchmark-learning-graph.py, so both benchmarks measure the same shape.
+
+Usage: python benchmark-analyze-graph.py [edge_count ...]
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+SIZES = [1_000, 100_000, 1_000_000]
+# Skip the legacy scans when V*E exceeds this many inner-loop steps
+LEGACY_BUDGET = 50_000_000
+
+
+def load_benchmark_suite():
+    """Import benchmark-learning-graph.py, which owns the synthetic graph generator."""
+    path = Path(__file__).with_name('benchmark-learning-graph.py')
+    spec = importlib.util.spec_from_file_location('benchmark_learning_graph', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_synthetic_csv(suite, csv_path: str, edge_count: int, seed: int = 42):
+    """
+    Write a synthetic graph of about edge_count dependencies.
+
+    The graph comes from the benchmark suite's generator; the concept count
+    is derived from its expected number of prerequisites per concept.
+    """
+    mean = (1 - suite.FOUNDATIONAL_RATE) * sum(count * weight
+                                               for count, weight in suite.PREREQ_WEIGHTS)
+    return suite.generate_learning_graph(csv_path, max(2, round(edge_count / mean)), seed=seed)
+
+
+def legacy_analyses(concepts, dependencies):
+    """The original dependency-list scans from analyze-graph.py."""
+    indeg = {cid: 0 for cid in concepts}
+    for prereqs in dependencies.values():
+        for prereq in prereqs:
+            indeg[prereq] += 1
+    queue = deque(cid for cid in concepts if indeg[cid] == 0)
+    while queue:
+        node = queue.popleft()
+        for concept_id, prereqs in dependencies.items():
+            if node in prereqs:
+                indeg[concept_id] -= 1
+                if indeg[concept_id] == 0:
+                    queue.append(concept_id)
+
+    visited = set()
+    for start in concepts:
+        if start in visited:
+            continue
+        visited.add(start)
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for prereq in dependencies.get(node, []):
+                if prereq not in visited:
+                    visited.add(prereq)
+                    queue.append(prereq)
+            for concept_id, prereqs in dependencies.items():
+                if node in prereqs and concept_id not in visited:
+                    visited.add(concept_id)
+                    queue.append(concept_id)
+
+
+def csr_analyses(analyze_graph, graph):
+    """The CSR-indexed analyses used by generate_report."""
+    indegree = analyze_graph.calculate_indegree(graph)
+    analyze_graph.calculate_outdegree(graph)
+    analyze_graph.find_orphaned_nodes(graph, indegree)
+    analyze_graph.verify_dag(graph)
+    analyze_graph.find_longest_chain(graph)
+    analyze_graph.find_connected_components(graph)
+
+
+def main():
+    import sys
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    suite = load_benchmark_suite()
+    analyze_graph = suite.load_script('analyze-graph.py')
+
+    print("| Edges | Concepts | Load (s) | CSR analyses (s) | Legacy scans (s) | Speedup |")
+    print("|-------|----------|----------|------------------|------------------|---------|")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for edge_count in sizes:
+            csv_path = os.path.join(tmp, f'graph-{edge_count}.csv')
+            node_count, written = write_synthetic_csv(suite, csv_path, edge_count)
+
+            start = time.perf_counter()
+            graph = analyze_graph.load_graph(csv_path, use_cache=False)
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            csr_analyses(analyze_graph, graph)
+            csr_time = time.perf_counter() - start
+
+            if node_count * written <= LEGACY_BUDGET:
+                concepts, dependencies = graph.concepts, graph.dependencies
+                start = time.perf_counter()
+                legacy_analyses(concepts, dependencies)
+                legacy_time = time.perf_counter() - start
+                legacy = f"{legacy_time:.3f}"
+                speedup = f"{legacy_time / csr_time:.0f}x"
+            else:
+                legacy = "skipped"
+                speedup = "-"
+
+            print(f"| {written:,} | {node_count:,} | {load_time:.3f} | {csr_time:.3f} "
+                  f"| {legacy} | {speedup} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Script Benchmark Suite
+
+Generates seeded synthetic learning-graph CSVs and times the public
+functions of analyze-graph.py, csv-to-json.py and validate-learning-graph.py
+on each of them, recording wall time and peak traced memory.
+
+Synthetic graphs mimic real course graphs:
+- about 5% foundational concepts and 1-4 prerequisites per concept
+- fan-in follows preferential attachment, so a few hub concepts are
+  prerequisites for many others
+- most prerequisites are drawn from recent concepts, which builds long
+  dependency chains
+- concepts are grouped into contiguous taxonomy blocks
+- optional injected cycles exercise the cycle reporting paths
+
+Results can be saved as a baseline; later runs fail (exit code 1) when a
+function is slower or uses more memory than the baseline by more than the
+tolerance.  benchmark-baseline.json holds the committed baseline; timings
+depend on the machine, so re-save it (--save-baseline) when the reference
+machine changes.
+
+Usage: python benchmark-learning-graph.py [--sizes N ...] [--cycles N] [--seed N]
+                                          [--schema schema.json] [--baseline file.json]
+                                          [--save-baseline] [--tolerance 0.25]
+                                          [--repeat 3] [--no-memory]
+"""
+
+import argparse
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_BASELINE = SCRIPT_DIR / 'benchmark-baseline.json'
+DEFAULT_SCHEMA = SCRIPT_DIR / 'learning-graph-schema.json'
+
+TAXONOMY_GROUPS = ['FOUND', 'DEF', 'CORE', 'INTER', 'ADV', 'APPL', 'SPEC', 'PROJ', 'CAP', 'MISC']
+FOUNDATIONAL_RATE = 0.05
+PREREQ_WEIGHTS = [(1, 0.5), (2, 0.3), (3, 0.15), (4, 0.05)]
+LOCAL_RATE = 0.6       # share of prerequisites drawn from recent concepts
+LOCAL_WINDOW = 50      # how far back "recent" reaches
+
+# Timing differences below this are treated as noise, never as regressions
+MIN_SECONDS = 0.01
+
+
+def load_script(filename: str):
+    """Import one of the hyphen-named scripts in this directory as a module."""
+    path = SCRIPT_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_learning_graph(csv_path: str, concept_count: int, cycles: int = 0, seed: int = 42):
+    """
+    Write a synthetic learning-graph CSV.
+
+    Args:
+        csv_path: Output path
+        concept_count: Number of concepts
+        cycles: Number of back edges to inject, each closing a cycle
+        seed: Random seed, so the same arguments always give the same file
+
+    Returns:
+        (concept_count, edge_count)
+    """
+    rng = random.Random(seed)
+    counts, weights = zip(*PREREQ_WEIGHTS)
+    dependencies: List[List[int]] = [[] for _ in range(concept_count + 1)]
+    # Each concept appears once plus once per dependent (preferential attachment)
+    attachment_pool: List[int] = []
+
+    for cid in range(1, concept_count + 1):
+        if cid > 1 and rng.random() >= FOUNDATIONAL_RATE:
+            wanted = min(rng.choices(counts, weights)[0], cid - 1)
+            chosen = set()
+            while len(chosen) < wanted:
+                if rng.random() < LOCAL_RATE:
+                    chosen.add(rng.randint(max(1, cid - LOCAL_WINDOW), cid - 1))
+                else:
+                    chosen.add(rng.choice(attachment_pool))
+            dependencies[cid] = sorted(chosen)
+            attachment_pool.extend(chosen)
+        attachment_pool.append(cid)
+
+    # A back edge from a prerequisite to its dependent closes a cycle
+    candidates = [cid for cid in range(2, concept_count + 1) if dependencies[cid]]
+    for cid in rng.sample(candidates, min(cycles, len(candidates))):
+        prereq = rng.choice(dependencies[cid])
+        if cid not in dependencies[prereq]:
+            dependencies[prereq].append(cid)
+
+    block = max(1, concept_count // len(TAXONOMY_GROUPS))
+    edge_count = 0
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ConceptID', 'ConceptLabel', 'Dependencies', 'TaxonomyID'])
+        for cid in range(1, concept_count + 1):
+            group = TAXONOMY_GROUPS[min((cid - 1) // block, len(TAXONOMY_GROUPS) - 1)]
+            edge_count += len(dependencies[cid])
+            writer.writerow([cid, f'Concept {cid}', '|'.join(map(str, dependencies[cid])), group])
+
+    return concept_count, edge_count
+
+
+def benchmark_cases(work_dir: str, csv_path: str, schema_path: str) -> List[Tuple[str, Callable]]:
+    """
+    Build (name, zero-argument callable) pairs for every benchmarked function.
+
+    Functions that take a graph get a fresh copy sharing the parsed arrays,
+    so cached derived results from one case never speed up another.
+    """
+    analyze_graph = load_script('analyze-graph.py')
+    csv_to_json = load_script('csv-to-json.py')
+    graph = analyze_graph.load_graph(csv_path, use_cache=False)
+    indegree = analyze_graph.calculate_indegree(graph)
+    json_path = os.path.join(work_dir, 'learning-graph.json')
+
+    def fresh():
+        return type(graph).from_arrays(graph.ids, graph.labels, graph.taxonomies,
+                                       graph.prereq_offsets, graph.prereq_targets,
+                                       graph.dependent_offsets, graph.dependent_targets)
+
+    def on_graph(function, *args):
+        return lambda: function(fresh(), *args)
+
+    cases = [
+        ('analyze-graph.load_graph', lambda: analyze_graph.load_graph(csv_path, use_cache=False)),
+        ('analyze-graph.calculate_indegree', on_graph(analyze_graph.calculate_indegree)),
+        ('analyze-graph.calculate_outdegree', on_graph(analyze_graph.calculate_outdegree)),
+        ('analyze-graph.find_orphaned_nodes', on_graph(analyze_graph.find_orphaned_nodes, indegree)),
+        ('analyze-graph.verify_dag', on_graph(analyze_graph.verify_dag)),
+        ('analyze-graph.find_cycles', on_graph(analyze_graph.find_cycles)),
+        ('analyze-graph.find_longest_chain', on_graph(analyze_graph.find_longest_chain)),
+        ('analyze-graph.find_top_chains', on_graph(analyze_graph.find_top_chains)),
+        ('analyze-graph.find_connected_components', on_graph(analyze_graph.find_connected_components)),
+        ('analyze-graph.summarize_components', lambda: analyze_graph.summarize_components(csv_path)),
+        ('analyze-graph.generate_report',
+         lambda: analyze_graph.generate_report(csv_path, os.path.join(work_dir, 'quality-metrics.md'))),
+        ('csv-to-json.csv_to_json', lambda: csv_to_json.csv_to_json(csv_path, json_path)),
+    ]
+
+    if schema_path:
+        validator = load_script('validate-learning-graph.py')
+        cases.append(('validate-learning-graph.validate_learning_graph',
+                      lambda: validator.validate_learning_graph(json_path, schema_path)))
+
+    return cases
+
+
+def measure(function: Callable, cache_dir: str, trace_memory: bool) -> Tuple[float, int]:
+    """Run a function once with an empty graph cache; return (seconds, peak bytes)."""
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            function()
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+            if trace_memory:
+                tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_suite(sizes: List[int], cycles: int, seed: int, schema_path: str,
+              trace_memory: bool, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Benchmark every function at every size; returns {"<size>/<function>": result}."""
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_dir = os.path.join(work_dir, 'cache')
+        os.environ['LEARNING_GRAPH_CACHE_DIR'] = cache_dir
+
+        for size in sizes:
+            csv_path = os.path.join(work_dir, f'learning-graph-{size}.csv')
+            concepts, edges = generate_learning_graph(csv_path, size, cycles, seed)
+            print(f"\n## {concepts:,} concepts, {edges:,} dependencies\n")
+            print("| Function | Time (s) | Peak Memory (MB) |")
+            print("|----------|----------|------------------|")
+
+            # csv_to_json runs before the validator so the JSON exists
+            for name, function in benchmark_cases(work_dir, csv_path, schema_path):
+                seconds = min(measure(function, cache_dir, trace_memory=False)[0]
+                              for _ in range(repeat))
+                peak = measure(function, cache_dir, trace_memory=True)[1] if trace_memory else 0
+                results[f"{size}/{name}"] = {'seconds': seconds, 'peak_bytes': peak}
+                memory = f"{peak / 1e6:.1f}" if trace_memory else "-"
+                print(f"| {name} | {seconds:.3f} | {memory} |")
+
+    return results
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                     tolerance: float) -> List[str]:
+    """Describe every result that exceeds its baseline by more than the tolerance."""
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            limit = reference[metric] * (1 + tolerance)
+            if metric == 'seconds':
+                limit = max(limit, reference[metric] + MIN_SECONDS)
+            if reference[metric] and result[metric] > limit:
+                regressions.append(f"{key} {metric}: {result[metric]:.4g} "
+                                   f"(baseline {reference[metric]:.4g})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the learning-graph scripts on synthetic graphs.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="concept counts to generate (default: 1000 10000 100000)")
+    parser.add_argument('--cycles', type=int, default=0, help="number of cycles to inject")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--schema', default=str(DEFAULT_SCHEMA) if DEFAULT_SCHEMA.exists() else None,
+                        help="learning-graph schema; validation is skipped without one")
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown or memory growth over the baseline (default 0.25)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timing runs per function; the fastest is kept (default 3)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    if not args.schema:
+        print("ℹ️  No schema found; skipping validate-learning-graph.py (use --schema)")
+
+    results = run_suite(args.sizes, args.cycles, args.seed, args.schema,
+                        not args.no_memory, args.repeat)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Baseline saved: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Build Pipeline
+
+Incremental, make-like build of the learning-graph artifacts.  Every
+stage declares its input files, its output files and the scripts that
+implement it:
+
+    stage           script                       inputs                    outputs
+    analyze         analyze-graph.py             CSV                       quality-metrics.md,
+                                                                           concept-metrics.csv
+    json            csv-to-json.py               CSV, color-config.json,   learning-graph.json
+                                                 metadata.json
+    taxonomy        taxonomy-distribution.py     CSV                       taxonomy-distribution.md
+    quality         analyze-concept-quality.py   CSV                       (printed)
+    glossary        generate-glossary.py         CSV                       ../glossary.md
+    terms           find-missing-terms.py        CSV, ../glossary.md       (printed)
+    glossary-report generate-quality-report.py   ../glossary.md            glossary-quality-report.md
+
+A stage's fingerprint is the SHA-256 of its inputs' and scripts'
+contents.  Fingerprints of successful runs are kept in
+.learning-graph-build.json next to the CSV, and a stage is skipped when
+its fingerprint is unchanged and its outputs exist.  A stage that reads
+another stage's output waits for it; independent stages run in parallel
+worker processes.  The CSV is parsed at most once: workers memory-map
+the parsed-graph cache, and with --workers 1 (the default on a single
+CPU) every stage runs in this process against the same LearningGraph.
+
+The glossary stage only runs when named in --stages: the published
+glossary is edited by hand after generation, and regenerating it would
+overwrite those edits.  The json stage is safe to run by default because
+the curated group names and font colors live in color-config.json as full
+group entries, which csv-to-json.py writes unchanged.
+
+Only the analyze and json stages need the parsed LearningGraph.  When the
+CSV cannot be parsed (a duplicate ConceptID or a dependency on an unknown
+concept) those two stages fail with the parse error, and the other stages
+still run from the CSV rows.
+
+Usage: python build-learning-graph.py [input_csv] [--stages analyze,json,...]
+                                      [--force] [--workers N] [--quiet]
+"""
+
+import contextlib
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from graph_cache import file_digest, load_graph_cached
+from learning_graph import LearningGraph
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+STATE_FILE = '.learning-graph-build.json'
+
+# Modules every stage loads the graph through
+LIBRARY_SCRIPTS = ['learning_graph.py', 'graph_cache.py']
+
+
+def load_script(filename: str):
+    """Import one of the hyphen-named scripts in this directory as a module."""
+    path = SCRIPT_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _optional_json(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_analyze(graph: LearningGraph, csv_path: Path):
+    load_script('analyze-graph.py').generate_report(
+        str(csv_path), str(csv_path.with_name('quality-metrics.md')), graph=graph)
+
+
+def run_json(graph: LearningGraph, csv_path: Path):
+    load_script('csv-to-json.py').csv_to_json(
+        str(csv_path), str(csv_path.with_name('learning-graph.json')),
+        _optional_json(csv_path.with_name('color-config.json')),
+        _optional_json(csv_path.with_name('metadata.json')), graph=graph)
+
+
+def run_taxonomy(graph: LearningGraph, csv_path: Path):
+    load_script('taxonomy-distribution.py').analyze_taxonomy_distribution(
+        str(csv_path), str(csv_path.with_name('taxonomy-distribution.md')), graph=graph)
+
+
+def run_quality(graph: LearningGraph, csv_path: Path):
+    quality = load_script('analyze-concept-quality.py')
+    quality.print_quality_report(quality.analyze_concepts(str(csv_path), graph))
+
+
+def run_glossary(graph: LearningGraph, csv_path: Path):
+    load_script('generate-glossary.py').generate_glossary(
+        str(csv_path), str(csv_path.parent.parent / 'glossary.md'), graph)
+
+
+def run_terms(graph: LearningGraph, csv_path: Path):
+    load_script('find-missing-terms.py').find_missing_terms(
+        str(csv_path), str(csv_path.parent.parent / 'glossary.md'), graph)
+
+
+def run_glossary_report(graph: LearningGraph, csv_path: Path):
+    load_script('generate-quality-report.py').write_quality_report(
+        str(csv_path.parent.parent / 'glossary.md'),
+        str(csv_path.with_name('glossary-quality-report.md')))
+
+
+# Stages in build order.  Paths are relative to the CSV's directory, and
+# 'CSV' stands for the input CSV itself.
+# 'graph' marks the stages that need the parsed LearningGraph; the others
+# are passed None when the CSV cannot be parsed and read its rows instead.
+STAGES = [
+    {'name': 'analyze', 'run': run_analyze, 'graph': True,
+     'scripts': ['analyze-graph.py', 'graph_metrics.py'],
+     'inputs': ['CSV'], 'outputs': ['quality-metrics.md', 'concept-metrics.csv']},
+    {'name': 'json', 'run': run_json, 'graph': True,
+     'scripts': ['csv-to-json.py'],
+     'inputs': ['CSV', 'color-config.json', 'metadata.json'], 'outputs': ['learning-graph.json']},
+    {'name': 'taxonomy', 'run': run_taxonomy, 'graph': False,
+     'scripts': ['taxonomy-distribution.py'],
+     'inputs': ['CSV'], 'outputs': ['taxonomy-distribution.md']},
+    {'name': 'quality', 'run': run_quality, 'graph': False,
+     'scripts': ['analyze-concept-quality.py'],
+     'inputs': ['CSV'], 'outputs': []},
+    {'name': 'glossary', 'run': run_glossary, 'graph': False,
+     'scripts': ['generate-glossary.py'],
+     'inputs': ['CSV'], 'outputs': ['../glossary.md']},
+    {'name': 'terms', 'run': run_terms, 'graph': False,
+     'scripts': ['find-missing-terms.py'],
+     'inputs': ['CSV', '../glossary.md'], 'outputs': []},
+    {'name': 'glossary-report', 'run': run_glossary_report, 'graph': False,
+     'scripts': ['generate-quality-report.py'],
+     'inputs': ['../glossary.md'], 'outputs': ['glossary-quality-report.md']},
+]
+STAGE_BY_NAME = {stage['name']: stage for stage in STAGES}
+
+# Stages run when none are named
+DEFAULT_STAGES = [stage['name'] for stage in STAGES if stage['name'] != 'glossary']
+
+
+def _resolve(csv_path: Path, name: str) -> Path:
+    return csv_path if name == 'CSV' else (csv_path.parent / name).resolve()
+
+
+def stage_fingerprint(stage: Dict, csv_path: Path, digests: Dict[Path, str]) -> str:
+    """SHA-256 over the contents of a stage's scripts and input files."""
+    fingerprint = hashlib.sha256(stage['name'].encode('utf-8'))
+    files = [('script', SCRIPT_DIR / name) for name in LIBRARY_SCRIPTS + stage['scripts']]
+    files += [('input', _resolve(csv_path, name)) for name in stage['inputs']]
+    for kind, path in files:
+        if path not in digests:
+            digests[path] = file_digest(str(path)) if path.exists() else 'missing'
+        fingerprint.update(f"{kind}:{path.name}:{digests[path]}\n".encode('utf-8'))
+    return fingerprint.hexdigest()
+
+
+def _read_state(state_path: Path) -> Dict[str, str]:
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(state_path: Path, state: Dict[str, str]):
+    fd, tmp_path = tempfile.mkstemp(dir=state_path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def _run_stage(name: str, csv_path: Path, graph: Optional[LearningGraph] = None,
+               quiet: bool = False, load_graph: bool = True) -> Tuple[float, Optional[str], str]:
+    """
+    Run one stage, capturing its console output.
+
+    In a worker process the graph is memory-mapped from the cache, unless
+    load_graph is False because the CSV could not be parsed.
+
+    Returns:
+        (seconds, error or None, captured output)
+    """
+    output = io.StringIO()
+    start = time.perf_counter()
+    error = None
+    try:
+        with contextlib.redirect_stdout(output):
+            if graph is None and load_graph:
+                graph = load_graph_cached(str(csv_path))
+            STAGE_BY_NAME[name]['run'](graph, csv_path)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return time.perf_counter() - start, error, '' if quiet else output.getvalue()
+
+
+def build(csv_path: str, stages: Optional[Sequence[str]] = None, force: bool = False,
+          workers: Optional[int] = None, quiet: bool = False) -> List[Tuple[str, str, float, Optional[str]]]:
+    """
+    Bring the selected stages' outputs up to date.
+
+    Args:
+        csv_path: Learning-graph CSV; outputs are written relative to it
+        stages: Stage names to build, in any order (default: DEFAULT_STAGES)
+        force: Run every selected stage even if its inputs are unchanged
+        workers: Parallel worker processes (default: CPU count); with 1 the
+                 stages run in this process against one shared LearningGraph
+        quiet: Do not print the stages' own console output
+
+    Returns:
+        [(stage, 'ran' | 'skipped' | 'failed', seconds, error or None), ...]
+    """
+    selected = list(stages or DEFAULT_STAGES)
+    workers = workers or os.cpu_count() or 1
+    unknown = set(selected) - set(STAGE_BY_NAME)
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+    selected = [stage['name'] for stage in STAGES if stage['name'] in selected]
+
+    path = Path(csv_path).resolve()
+    state_path = path.with_name(STATE_FILE)
+    state = _read_state(state_path)
+    digests: Dict[Path, str] = {}
+
+    # A stage waits for every selected stage that writes one of its inputs
+    producers = {_resolve(path, output): stage['name']
+                 for stage in STAGES if stage['name'] in selected for output in stage['outputs']}
+    waits_for = {name: {producers[_resolve(path, input_name)]
+                        for input_name in STAGE_BY_NAME[name]['inputs']
+                        if _resolve(path, input_name) in producers} - {name}
+                 for name in selected}
+
+    results: Dict[str, Tuple[str, float, Optional[str]]] = {}
+    fingerprints: Dict[str, str] = {}
+    graph = None
+    graph_loaded = False
+    load_error = None
+    pool = None
+    running = {}
+    pending = list(selected)
+
+    def up_to_date(name: str) -> bool:
+        stage = STAGE_BY_NAME[name]
+        fingerprints[name] = stage_fingerprint(stage, path, digests)
+        return (not force and state.get(name) == fingerprints[name]
+                and all(_resolve(path, output).exists() for output in stage['outputs']))
+
+    def load_graph():
+        """Parse (or map) the CSV once; on failure keep the error for the graph stages."""
+        nonlocal graph, graph_loaded, load_error
+        if not graph_loaded:
+            graph_loaded = True
+            try:
+                graph = load_graph_cached(str(path))
+            except Exception as e:
+                load_error = f"{type(e).__name__}: {e}"
+
+    def finish(name: str, seconds: float, error: Optional[str], output: str):
+        if output:
+            print(f"\n===== {name} =====")
+            print(output, end='')
+        if error:
+            results[name] = ('failed', seconds, error)
+            state.pop(name, None)
+        else:
+            results[name] = ('ran', seconds, None)
+            state[name] = fingerprints[name]
+        # Files this stage wrote must be hashed again by later stages
+        for output_name in STAGE_BY_NAME[name]['outputs']:
+            digests.pop(_resolve(path, output_name), None)
+
+    try:
+        while pending or running:
+            for name in list(pending):
+                if waits_for[name] & (set(pending) | set(running)):
+                    continue
+                pending.remove(name)
+                if any(results[dep][0] == 'failed' for dep in waits_for[name]):
+                    results[name] = ('failed', 0.0, 'an input stage failed')
+                    continue
+                if up_to_date(name):
+                    results[name] = ('skipped', 0.0, None)
+                    continue
+                # Parsed before the pool starts so every worker maps the cache
+                load_graph()
+                if load_error and STAGE_BY_NAME[name]['graph']:
+                    finish(name, 0.0, load_error, '')
+                    continue
+                if workers == 1:
+                    finish(name, *_run_stage(name, path, graph, quiet, load_error is None))
+                    continue
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                running[name] = pool.submit(_run_stage, name, path, None, quiet, load_error is None)
+
+            if running:
+                done, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+                for name in [name for name, future in running.items() if future in done]:
+                    finish(name, *running.pop(name).result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        _write_state(state_path, state)
+
+    return [(name, *results[name]) for name in selected]
+
+
+def run_pipeline(csv_path: str, stages: Optional[Sequence[str]] = None,
+                 quiet: bool = False) -> List[Tuple[str, str, float, Optional[str]]]:
+    """Run every selected stage in this process against one loaded graph."""
+    return build(csv_path, stages, force=True, workers=1, quiet=quiet)
+
+
+def print_results(csv_path: str, results: List[Tuple[str, str, float, Optional[str]]],
+                  elapsed: float):
+    icons = {'ran': '✅ ran', 'skipped': '⏭️  up to date', 'failed': '❌'}
+    print(f"\n📦 Build of {csv_path}:\n")
+    print("| Stage | Time (ms) | Status |")
+    print("|-------|-----------|--------|")
+    for name, status, seconds, error in results:
+        detail = f"{icons[status]} {error}" if error else icons[status]
+        print(f"| {name} | {seconds * 1000:.1f} | {detail} |")
+    ran = sum(1 for _, status, _, _ in results if status == 'ran')
+    print(f"\n{ran} of {len(results)} stages ran; total {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = sys.argv[1:]
+    quiet = '--quiet' in args
+    force = '--force' in args
+    args = [arg for arg in args if arg not in ('--quiet', '--force')]
+    options = {'--stages': None, '--workers': None}
+    for option in options:
+        if option in args:
+            i = args.index(option)
+            if i + 1 >= len(args):
+                args = ['--help']
+                break
+            options[option] = args[i + 1]
+            del args[i:i + 2]
+
+    if len(args) > 1 or (args and args[0].startswith('-')):
+        print("Usage: python build-learning-graph.py [input_csv] [--stages analyze,json,...]")
+        print("                                      [--force] [--workers N] [--quiet]")
+        print(f"\nStages: {', '.join(STAGE_BY_NAME)} (default: all but glossary)")
+        print("\nExample:")
+        print("  python build-learning-graph.py learning-graph.csv")
+        print("  python build-learning-graph.py learning-graph.csv --stages analyze,taxonomy --force")
+        print("  python build-learning-graph.py learning-graph.csv --stages glossary,terms,glossary-report")
+        sys.exit(1)
+
+    csv_path = args[0] if args else str(SCRIPT_DIR / 'learning-graph.csv')
+    stages = [name for name in options['--stages'].split(',') if name] if options['--stages'] else None
+    workers = int(options['--workers']) if options['--workers'] else None
+
+    start = time.perf_counter()
+    try:
+        results = build(csv_path, stages, force, workers, quiet)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print_results(csv_path, results, time.perf_counter() - start)
+    if any(status == 'failed' for _, status, _, _ in results):
+        sys.exit(1)
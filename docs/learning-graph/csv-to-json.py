@@ -3,15 +3,49 @@
 Convert CSV Learning Graph to JSON for vis-network.js
 Converts the concept dependency CSV into the JSON format
 used by the existing graph viewer (vis.js network format).
+
+Each node gets a topological "level" (longest distance from a
+foundational concept), so the viewer can use a hierarchical layout
+instead of running a physics simulation in the browser.
+
+With --layout (needs NumPy) each node also gets x/y coordinates from a
+layered layout computed at build time (see graph_layout.py), so the
+viewer can draw the graph as-is with physics off.
+
+With --compact the nodes and edges are streamed to the file with compact
+separators, and --compress adds precompressed .gz/.br siblings for the
+static site; the converter reports the bytes each format saves.
+
+With --binary a compact binary encoding (see graph_binary.py) is written
+next to the JSON as <stem>.lgbin and checked to round-trip to it.
+
+With --partition the output file becomes a small manifest: the nodes of
+each TaxonomyID group and the edges inside it go to their own chunk file
+next to it, edges between groups go to one cross-partition edge file, and
+the manifest lists every file with its counts, byte size and SHA-256 so a
+viewer can fetch only the groups it shows.
 """
 
-import csv
+import contextlib
+import hashlib
 import json
-from typing import Dict, List
+import os
+import re
+import tempfile
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
+from graph_cache import load_graph_cached
+
+# Nodes or edges encoded per write in compact mode
+STREAM_BATCH = 1000
 
-def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metadata: dict = None):
+
+def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metadata: dict = None,
+                compact: bool = False, compress: bool = False, layout: bool = False,
+                partition: bool = False, binary: bool = False, graph=None):
     """
     Convert CSV dependency graph to vis.js JSON format with metadata and groups.
 
@@ -19,9 +53,26 @@ def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metada
         csv_path: Path to input CSV file with columns: ConceptID, ConceptLabel, Dependencies, TaxonomyID
         json_path: Path to output JSON file
         color_config: Optional dictionary mapping taxonomy IDs to colors.
-                     If not provided, uses default color scheme.
+                     A value may also be a full group entry
+                     ({"classifierName", "color", "font"}), which is
+                     written as-is so curated names and font colors
+                     survive a rebuild.  If not provided, uses default
+                     color scheme.
         metadata: Optional dictionary with metadata fields (title, description, creator, etc.)
                  If not provided, creates minimal metadata.
+        compact: Stream nodes and edges to the file with compact separators
+                 instead of building the whole document and indenting it.
+                 The returned dict then holds only metadata and groups.
+        compress: Also write .gz and .br siblings of the output file
+        layout: Add x/y coordinates from a layered layout (needs NumPy)
+        partition: Write json_path as a manifest and the graph as one chunk
+                   per TaxonomyID plus a cross-partition edge file.
+                   The returned dict is then the manifest.
+        binary: Also write <stem>.lgbin in the binary typed-array format
+        graph: Already loaded LearningGraph for csv_path (skips loading it again)
+
+    Raises:
+        ValueError: the CSV has duplicate ConceptIDs or depends on unknown ones
     """
     # Default taxonomy group colors for visualization
     # Supports both text codes (FOUND, DEF, etc.) and numeric IDs (1, 2, etc.)
@@ -80,22 +131,26 @@ def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metada
         '10': 'Extended Topics',
     }
 
-    # Read CSV
-    nodes = []
-    edges = []
+    # Read CSV (through the parsed-graph cache)
     foundational_ids = []
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            concept_id = int(row['ConceptID'])
-            # Support both ConceptLabel and ConceptName column names
-            label = row.get('ConceptLabel') or row.get('ConceptName', '')
-            taxonomy = row['TaxonomyID']
-            dependencies_str = row['Dependencies']
-
+    if graph is None:
+        graph = load_graph_cached(csv_path)
+
+    # Topological level = longest chain length - 1, from one O(V+E) pass.
+    # Concepts on or behind a cycle have no level.
+    chain_heights, _ = graph.chain_heights()
+    unleveled = 0
+
+    positions = None
+    if layout:
+        positions = compute_layout(graph)
+    levels = []
+
+    def iter_nodes():
+        nonlocal unleveled
+        for (concept_id, label, prereq_ids, taxonomy), height in zip(graph.rows(), chain_heights):
             # Determine if foundational (no dependencies)
-            is_foundational = (dependencies_str == '')
+            is_foundational = not prereq_ids
             if is_foundational:
                 foundational_ids.append(concept_id)
 
@@ -106,26 +161,34 @@ def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metada
                 'group': taxonomy
             }
 
+            if height:
+                node['level'] = height - 1
+            else:
+                unleveled += 1
+
+            if positions is not None:
+                node['x'], node['y'] = positions[0][len(levels)], positions[1][len(levels)]
+            levels.append(height - 1)
+
             # Special styling for foundational concepts
             if is_foundational:
                 node['shape'] = 'box'
 
-            nodes.append(node)
+            yield node
 
-            # Create edges (from concept to its prerequisites)
-            if dependencies_str:
-                prereq_ids = [int(pid) for pid in dependencies_str.split('|')]
-                for prereq_id in prereq_ids:
-                    edge = {
-                        'from': concept_id,
-                        'to': prereq_id
-                    }
-                    edges.append(edge)
+    def iter_edges():
+        # Create edges (from concept to its prerequisites)
+        for concept_id, _, prereq_ids, _ in graph.rows():
+            for prereq_id in prereq_ids:
+                yield {
+                    'from': concept_id,
+                    'to': prereq_id
+                }
 
     # Create metadata section
     default_metadata = {
         'title': 'Learning Graph',
-        'description': f'Learning graph with {len(nodes)} concepts generated from CSV',
+        'description': f'Learning graph with {graph.node_count} concepts generated from CSV',
         'creator': 'CSV to JSON Converter',
         'date': datetime.now().strftime('%Y-%m-%d'),
         'version': '1.0',
@@ -142,51 +205,346 @@ def csv_to_json(csv_path: str, json_path: str, color_config: dict = None, metada
     groups = {}
 
     # Determine which taxonomy IDs are actually used
-    used_taxonomies = set(node['group'] for node in nodes)
+    used_taxonomies = set(graph.taxonomies)
 
     for tax_id, color in taxonomy_colors.items():
         # Only include groups that are actually used
-        if tax_id in used_taxonomies:
-            # Get the classifier name for this taxonomy
-            classifier_name = taxonomy_names.get(tax_id, tax_id)
-
-            # Determine font color based on background color
-            # Dark colors need white text
-            dark_colors = ['red', 'blue', 'indigo', 'violet', 'cyan']
-            font_color = 'white' if color in dark_colors else 'black'
-
-            groups[tax_id] = {
-                'classifierName': classifier_name,
-                'color': color,
-                'font': {
-                    'color': font_color
-                }
+        if tax_id not in used_taxonomies:
+            continue
+
+        # A full group entry (classifierName, color, font) is kept as curated
+        if isinstance(color, dict):
+            groups[tax_id] = {'classifierName': taxonomy_names.get(tax_id, tax_id), **color}
+            continue
+
+        # Get the classifier name for this taxonomy
+        classifier_name = taxonomy_names.get(tax_id, tax_id)
+
+        # Determine font color based on background color
+        # Dark colors need white text
+        dark_colors = ['red', 'blue', 'indigo', 'violet', 'cyan']
+        font_color = 'white' if color in dark_colors else 'black'
+
+        groups[tax_id] = {
+            'classifierName': classifier_name,
+            'color': color,
+            'font': {
+                'color': font_color
             }
+        }
 
     # Create final JSON structure
     graph_data = {
         'metadata': default_metadata,
         'groups': groups,
-        'nodes': nodes,
-        'edges': edges
     }
 
     # Write JSON
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(graph_data, f, indent=2)
+    if partition:
+        taxonomy_of = dict(zip(graph.ids, graph.taxonomies))
+        graph_data = write_partitions(json_path, graph_data, iter_nodes(), iter_edges(),
+                                      taxonomy_of, compact)
+        graph_data['layout'] = ('positions' if positions is not None
+                                else 'levels' if not unleveled else None)
+        write_manifest(json_path, graph_data, compact)
+        indented_bytes = None
+    elif compact:
+        indented_bytes = write_compact_json(json_path, graph_data, iter_nodes(), iter_edges())
+    else:
+        graph_data['nodes'] = list(iter_nodes())
+        graph_data['edges'] = list(iter_edges())
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(graph_data, f, indent=2)
+        indented_bytes = None
 
     print(f"✅ JSON graph created: {json_path}")
     print(f"   - Title: {default_metadata['title']}")
     print(f"   - {len(groups)} groups/taxonomies")
-    print(f"   - {len(nodes)} nodes")
-    print(f"   - {len(edges)} edges")
+    print(f"   - {graph.node_count} nodes")
+    print(f"   - {graph.edge_count} edges")
     print(f"   - {len(foundational_ids)} foundational concepts")
+    print(f"   - {max(chain_heights, default=0)} topological levels")
+    if unleveled and positions is not None:
+        print(f"⚠️  {unleveled} concepts are on or behind a cycle and have no level; "
+              "they are laid out on an extra bottom layer")
+    elif unleveled:
+        print(f"⚠️  {unleveled} concepts are on or behind a cycle and have no level; "
+              "the viewer will fall back to a physics layout")
     print(f"\nFoundational concept IDs: {foundational_ids}")
     print(f"Groups: {list(groups.keys())}")
 
+    if binary:
+        write_binary_sibling(json_path, {'metadata': default_metadata, 'groups': groups},
+                             graph, levels, positions)
+
+    if partition:
+        report_partitions(json_path, graph_data, compress)
+    elif compact or compress:
+        siblings = write_compressed_siblings(json_path) if compress else {}
+        report_output_sizes(json_path, indented_bytes, siblings)
+
     return graph_data
 
 
+def compute_layout(graph) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Lay the graph out and report layout time and edge crossings.
+
+    Returns:
+        (x, y) coordinate lists in CSV order, or None without NumPy
+    """
+    try:
+        from graph_layout import edge_crossings, layered_layout
+    except ImportError:
+        print("⚠️  NumPy not found; skipping the layout stage (pip install numpy)")
+        return None
+
+    start = time.perf_counter()
+    x, y = layered_layout(graph)
+    elapsed = time.perf_counter() - start
+    crossings = edge_crossings(graph, x, y)
+
+    print(f"📐 Layered layout computed in {elapsed * 1000:.1f} ms")
+    if crossings < 0:
+        print("   - Edge crossings: not counted (graph too large)")
+    else:
+        print(f"   - Edge crossings: {crossings:,}")
+    return x.tolist(), y.tolist()
+
+
+def write_compact_json(json_path: str, head: dict, nodes: Iterable[dict], edges: Iterable[dict]) -> int:
+    """
+    Stream the graph to a file in compact form without building the full document.
+
+    The metadata and groups in head are written first, then nodes and edges
+    in batches as they are produced.  Also works out the bytes the same
+    document would take with json.dump(..., indent=2), for the savings report.
+
+    Returns:
+        Size in bytes of the equivalent indented document
+    """
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+
+    # Start from the indented minus the compact size of the head with empty
+    # lists; every item then adds its compact bytes (the file) plus whitespace
+    skeleton = {**head, 'nodes': [], 'edges': []}
+    indented_bytes = len(json.dumps(skeleton, indent=2)) - len(encode(skeleton))
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write(encode(head)[:-1])
+        for name, items in (('nodes', nodes), ('edges', edges)):
+            f.write(f',"{name}":[')
+            count = 0
+            batch = []
+            for item in items:
+                batch.append(item)
+                # A flat dict two levels deep gains a space, a newline and 6
+                # spaces per key, plus a newline and 4 spaces before "}"
+                indented_bytes += 8 * len(item) + 5
+                if len(batch) == STREAM_BATCH:
+                    count = _write_batch(f, encode, batch, count)
+                    batch = []
+            if batch:
+                count = _write_batch(f, encode, batch, count)
+            f.write(']')
+            if count:
+                # "[" + items joined by "," + "]" becomes
+                # "[\n" + 4-space-indented items joined by ",\n" + "\n  ]"
+                indented_bytes += 5 * count + 3
+        f.write('}')
+
+    return indented_bytes + os.path.getsize(json_path)
+
+
+def _write_batch(f, encode, batch: List[dict], count: int) -> int:
+    """Write one batch of list items (comma-separated); return the running item count."""
+    text = encode(batch)[1:-1]
+    f.write(',' + text if count else text)
+    return count + len(batch)
+
+
+def write_binary_sibling(json_path: str, head: dict, graph, levels: List[int],
+                         positions: Optional[Tuple[List[int], List[int]]]):
+    """Write <stem>.lgbin next to json_path and check that it round-trips to the JSON."""
+    from graph_binary import verify_round_trip, write_graph_binary
+
+    binary_path = os.path.splitext(json_path)[0] + '.lgbin'
+    size = write_graph_binary(binary_path, head, graph, levels, positions)
+    print(f"\n✅ Binary graph created: {binary_path} ({size:,} bytes)")
+
+    problems = verify_round_trip(json_path, binary_path)
+    if problems:
+        print("❌ Round trip: the binary graph does not match the JSON")
+        for problem in problems:
+            print(f"   - {problem}")
+    else:
+        print("   - Round trip: matches the JSON")
+
+
+def write_partitions(json_path: str, head: dict, nodes: Iterable[dict], edges: Iterable[dict],
+                     taxonomy_of: Dict[int, str], compact: bool = False) -> dict:
+    """
+    Write one chunk file per TaxonomyID and a cross-partition edge file.
+
+    Chunks are named <stem>-<TaxonomyID>.json next to json_path; each holds
+    its group's nodes and the edges whose two ends are both in the group.
+    Edges between groups go to <stem>-cross-edges.json.
+
+    Returns:
+        Manifest dict: head plus a 'partitions' entry per TaxonomyID,
+        'crossEdges' and 'totals'
+    """
+    directory, filename = os.path.split(json_path)
+    stem = os.path.splitext(filename)[0]
+    used_names = set()
+
+    def chunk_name(suffix: str) -> str:
+        # Taxonomy IDs come from the CSV, so keep file names to safe characters
+        name = f"{stem}-{re.sub(r'[^A-Za-z0-9_.-]', '_', suffix)}"
+        candidate, n = name, 1
+        while candidate in used_names:
+            n += 1
+            candidate = f"{name}-{n}"
+        used_names.add(candidate)
+        return candidate + '.json'
+
+    partition_nodes: Dict[str, List[dict]] = {}
+    for node in nodes:
+        partition_nodes.setdefault(node['group'], []).append(node)
+    partition_edges: Dict[str, List[dict]] = {taxonomy: [] for taxonomy in partition_nodes}
+    cross_edges = []
+    for edge in edges:
+        taxonomy = taxonomy_of[edge['from']]
+        if taxonomy == taxonomy_of.get(edge['to']):
+            partition_edges[taxonomy].append(edge)
+        else:
+            cross_edges.append(edge)
+
+    partitions = {}
+    for taxonomy, group_nodes in partition_nodes.items():
+        name = chunk_name(taxonomy)
+        document = {'taxonomy': taxonomy, 'nodes': group_nodes, 'edges': partition_edges[taxonomy]}
+        partitions[taxonomy] = {
+            'file': name,
+            'nodes': len(group_nodes),
+            'edges': len(partition_edges[taxonomy]),
+            **_write_chunk(os.path.join(directory, name), document, compact),
+        }
+
+    name = chunk_name('cross-edges')
+    cross = {'file': name, 'edges': len(cross_edges),
+             **_write_chunk(os.path.join(directory, name), {'edges': cross_edges}, compact)}
+
+    return {
+        **head,
+        'partitions': partitions,
+        'crossEdges': cross,
+        'totals': {
+            'nodes': sum(entry['nodes'] for entry in partitions.values()),
+            'edges': sum(entry['edges'] for entry in partitions.values()) + len(cross_edges),
+            'bytes': sum(entry['bytes'] for entry in partitions.values()) + cross['bytes'],
+        },
+    }
+
+
+def _write_chunk(path: str, document: dict, compact: bool) -> Dict[str, object]:
+    """Write one JSON document; return its byte size and SHA-256."""
+    if compact:
+        text = json.dumps(document, separators=(',', ':'))
+    else:
+        text = json.dumps(document, indent=2)
+    data = text.encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return {'bytes': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+
+def write_manifest(json_path: str, manifest: dict, compact: bool = False):
+    with open(json_path, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(manifest, f, separators=(',', ':'))
+        else:
+            json.dump(manifest, f, indent=2)
+
+
+def report_partitions(json_path: str, manifest: dict, compress: bool = False):
+    """Print every partition file, compressing each one too if asked."""
+    directory = os.path.dirname(json_path)
+    entries = list(manifest['partitions'].items())
+    entries.append(('(cross-partition edges)', manifest['crossEdges']))
+
+    print(f"\n📦 Partitions ({len(manifest['partitions'])} groups, "
+          f"{manifest['totals']['bytes']:,} bytes; manifest "
+          f"{os.path.getsize(json_path):,} bytes):")
+    for i, (taxonomy, entry) in enumerate(entries):
+        path = os.path.join(directory, entry['file'])
+        compressed = ''
+        if compress:
+            siblings = write_compressed_siblings(path, quiet=i > 0)
+            compressed = ', ' + ', '.join(f"{os.path.splitext(sibling)[1]} {size:,} bytes"
+                                          for sibling, size in siblings.items())
+        nodes = f"{entry['nodes']} nodes, " if 'nodes' in entry else ''
+        print(f"   - {entry['file']}: {taxonomy}, {nodes}{entry['edges']} edges, "
+              f"{entry['bytes']:,} bytes{compressed}")
+
+
+def write_compressed_siblings(json_path: str, quiet: bool = False) -> Dict[str, int]:
+    """
+    Write <json_path>.gz and, if the brotli package is installed, <json_path>.br.
+
+    With quiet=True a missing brotli package is not reported.
+
+    Returns:
+        Mapping of sibling path -> size in bytes
+    """
+    compressors = {json_path + '.gz': zlib.compressobj(9, zlib.DEFLATED, 31)}
+    try:
+        import brotli
+        compressors[json_path + '.br'] = brotli.Compressor(quality=11)
+    except ImportError:
+        if not quiet:
+            print("⚠️  brotli not found; skipping .br output (pip install brotli)")
+
+    # Each sibling is written to a temporary file and renamed into place only
+    # when every sibling is complete, so a failure never leaves a truncated one
+    temporary = {}
+    try:
+        with contextlib.ExitStack() as stack:
+            outputs = {}
+            for path in compressors:
+                fd, temporary[path] = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                                       suffix='.tmp')
+                outputs[path] = stack.enter_context(os.fdopen(fd, 'wb'))
+            with open(json_path, 'rb') as source:
+                for block in iter(lambda: source.read(1 << 20), b''):
+                    for path, compressor in compressors.items():
+                        outputs[path].write(compressor.compress(block) if path.endswith('.gz')
+                                            else compressor.process(block))
+            for path, compressor in compressors.items():
+                outputs[path].write(compressor.flush() if path.endswith('.gz') else compressor.finish())
+        for path in compressors:
+            os.replace(temporary.pop(path), path)
+    except BaseException:
+        for tmp_path in temporary.values():
+            os.unlink(tmp_path)
+        raise
+
+    return {path: os.path.getsize(path) for path in compressors}
+
+
+def report_output_sizes(json_path: str, indented_bytes: Optional[int], siblings: Dict[str, int]):
+    """Print the size of each output format and its saving over indented JSON."""
+    json_bytes = os.path.getsize(json_path)
+    reference = indented_bytes or json_bytes
+    reference_name = 'indented JSON' if indented_bytes else os.path.basename(json_path)
+
+    print(f"\n📦 Output sizes (savings vs {reference_name}, {reference:,} bytes):")
+    rows = [(json_path, json_bytes)] if indented_bytes else []
+    for path, size in rows + list(siblings.items()):
+        saving = 1 - size / reference if reference else 0
+        print(f"   - {os.path.basename(path)}: {size:,} bytes ({saving:.1%} smaller)")
+
+
 def create_taxonomy_legend(color_config: dict = None, taxonomy_names: dict = None):
     """
     Generate a legend of taxonomy colors for documentation.
@@ -230,6 +588,9 @@ def create_taxonomy_legend(color_config: dict = None, taxonomy_names: dict = Non
     for tax_id in sorted(colors.keys()):
         name = names.get(tax_id, tax_id)
         color = colors[tax_id]
+        if isinstance(color, dict):
+            name = color.get('classifierName', name)
+            color = color.get('color', '')
         print(f"| {tax_id} | {name} | {color} |")
 
 
@@ -237,11 +598,24 @@ if __name__ == "__main__":
     import sys
 
     # Parse command line arguments
+    compact = '--compact' in sys.argv
+    compress = '--compress' in sys.argv
+    layout = '--layout' in sys.argv
+    partition = '--partition' in sys.argv
+    binary = '--binary' in sys.argv
+    sys.argv = [arg for arg in sys.argv
+                if arg not in ('--compact', '--compress', '--layout', '--partition', '--binary')]
+
     if len(sys.argv) < 3:
         print("Usage: python csv-to-json.py <input_csv> <output_json> [color_config.json] [metadata.json]")
+        print("                             [--compact] [--compress] [--layout] [--partition] [--binary]")
         print("Looking for CSV column names: ConceptID, ConceptLabel, Dependencies, TaxonomyID")
         print("\nExample:")
         print("   python csv-to-json.py learning-graph.csv learning-graph.json")
+        print("   python csv-to-json.py learning-graph.csv learning-graph.json --compact --compress")
+        print("   python csv-to-json.py learning-graph.csv learning-graph.json --layout")
+        print("   python csv-to-json.py learning-graph.csv learning-graph.json --partition")
+        print("   python csv-to-json.py learning-graph.csv learning-graph.json --binary")
         print("\nOptional color_config.json format:")
         print(json.dumps({
             'FOUND': 'red',
@@ -282,7 +656,14 @@ if __name__ == "__main__":
         except FileNotFoundError:
             print(f"⚠️  Metadata file not found: {metadata_file}, using defaults")
 
-    graph_data = csv_to_json(csv_path, json_path, color_config, metadata)
+    try:
+        graph_data = csv_to_json(csv_path, json_path, color_config, metadata,
+                                 compact, compress, layout, partition, binary)
+    except ValueError as e:
+        # Duplicate ConceptIDs or dependencies on unknown concepts
+        print(f"❌ Cannot convert {csv_path}: {e}")
+        print("   Run analyze-graph.py or analyze-concept-quality.py to review the CSV")
+        sys.exit(1)
     create_taxonomy_legend(color_config)
 
     print("\n✅ CSV to JSON format complete.  Ready to use with graph-viewer!")
@@ -4,11 +4,12 @@ Generate comprehensive glossary with ISO 11179-compliant definitions
 for all concepts in the IT Management Graph learning graph.
 """
 
-import csv
 import json
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+from learning_graph import read_rows
+
 # Taxonomy-based definition templates and context
 TAXONOMY_CONTEXT = {
     'ITIL': {
@@ -140,18 +141,18 @@ CORE_DEFINITIONS = {
     'DMBOK': 'Acronym for Data Management Body of Knowledge.',
 }
 
-def load_concepts(csv_file: str) -> List[Dict]:
-    """Load all concepts from CSV"""
+def load_concepts(csv_file: str, graph=None) -> List[Dict]:
+    """Load all concepts from CSV (graph: already loaded LearningGraph for csv_file)"""
     concepts = []
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            concepts.append({
-                'id': int(row['ConceptID']),
-                'label': row['ConceptLabel'],
-                'dependencies': row['Dependencies'],
-                'taxonomy': row['TaxonomyID']
-            })
+    # Tolerant read: a malformed dependency list must not block the glossary
+    rows = graph.rows() if graph is not None else read_rows(csv_file)
+    for concept_id, label, prereq_ids, taxonomy in rows:
+        concepts.append({
+            'id': concept_id,
+            'label': label,
+            'dependencies': '|'.join(map(str, prereq_ids)),
+            'taxonomy': taxonomy
+        })
     return concepts
 
 def generate_definition(concept: Dict, all_concepts: Dict) -> str:
@@ -213,10 +214,11 @@ def generate_cross_references(concept: Dict, all_concepts: Dict) -> List[str]:
 
     return cross_ref_map.get(label, [])
 
-def main():
+def generate_glossary(csv_file: str = 'learning-graph.csv', output_file: str = '../glossary.md',
+                      graph=None):
     """Generate complete glossary"""
     print("Loading concepts...")
-    concepts = load_concepts('learning-graph.csv')
+    concepts = load_concepts(csv_file, graph)
 
     # Create lookup dictionary
     concepts_by_label = {c['label']: c for c in concepts}
@@ -264,7 +266,6 @@ def main():
         glossary_lines.append("\n")
 
     # Write glossary file
-    output_file = '../glossary.md'
     with open(output_file, 'w', encoding='utf-8') as f:
         f.writelines(glossary_lines)
 
@@ -272,5 +273,8 @@ def main():
     print(f"✓ Added examples to {example_count} terms ({example_count/len(sorted_concepts)*100:.1f}%)")
     print(f"✓ Output written to {output_file}")
 
+def main():
+    generate_glossary()
+
 if __name__ == '__main__':
     main()
@@ -202,15 +202,19 @@ def generate_report(terms: List[Dict]) -> str:
 
     return ''.join(report)
 
-if __name__ == '__main__':
+def write_quality_report(glossary_file: str = '../glossary.md',
+                         output_file: str = 'glossary-quality-report.md'):
+    """Parse the glossary and write its quality report"""
     print("Parsing glossary...")
-    terms = parse_glossary('../glossary.md')
+    terms = parse_glossary(glossary_file)
 
     print(f"Analyzing {len(terms)} terms...")
     report = generate_report(terms)
 
-    output_file = 'glossary-quality-report.md'
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(report)
 
     print(f"✓ Quality report written to {output_file}")
+
+if __name__ == '__main__':
+    write_quality_report()
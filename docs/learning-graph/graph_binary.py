@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Binary Format
+
+Compact binary encoding of the graph-viewer JSON written by csv-to-json.py,
+for graphs large enough that JSON parsing dominates startup.  Every array
+is little-endian Int32 and 4-byte aligned, so a browser can wrap the
+fetched buffer in Int32Arrays and Python can memory-map the file; only
+labels and group names are decoded, on access.
+
+File layout (little-endian):
+
+    header      magic b'LGBIN001', node_count, edge_count, group_count,
+                flags, head_bytes, string_bytes (uint32 each)
+    int32       ids[n], groups[n] (index into the group names)
+    int32       levels[n] (-1 for no level)         if flags & HAS_LEVELS
+    int32       x[n], y[n]                          if flags & HAS_POSITIONS
+    int32       edge_from[e], edge_to[e] (ConceptIDs)
+    int32       string_offsets[n + g + 1]: labels, then group names
+    bytes       UTF-8 JSON head (metadata and groups), padded to 4 bytes
+    bytes       UTF-8 string table
+
+Node shapes are not stored: foundational concepts (no outgoing edge) get
+shape 'box', as in the JSON.
+
+Usage: python graph_binary.py <graph_json> <graph_lgbin>
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from graph_cache import StringTable, encode_strings
+from learning_graph import LearningGraph
+
+MAGIC = b'LGBIN001'
+HEADER = struct.Struct('<8sIIIIII')
+
+HAS_LEVELS = 1
+HAS_POSITIONS = 2
+
+
+def write_graph_binary(path: str, head: dict, graph: LearningGraph,
+                       levels: Optional[Sequence[int]] = None,
+                       positions: Optional[Sequence[Sequence[int]]] = None) -> int:
+    """
+    Write a graph in the binary format atomically.
+
+    Args:
+        path: Output file
+        head: JSON-serializable metadata and groups
+        graph: Loaded learning graph (nodes in CSV order)
+        levels: Topological level per node, -1 for none
+        positions: (x, y) coordinate lists per node
+
+    Returns:
+        File size in bytes
+    """
+    group_names: List[str] = []
+    group_index: Dict[str, int] = {}
+    groups = array('i')
+    for taxonomy in graph.taxonomies:
+        if taxonomy not in group_index:
+            group_index[taxonomy] = len(group_names)
+            group_names.append(taxonomy)
+        groups.append(group_index[taxonomy])
+
+    edge_from, edge_to = array('i'), array('i')
+    for concept_id, _, prereq_ids, _ in graph.rows():
+        for prereq_id in prereq_ids:
+            edge_from.append(concept_id)
+            edge_to.append(prereq_id)
+
+    flags = 0
+    sections = [array('i', graph.ids), groups]
+    if levels is not None:
+        flags |= HAS_LEVELS
+        sections.append(array('i', levels))
+    if positions is not None:
+        flags |= HAS_POSITIONS
+        sections.extend(array('i', axis) for axis in positions)
+    sections.extend([edge_from, edge_to])
+
+    string_offsets, string_blob = encode_strings(list(graph.labels) + group_names)
+    sections.append(string_offsets)
+    head_blob = json.dumps(head, separators=(',', ':')).encode('utf-8')
+    head_blob += b' ' * (-len(head_blob) % 4)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, graph.node_count, len(edge_from), len(group_names),
+                                flags, len(head_blob), len(string_blob)))
+            for section in sections:
+                if sys.byteorder != 'little':
+                    section.byteswap()
+                f.write(section.tobytes())
+            f.write(head_blob)
+            f.write(string_blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return os.path.getsize(path)
+
+
+class BinaryGraph:
+    """
+    A memory-mapped binary graph file.
+
+    Arrays are int32 memoryviews over the mapping; labels and group_names
+    decode strings on access.  to_json() rebuilds the viewer JSON document.
+    """
+
+    def __init__(self, path: str):
+        if sys.byteorder != 'little':
+            raise ValueError("Binary graph files can only be mapped on little-endian hosts")
+        with open(path, 'rb') as f:
+            self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mapped)
+        magic, n, e, g, flags, head_bytes, string_bytes = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"Not a learning graph binary file: {path}")
+
+        lengths = [n, n]
+        if flags & HAS_LEVELS:
+            lengths.append(n)
+        if flags & HAS_POSITIONS:
+            lengths.extend([n, n])
+        lengths.extend([e, e, n + g + 1])
+        expected = HEADER.size + 4 * sum(lengths) + head_bytes + string_bytes
+        if len(view) != expected:
+            raise ValueError(f"Truncated learning graph binary file: {path}")
+
+        pos = HEADER.size
+        sections: List[memoryview] = []
+        for length in lengths:
+            sections.append(view[pos:pos + 4 * length].cast('i'))
+            pos += 4 * length
+
+        self.node_count, self.edge_count = n, e
+        self.ids, self.groups = sections[0], sections[1]
+        rest = sections[2:]
+        self.levels = rest.pop(0) if flags & HAS_LEVELS else None
+        self.x, self.y = (rest.pop(0), rest.pop(0)) if flags & HAS_POSITIONS else (None, None)
+        self.edge_from, self.edge_to, string_offsets = rest
+
+        self.head = json.loads(bytes(view[pos:pos + head_bytes]))
+        pos += head_bytes
+        blob = view[pos:pos + string_bytes]
+        self.labels = StringTable(string_offsets[:n + 1], blob)
+        self.group_names = StringTable(string_offsets[n:], blob)
+
+    def iter_nodes(self) -> Iterable[dict]:
+        """Node dicts as written to the JSON by csv-to-json.py."""
+        has_prerequisites = set(self.edge_from)
+        for i in range(self.node_count):
+            node = {'id': self.ids[i], 'label': self.labels[i],
+                    'group': self.group_names[self.groups[i]]}
+            if self.levels is not None and self.levels[i] >= 0:
+                node['level'] = self.levels[i]
+            if self.x is not None:
+                node['x'], node['y'] = self.x[i], self.y[i]
+            if self.ids[i] not in has_prerequisites:
+                node['shape'] = 'box'
+            yield node
+
+    def iter_edges(self) -> Iterable[dict]:
+        for source, target in zip(self.edge_from, self.edge_to):
+            yield {'from': source, 'to': target}
+
+    def to_json(self) -> dict:
+        return {**self.head, 'nodes': list(self.iter_nodes()), 'edges': list(self.iter_edges())}
+
+
+def read_graph_binary(path: str) -> dict:
+    """Read a binary graph file back into the viewer JSON document."""
+    return BinaryGraph(path).to_json()
+
+
+def load_json_graph(json_path: str) -> dict:
+    """
+    Load a viewer JSON document.
+
+    A partition manifest (csv-to-json.py --partition) is reassembled from
+    its chunk files, with nodes and edges sorted by ConceptID.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if 'partitions' not in document:
+        return document
+
+    directory = os.path.dirname(json_path)
+    nodes, edges = [], []
+    names = [entry['file'] for entry in document['partitions'].values()]
+    for name in names + [document['crossEdges']['file']]:
+        with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+            chunk = json.load(f)
+        nodes.extend(chunk.get('nodes', []))
+        edges.extend(chunk['edges'])
+    return _sorted_graph({'metadata': document['metadata'], 'groups': document['groups'],
+                          'nodes': nodes, 'edges': edges})
+
+
+def _sorted_graph(document: dict) -> dict:
+    document['nodes'].sort(key=lambda node: node['id'])
+    document['edges'].sort(key=lambda edge: (edge['from'], edge['to']))
+    return document
+
+
+def verify_round_trip(json_path: str, binary_path: str) -> List[str]:
+    """
+    Compare a binary graph file with the JSON it was written alongside.
+
+    Returns:
+        Descriptions of every difference (empty when they match)
+    """
+    expected = load_json_graph(json_path)
+    actual = read_graph_binary(binary_path)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        partitioned = 'partitions' in json.load(f)
+    if partitioned:
+        # Chunks do not keep CSV order, so compare sorted
+        actual = _sorted_graph(actual)
+
+    problems = []
+    for key in sorted(set(expected) | set(actual)):
+        if key in ('nodes', 'edges'):
+            continue
+        if expected.get(key) != actual.get(key):
+            problems.append(f"'{key}' differs")
+    for key in ('nodes', 'edges'):
+        want, got = expected.get(key, []), actual.get(key, [])
+        if len(want) != len(got):
+            problems.append(f"{len(got)} {key} instead of {len(want)}")
+            continue
+        for i, (a, b) in enumerate(zip(want, got)):
+            if a != b:
+                problems.append(f"{key}[{i}] differs: {a} != {b}")
+                break
+    return problems
+
+
+if __name__ == "__main__":
+    import time
+
+    if len(sys.argv) != 3:
+        print("Usage: python graph_binary.py <graph_json> <graph_lgbin>")
+        print("\nChecks that a binary graph file round-trips to the JSON written with it.")
+        print("\nExample:")
+        print("  python csv-to-json.py learning-graph.csv learning-graph.json --binary")
+        print("  python graph_binary.py learning-graph.json learning-graph.lgbin")
+        sys.exit(1)
+
+    json_path, binary_path = sys.argv[1:]
+    start = time.perf_counter()
+    with open(json_path, 'r', encoding='utf-8') as f:
+        json.load(f)
+    json_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    binary = BinaryGraph(binary_path)
+    binary_seconds = time.perf_counter() - start
+
+    problems = verify_round_trip(json_path, binary_path)
+    if problems:
+        print(f"❌ {binary_path} does not match {json_path}:")
+        for problem in problems:
+            print(f"   - {problem}")
+        sys.exit(1)
+
+    print(f"✅ {binary_path} round-trips to {json_path}")
+    print(f"   - {binary.node_count} nodes, {binary.edge_count} edges")
+    print(f"   - {os.path.getsize(binary_path):,} bytes (JSON {os.path.getsize(json_path):,} bytes)")
+    print(f"   - Open: {binary_seconds * 1000:.1f} ms (JSON parse {json_seconds * 1000:.1f} ms)")
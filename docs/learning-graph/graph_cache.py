@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Binary Cache
+
+Persists a parsed LearningGraph as a memory-mappable binary file keyed by
+the SHA-256 of the CSV contents.  Later runs on an unchanged CSV map the
+file and wrap its arrays directly, with no CSV parsing and no copying.
+Editing the CSV changes its hash, so a stale cache is never used.
+
+Cache files live in $LEARNING_GRAPH_CACHE_DIR, or ~/.cache/learning-graph
+by default.  Every distinct CSV (or CSV revision) adds one file of about
+20 bytes per concept and 8 per dependency plus its label text.  After each
+write the least recently used files are deleted until the directory's
+.lgcache files fit in $LEARNING_GRAPH_CACHE_MAX_MB (default 256 MB);
+a cache hit counts as a use.
+
+File layout (little-endian):
+
+    header      magic b'LGCACHE1', node_count, edge_count,
+                label_bytes, taxonomy_bytes (uint32 each)
+    int32       ids[n]
+    int32       prereq_offsets[n + 1], prereq_targets[e]
+    int32       dependent_offsets[n + 1], dependent_targets[e]
+    int32       label_offsets[n + 1], taxonomy_offsets[n + 1]
+    bytes       UTF-8 label table, UTF-8 taxonomy table
+
+Usage: python graph_cache.py <input_csv>
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections import abc
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+from learning_graph import LearningGraph
+
+MAGIC = b'LGCACHE1'
+HEADER = struct.Struct('<8sIIII')
+
+# Total size of .lgcache files kept per cache directory, unless overridden
+DEFAULT_CACHE_MAX_MB = 256
+
+
+class StringTable(abc.Sequence):
+    """Read-only sequence of strings decoded on access from a UTF-8 blob."""
+
+    def __init__(self, offsets: Sequence[int], blob: memoryview):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: Union[int, slice]):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('string table index out of range')
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+
+def file_digest(csv_path: str) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Directory holding cache files."""
+    configured = os.environ.get('LEARNING_GRAPH_CACHE_DIR')
+    if configured:
+        return Path(configured)
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'learning-graph'
+
+
+def cache_path(csv_path: str, cache_dir: Optional[str] = None) -> Path:
+    """Cache file for the current contents of a CSV."""
+    directory = Path(cache_dir) if cache_dir else default_cache_dir()
+    return directory / f"{file_digest(csv_path)}.lgcache"
+
+
+def cache_max_bytes() -> int:
+    """Size limit for the cache files in one directory."""
+    configured = os.environ.get('LEARNING_GRAPH_CACHE_MAX_MB')
+    return int(float(configured) * (1 << 20)) if configured else DEFAULT_CACHE_MAX_MB << 20
+
+
+def prune_cache(directory: Path, max_bytes: Optional[int] = None,
+                keep: Optional[Path] = None) -> int:
+    """
+    Delete least recently used cache files until the rest fit in max_bytes.
+
+    Args:
+        directory: Cache directory
+        max_bytes: Size limit (default: cache_max_bytes())
+        keep: A file never to delete, such as the one just written
+
+    Returns:
+        Number of files deleted
+    """
+    limit = cache_max_bytes() if max_bytes is None else max_bytes
+    entries = []
+    for path in directory.glob('*.lgcache'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= limit:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def encode_strings(strings: Sequence[str]) -> Tuple[array, bytes]:
+    offsets = array('i', [0])
+    encoded = []
+    total = 0
+    for text in strings:
+        data = text.encode('utf-8')
+        encoded.append(data)
+        total += len(data)
+        offsets.append(total)
+    return offsets, b''.join(encoded)
+
+
+def write_cache(graph: LearningGraph, path: Path) -> None:
+    """Write a graph to a cache file atomically."""
+    label_offsets, label_blob = encode_strings(graph.labels)
+    taxonomy_offsets, taxonomy_blob = encode_strings(graph.taxonomies)
+    sections = [graph.ids, graph.prereq_offsets, graph.prereq_targets,
+                graph.dependent_offsets, graph.dependent_targets,
+                label_offsets, taxonomy_offsets]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, graph.node_count, graph.edge_count,
+                                len(label_blob), len(taxonomy_blob)))
+            for section in sections:
+                f.write(array('i', section).tobytes())
+            f.write(label_blob)
+            f.write(taxonomy_blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_cache(path: Path) -> LearningGraph:
+    """Memory-map a cache file and wrap its arrays as a LearningGraph."""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    magic, n, e, label_bytes, taxonomy_bytes = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"Not a learning graph cache file: {path}")
+
+    expected = HEADER.size + 4 * (5 * n + 4 + 2 * e) + label_bytes + taxonomy_bytes
+    if len(view) != expected:
+        raise ValueError(f"Truncated learning graph cache file: {path}")
+
+    pos = HEADER.size
+    sections: List[memoryview] = []
+    for length in (n, n + 1, e, n + 1, e, n + 1, n + 1):
+        sections.append(view[pos:pos + 4 * length].cast('i'))
+        pos += 4 * length
+    ids, prereq_offsets, prereq_targets, dependent_offsets, dependent_targets, \
+        label_offsets, taxonomy_offsets = sections
+
+    labels = StringTable(label_offsets, view[pos:pos + label_bytes])
+    pos += label_bytes
+    taxonomies = StringTable(taxonomy_offsets, view[pos:pos + taxonomy_bytes])
+
+    return LearningGraph.from_arrays(ids, labels, taxonomies, prereq_offsets, prereq_targets,
+                                     dependent_offsets, dependent_targets)
+
+
+def load_graph_cached(csv_path: str, cache_dir: Optional[str] = None) -> LearningGraph:
+    """
+    Load a learning-graph CSV through the binary cache.
+
+    On a cache miss the CSV is parsed, the cache written and the cache
+    directory pruned to its size limit; on a hit the cache file is
+    memory-mapped instead.  Unreadable or unwritable cache
+    files fall back to parsing the CSV.
+    """
+    if sys.byteorder != 'little':
+        return LearningGraph.from_csv(csv_path)
+
+    path = cache_path(csv_path, cache_dir)
+    if path.exists():
+        try:
+            graph = read_cache(path)
+        except (OSError, ValueError, struct.error):
+            pass
+        else:
+            # The modification time records the last use for prune_cache()
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return graph
+
+    graph = LearningGraph.from_csv(csv_path)
+    try:
+        write_cache(graph, path)
+        prune_cache(path.parent, keep=path)
+    except OSError:
+        pass
+    return graph
+
+
+if __name__ == "__main__":
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python graph_cache.py <input_csv>")
+        print("\nBuilds (or reuses) the binary cache for a learning-graph CSV.")
+        sys.exit(1)
+
+    csv_path = sys.argv[1]
+    path = cache_path(csv_path)
+    was_cached = path.exists()
+    start = time.perf_counter()
+    graph = load_graph_cached(csv_path)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'✅ Loaded cached' if was_cached else '✅ Cached'} graph: {path}")
+    print(f"   - {graph.node_count} concepts, {graph.edge_count} dependencies")
+    print(f"   - {elapsed * 1000:.1f} ms")
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Per-Concept Structural Metrics
+
+Computes a table of structural metrics for every concept with NumPy,
+working directly on the CSR arrays of a LearningGraph:
+
+- in_degree:   concepts that depend directly on this concept
+- out_degree:  direct prerequisites of this concept
+- height:      concepts on the longest prerequisite chain ending here
+               (1 for a foundational concept)
+- depth:       concepts on the longest dependent chain starting here
+               (1 for a concept nothing depends on)
+- ancestors:   distinct transitive prerequisites
+- descendants: distinct concepts that transitively depend on this one
+- pagerank:    share of a random learner's time spent on the concept when
+               stepping from concepts to their prerequisites
+- betweenness: share of shortest prerequisite chains that pass through
+               the concept (sampled estimate)
+
+Height and depth come from level-synchronous topological sweeps, and the
+ancestor/descendant counts from bitsets propagated one level at a time, so
+the per-node work is vectorized instead of looped in Python.  Concepts on
+or behind a cycle get 0 for height/depth and -1 for the transitive counts.
+
+PageRank is a power iteration whose sparse matrix-vector product is a
+weighted bincount over the CSR edges.  Betweenness runs Brandes' algorithm
+from a random sample of source concepts, one vectorized breadth-first
+level at a time; the sample size is chosen from a Hoeffding bound so every
+score is within epsilon of the exact value with probability 1 - delta.
+
+Usage: python graph_metrics.py <input_csv> <output_metrics.csv>
+"""
+
+import csv
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from learning_graph import LearningGraph
+
+METRIC_COLUMNS = ['in_degree', 'out_degree', 'height', 'depth', 'ancestors', 'descendants',
+                  'pagerank', 'betweenness']
+
+# Upper bound on the bitset block held in memory while counting ancestors
+BITSET_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Largest graph for which the report includes ancestor/descendant counts
+TRANSITIVE_NODE_LIMIT = 100_000
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-9
+PAGERANK_MAX_ITERATIONS = 100
+
+# Betweenness error bound: |estimate - exact| <= epsilon with probability 1 - delta
+BETWEENNESS_EPSILON = 0.1
+BETWEENNESS_DELTA = 0.1
+
+# Upper bound on (source, concept) pairs tracked per betweenness batch
+BETWEENNESS_BATCH_PAIRS = 1 << 24
+
+
+def csr_arrays(graph: LearningGraph, reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Zero-copy int32 NumPy views of the prerequisite (or dependent) CSR arrays.
+
+    The views share the graph's buffers and must not be written to.
+    Arithmetic with int64 arrays (aranges, cumulative sums, batch keys)
+    widens the result, and bincount accepts int32 indices as they are.
+    """
+    if reverse:
+        offsets, targets = graph.dependent_offsets, graph.dependent_targets
+    else:
+        offsets, targets = graph.prereq_offsets, graph.prereq_targets
+    return np.frombuffer(offsets, dtype=np.int32), np.frombuffer(targets, dtype=np.int32)
+
+
+def gather_edges(offsets: np.ndarray, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Edge positions of a set of nodes in a CSR adjacency.
+
+    Returns:
+        (positions, counts) where positions lists the edge slots of each
+        node in turn and counts[i] is the number of slots for nodes[i]
+    """
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), counts
+    # Position k of the output belongs to node j: starts[j] + (k - first slot of j)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.repeat(starts, counts) + (np.arange(total) - first)
+    return positions, counts
+
+
+def topological_levels(graph: LearningGraph, reverse: bool = False) -> List[np.ndarray]:
+    """
+    Group nodes into topological levels with a level-synchronous Kahn sweep.
+
+    Level 0 holds the foundational concepts (or, with reverse=True, the
+    concepts nothing depends on); every node sits one level above its
+    deepest prerequisite (dependent).  Nodes on or behind a cycle are left out.
+    """
+    # Counting down prerequisites means walking the dependent edges, and vice versa
+    offsets, targets = csr_arrays(graph, reverse=not reverse)
+    incoming = np.diff(csr_arrays(graph, reverse=reverse)[0])
+    frontier = np.flatnonzero(incoming == 0)
+    levels = []
+
+    while frontier.size:
+        levels.append(frontier)
+        positions, _ = gather_edges(offsets, frontier)
+        reached = targets[positions]
+        incoming -= np.bincount(reached, minlength=len(incoming))
+        candidates = np.unique(reached)
+        frontier = candidates[incoming[candidates] == 0]
+
+    return levels
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a uint64 matrix."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def transitive_counts(graph: LearningGraph, levels: List[np.ndarray],
+                      reverse: bool = False) -> np.ndarray:
+    """
+    Count distinct transitive prerequisites (or dependents) of every node.
+
+    Reachability bitsets are built for a block of source columns at a time
+    and propagated level by level with a segmented bitwise OR.
+    """
+    n = graph.node_count
+    offsets, targets = csr_arrays(graph, reverse=reverse)
+    counts = np.full(n, -1, dtype=np.int64)
+    ordered = np.concatenate(levels) if levels else np.empty(0, dtype=np.int64)
+    if ordered.size == 0:
+        return counts
+    counts[ordered] = 0
+
+    # Edges of every level with at least one neighbour, computed once
+    level_edges = []
+    for level in levels[1:]:
+        positions, degree = gather_edges(offsets, level)
+        has_edges = degree > 0
+        segment_starts = (np.cumsum(degree) - degree)[has_edges]
+        level_edges.append((level[has_edges], targets[positions], segment_starts))
+
+    # Size the block so the bitsets plus the largest per-level gather fit the budget
+    widest = max((len(neighbours) for _, neighbours, _ in level_edges), default=0)
+    words = max(1, min((n + 63) // 64, BITSET_BUDGET_BYTES // (8 * (n + widest))))
+    block = 64 * words
+    for first in range(0, n, block):
+        columns = np.arange(first, min(first + block, n))
+        bits = np.zeros((n, words), dtype=np.uint64)
+        relative = columns - first
+        bits[columns, relative // 64] = np.left_shift(np.uint64(1), (relative % 64).astype(np.uint64))
+
+        for nodes, neighbours, segment_starts in level_edges:
+            bits[nodes] |= np.bitwise_or.reduceat(bits[neighbours], segment_starts, axis=0)
+
+        counts[ordered] += _popcount(bits[ordered])
+
+    # Every node carried its own bit
+    counts[ordered] -= 1
+    return counts
+
+
+def pagerank(graph: LearningGraph, damping: float = PAGERANK_DAMPING,
+             tolerance: float = PAGERANK_TOLERANCE,
+             max_iterations: int = PAGERANK_MAX_ITERATIONS) -> np.ndarray:
+    """
+    PageRank by sparse power iteration; scores sum to 1.
+
+    A random learner steps from a concept to one of its prerequisites, so
+    rank collects on the concepts that large parts of the graph build on.
+    Foundational concepts have nowhere to step and jump uniformly.
+    """
+    n = graph.node_count
+    if n == 0:
+        return np.zeros(0)
+    offsets, targets = csr_arrays(graph)
+    out_degree = np.diff(offsets)
+    sources = np.repeat(np.arange(n), out_degree)
+    dangling = out_degree == 0
+    share = np.zeros(n)
+    share[~dangling] = 1.0 / out_degree[~dangling]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        flow = np.bincount(targets, weights=(rank * share)[sources], minlength=n)
+        updated = damping * (flow + rank[dangling].sum() / n) + (1 - damping) / n
+        change = np.abs(updated - rank).sum()
+        rank = updated
+        if change < tolerance:
+            break
+    return rank
+
+
+def betweenness_sample_size(node_count: int, epsilon: float = BETWEENNESS_EPSILON,
+                            delta: float = BETWEENNESS_DELTA) -> int:
+    """
+    Source concepts to sample for the betweenness error bound.
+
+    Each source contributes a value in [0, 1] to a normalized score, so by
+    Hoeffding's inequality and a union bound over all concepts,
+    ln(2n / delta) / (2 epsilon^2) sources keep every score within epsilon
+    with probability 1 - delta.  Never more than node_count.
+    """
+    n = node_count
+    if n < 3:
+        return n
+    # Scores are normalized by (n-1)(n-2); the per-source values by n(n-2)
+    bound = epsilon * (n - 1) / n
+    return min(n, math.ceil(math.log(2 * n / delta) / (2 * bound * bound)))
+
+
+def approximate_betweenness(graph: LearningGraph, epsilon: float = BETWEENNESS_EPSILON,
+                            delta: float = BETWEENNESS_DELTA, seed: int = 0) -> np.ndarray:
+    """
+    Betweenness centrality over prerequisite edges, estimated from sampled sources.
+
+    Scores are normalized by (n-1)(n-2), the number of ordered pairs a
+    concept could lie between.  When the sample size reaches the node
+    count every concept is a source and the result is exact.
+
+    A batch of sources is searched together: each level holds
+    (source, concept) pairs keyed as source_slot * n + concept, so one set
+    of array operations advances every search in the batch.
+    """
+    n = graph.node_count
+    scores = np.zeros(n)
+    samples = betweenness_sample_size(n, epsilon, delta)
+    if n < 3:
+        return scores
+
+    offsets, targets = csr_arrays(graph)
+    if samples < n:
+        sources = np.random.default_rng(seed).choice(n, samples, replace=False)
+    else:
+        sources = np.arange(n)
+
+    batch = max(1, min(len(sources), BETWEENNESS_BATCH_PAIRS // n))
+    seen = np.zeros(batch * n, dtype=bool)
+
+    for first in range(0, len(sources), batch):
+        batch_sources = sources[first:first + batch]
+        keys = np.arange(len(batch_sources)) * n + batch_sources
+        sigma = np.ones(len(keys))
+        seen[keys] = True
+        levels = [(keys, sigma)]
+        links = []
+
+        # Forward: breadth-first levels with shortest-path counts
+        while True:
+            nodes = keys % n
+            positions, counts = gather_edges(offsets, nodes)
+            tails = np.repeat(np.arange(len(keys)), counts)
+            heads = keys[tails] - nodes[tails] + targets[positions]
+            # Edges into concepts first reached at this level lie on shortest paths
+            shortest = ~seen[heads]
+            tails, heads = tails[shortest], heads[shortest]
+            if heads.size == 0:
+                break
+            keys, heads = np.unique(heads, return_inverse=True)
+            sigma = np.bincount(heads, weights=levels[-1][1][tails], minlength=len(keys))
+            seen[keys] = True
+            levels.append((keys, sigma))
+            links.append((tails, heads))
+
+        # Backward: accumulate dependencies from the deepest level up
+        dependency = np.zeros(len(levels[-1][0]))
+        dependencies = []
+        for (keys, sigma), (parent_keys, parent_sigma), (tails, heads) in zip(
+                reversed(levels), reversed(levels[:-1]), reversed(links)):
+            dependencies.append(dependency)
+            flow = parent_sigma[tails] / sigma[heads] * (1 + dependency[heads])
+            dependency = np.bincount(tails, weights=flow, minlength=len(parent_keys))
+
+        # Sources themselves (level 0) do not count towards their own searches
+        if dependencies:
+            reached = np.concatenate([keys for keys, _ in reversed(levels[1:])]) % n
+            scores += np.bincount(reached, weights=np.concatenate(dependencies), minlength=n)
+
+        for keys, _ in levels:
+            seen[keys] = False
+
+    return scores * (n / len(sources)) / ((n - 1) * (n - 2))
+
+
+def structural_metrics(graph: LearningGraph, transitive: bool = True,
+                       centrality: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Compute the metric columns for a graph, indexed by dense node index.
+
+    Args:
+        graph: Graph to measure
+        transitive: Also count ancestors and descendants.  This is the only
+                    superlinear step (O(V*E/64) word operations), so callers
+                    may skip it on very large graphs.
+        centrality: Also compute PageRank and approximate betweenness
+    """
+    n = graph.node_count
+    prereq_offsets, prereq_targets = csr_arrays(graph)
+
+    up_levels = topological_levels(graph)
+    down_levels = topological_levels(graph, reverse=True)
+    height = np.zeros(n, dtype=np.int64)
+    for level, nodes in enumerate(up_levels, 1):
+        height[nodes] = level
+    depth = np.zeros(n, dtype=np.int64)
+    for level, nodes in enumerate(down_levels, 1):
+        depth[nodes] = level
+
+    metrics = {
+        'in_degree': np.bincount(prereq_targets, minlength=n),
+        'out_degree': np.diff(prereq_offsets),
+        'height': height,
+        'depth': depth,
+    }
+    if transitive:
+        metrics['ancestors'] = transitive_counts(graph, up_levels)
+        metrics['descendants'] = transitive_counts(graph, down_levels, reverse=True)
+    if centrality:
+        metrics['pagerank'] = pagerank(graph)
+        metrics['betweenness'] = approximate_betweenness(graph)
+    return metrics
+
+
+def value_counts(values: np.ndarray) -> Dict[int, int]:
+    """Map each non-negative value -> number of times it occurs, via bincount."""
+    counts = np.bincount(values)
+    present = np.flatnonzero(counts)
+    return dict(zip(present.tolist(), counts[present].tolist()))
+
+
+def write_metrics_csv(graph: LearningGraph, metrics: Dict[str, np.ndarray], output_path: str):
+    """Write one row per concept with a column per computed metric."""
+    names = [name for name in METRIC_COLUMNS if name in metrics]
+    columns = [[f"{value:.6g}" for value in metrics[name].tolist()]
+               if metrics[name].dtype.kind == 'f' else metrics[name].tolist()
+               for name in names]
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ConceptID', 'ConceptLabel'] + names)
+        for i, row in enumerate(zip(*columns)):
+            writer.writerow([graph.ids[i], graph.labels[i], *row])
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python graph_metrics.py <input_csv> <output_metrics.csv>")
+        print("\nExample:")
+        print("  python graph_metrics.py learning-graph.csv concept-metrics.csv")
+        sys.exit(1)
+
+    from graph_cache import load_graph_cached
+
+    graph = load_graph_cached(sys.argv[1])
+    write_metrics_csv(graph, structural_metrics(graph), sys.argv[2])
+    print(f"✅ Concept metrics written: {sys.argv[2]}")
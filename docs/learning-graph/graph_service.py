@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Query Service
+
+Small local HTTP/JSON service that loads a learning graph once and answers
+queries from authoring tools and MicroSims without reparsing the CSV.
+Built on asyncio streams from the standard library; connections are
+served concurrently and kept alive between requests.
+
+Endpoints (GET):
+
+    /health                          liveness check
+    /summary                         concept/dependency counts, DAG status, max chain
+    /concepts/<id>                   label, taxonomy, degrees and structural metrics
+    /concepts/<id>/ancestors         transitive prerequisites, in learning order
+    /concepts/<id>/descendants       concepts that build on it, in learning order
+    /concepts/<id>/chain             longest prerequisite chain ending at the concept
+    /path?targets=<id>,<id>,...      everything needed to reach the targets, in order
+
+Ancestor and descendant sets come from cached LearningPathPlanner instances;
+per-concept metrics come from graph_metrics when NumPy is installed.
+
+Usage: python graph_service.py <input_csv> [--host 127.0.0.1] [--port 8765]
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from graph_cache import load_graph_cached
+from learning_graph import LearningGraph
+from learning_path import LearningPathPlanner
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           409: 'Conflict', 500: 'Internal Server Error'}
+
+
+class QueryError(Exception):
+    """A request that cannot be answered, with its HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class GraphQueryService:
+    """
+    In-memory query indexes for one learning graph.
+
+    Args:
+        graph: Loaded learning graph
+        metrics: Compute per-concept structural metrics (needs NumPy)
+    """
+
+    def __init__(self, graph: LearningGraph, metrics: bool = True):
+        self.graph = graph
+        self.ancestors = LearningPathPlanner(graph)
+        self.descendants = LearningPathPlanner(graph, reverse=True)
+        self.in_degrees = graph.in_degrees()
+        self.out_degrees = graph.out_degrees()
+        self.metrics = self._structural_metrics(graph) if metrics else None
+
+        heights, _ = graph.chain_heights()
+        self.summary = {
+            'concepts': graph.node_count,
+            'dependencies': graph.edge_count,
+            'is_dag': len(graph.topological_order()) == graph.node_count,
+            'max_chain_length': max(heights, default=0),
+            'metrics': self.metrics is not None,
+        }
+
+    @staticmethod
+    def _structural_metrics(graph: LearningGraph):
+        try:
+            from graph_metrics import TRANSITIVE_NODE_LIMIT, structural_metrics
+        except ImportError:
+            print("⚠️  NumPy not found; serving concepts without structural metrics (pip install numpy)")
+            return None
+        return structural_metrics(graph, transitive=graph.node_count <= TRANSITIVE_NODE_LIMIT)
+
+    def _node(self, concept_id: str) -> int:
+        try:
+            node = self.graph.index.get(int(concept_id))
+        except ValueError:
+            raise QueryError(400, f"ConceptID must be an integer: {concept_id!r}")
+        if node is None:
+            raise QueryError(404, f"Unknown ConceptID {concept_id}")
+        return node
+
+    def _plan(self, planner: LearningPathPlanner, concept_ids: List[int]) -> List[int]:
+        try:
+            return planner.plan(concept_ids)
+        except ValueError as e:
+            raise QueryError(409, str(e))
+
+    def _labelled(self, concept_ids: List[int]) -> List[Dict]:
+        labels, index = self.graph.labels, self.graph.index
+        return [{'id': cid, 'label': labels[index[cid]]} for cid in concept_ids]
+
+    def concept(self, node: int) -> Dict:
+        graph = self.graph
+        result = {
+            'id': graph.ids[node],
+            'label': graph.labels[node],
+            'taxonomy': graph.taxonomies[node],
+            'prerequisites': [graph.ids[i] for i in graph.prerequisites(node)],
+            'in_degree': self.in_degrees[node],
+            'out_degree': self.out_degrees[node],
+        }
+        if self.metrics is not None:
+            result['metrics'] = {name: values[node].item() for name, values in self.metrics.items()}
+        return result
+
+    def handle(self, method: str, target: str) -> Dict:
+        """
+        Answer one request.
+
+        Raises:
+            QueryError: for unknown routes, bad parameters or concepts
+        """
+        if method != 'GET':
+            raise QueryError(405, f"Only GET is supported, not {method}")
+
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+
+        if parts == ['health']:
+            return {'status': 'ok'}
+        if parts == ['summary']:
+            return self.summary
+        if parts == ['path']:
+            raw = ','.join(parse_qs(url.query).get('targets', []))
+            if not raw:
+                raise QueryError(400, "Missing targets=<id>,<id>,...")
+            nodes = [self._node(cid) for cid in raw.split(',') if cid]
+            path = self._plan(self.ancestors, [self.graph.ids[node] for node in nodes])
+            return {'targets': [self.graph.ids[node] for node in nodes],
+                    'count': len(path), 'path': self._labelled(path)}
+
+        if parts and parts[0] == 'concepts' and len(parts) in (2, 3):
+            node = self._node(parts[1])
+            concept_id = self.graph.ids[node]
+            query = parts[2] if len(parts) == 3 else None
+            if query is None:
+                return self.concept(node)
+            if query == 'ancestors':
+                ancestors = self._plan(self.ancestors, [concept_id])[:-1]
+                return {'id': concept_id, 'count': len(ancestors), 'ancestors': ancestors}
+            if query == 'descendants':
+                descendants = self._plan(self.descendants, [concept_id])[1:]
+                return {'id': concept_id, 'count': len(descendants), 'descendants': descendants}
+            if query == 'chain':
+                heights, _ = self.graph.chain_heights()
+                if heights[node] == 0:
+                    raise QueryError(409, f"Concept {concept_id} is on or behind a cycle; "
+                                          "run analyze-graph.py to list the cycles")
+                chain = [self.graph.ids[i] for i in self.graph.chain_to(node)]
+                return {'id': concept_id, 'length': len(chain), 'chain': self._labelled(chain)}
+
+        raise QueryError(404, f"No such endpoint: {url.path}")
+
+    def respond(self, method: str, target: str) -> Tuple[int, Dict]:
+        """(status, JSON payload) for one request; never raises."""
+        try:
+            return 200, self.handle(method, target)
+        except QueryError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one connection until it closes."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = await _read_headers(reader)
+                length = int(headers.get('content-length', 0) or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                parts = request_line.decode('latin-1').split()
+                if len(parts) == 3:
+                    status, payload = self.respond(parts[0], parts[1])
+                    keep_alive = (parts[2] == 'HTTP/1.1'
+                                  and headers.get('connection', '').lower() != 'close')
+                else:
+                    status, payload = 400, {'error': 'Malformed request line'}
+                    keep_alive = False
+
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1')
+                    + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def serve(csv_path: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                ready: Optional[asyncio.Event] = None):
+    """Load a graph and serve queries until cancelled."""
+    start = time.perf_counter()
+    service = GraphQueryService(load_graph_cached(csv_path))
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"✅ Serving {service.summary['concepts']} concepts from {csv_path} "
+          f"on http://{host}:{port} (loaded in {time.perf_counter() - start:.2f} s)", flush=True)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = sys.argv[1:]
+    options = {'--host': DEFAULT_HOST, '--port': str(DEFAULT_PORT)}
+    for name in options:
+        if name in args:
+            i = args.index(name)
+            options[name] = args[i + 1]
+            del args[i:i + 2]
+
+    if len(args) != 1:
+        print("Usage: python graph_service.py <input_csv> [--host 127.0.0.1] [--port 8765]")
+        print("\nExample:")
+        print("  python graph_service.py learning-graph.csv")
+        print("  curl http://127.0.0.1:8765/concepts/42/ancestors")
+        sys.exit(1)
+
+    try:
+        asyncio.run(serve(args[0], options['--host'], int(options['--port'])))
+    except KeyboardInterrupt:
+        pass
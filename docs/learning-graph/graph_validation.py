@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Validation
+
+Schema and structural checks for the graph-viewer JSON written by
+csv-to-json.py.
+
+compile_schema() turns a JSON schema into a validation function once per
+process.  With fastjsonschema installed the schema is compiled to Python
+source, which is cached on disk keyed by the SHA-256 of the schema file,
+so later runs import the compiled validator instead of regenerating it.
+Without it, jsonschema is used (much slower on large graphs).
+
+check_graph() finds duplicate node IDs, edges to missing nodes and
+orphan nodes in one pass over the nodes and one over the edges.
+
+validate_stream() does both without loading the file: nodes and edges are
+parsed one at a time from fixed-size blocks and validated against the item
+subschemas, keeping only compact ConceptID arrays for the structural checks.
+Errors carry the element index and its byte offset in the file.
+
+validate_batch() checks many files against one schema over a process
+pool; each worker loads the compiled schema once.
+
+Cache files live in $LEARNING_GRAPH_CACHE_DIR, or ~/.cache/learning-graph
+by default, next to the graph caches of graph_cache.py.
+
+Usage: python graph_validation.py <graph_json> <schema_json>
+"""
+
+import codecs
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import types
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from graph_cache import file_digest, default_cache_dir
+
+# Compiled validators by schema digest, shared by every call in a process
+_compiled: Dict[str, Callable[[dict], None]] = {}
+# compile_stream_schema() results by schema file digest
+_stream_compiled: Dict[str, tuple] = {}
+
+# Streaming validation reads the data file in blocks of this many bytes
+STREAM_BLOCK_BYTES = 1 << 16
+# Longest single value (metadata, groups, one node or edge) read while streaming
+MAX_VALUE_CHARS = 1 << 24
+# A decode error this close to the end of the buffer may be a value cut off
+# by the block boundary (a partial literal or \u escape), so more is read
+TRUNCATED_TAIL_CHARS = 12
+# Dangling edges described by validate_stream(); the rest are only counted
+MAX_REPORTED_EDGES = 100
+# Orphans listed by label in reports; more than this are only counted
+SHOWN_ORPHANS = 10
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a document does not match the schema."""
+
+    def __init__(self, message: str, path: List, context: Optional[List[str]] = None,
+                 offset: Optional[int] = None):
+        super().__init__(message)
+        self.message = message
+        self.path = path
+        self.context = context or []
+        self.offset = offset
+
+
+def compile_schema(schema_path: str, cache_dir: Optional[str] = None) -> Callable[[dict], None]:
+    """
+    Build a validation function for a JSON schema file.
+
+    The returned function raises SchemaValidationError for the first
+    problem found in a document.  A schema that is not valid JSON or not a
+    valid schema raises ValueError here.
+    """
+    digest = file_digest(schema_path)
+    if digest in _compiled:
+        return _compiled[digest]
+
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    return _compile(schema, digest, cache_dir)
+
+
+def _compile(schema: dict, digest: str, cache_dir: Optional[str]) -> Callable[[dict], None]:
+    if digest in _compiled:
+        return _compiled[digest]
+
+    try:
+        import fastjsonschema  # noqa: F401
+    except ImportError:
+        validate = _jsonschema_validator(schema)
+    else:
+        directory = Path(cache_dir) if cache_dir else default_cache_dir()
+        validate = _fastjsonschema_validator(schema, directory / f"{digest}.schema.py")
+
+    _compiled[digest] = validate
+    return validate
+
+
+def _fastjsonschema_validator(schema: dict, path: Path) -> Callable[[dict], None]:
+    import fastjsonschema
+
+    module = None
+    if path.exists():
+        module = _import_compiled(path)
+        if module is not None and getattr(module, 'VERSION', None) != fastjsonschema.VERSION:
+            module = None
+
+    if module is None:
+        try:
+            code = fastjsonschema.compile_to_code(schema)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            raise ValueError(str(e)) from e
+        try:
+            _write_atomic(path, code)
+            module = _import_compiled(path)
+        except OSError:
+            pass
+        if module is None:
+            module = types.ModuleType('compiled_schema')
+            exec(compile(code, str(path), 'exec'), module.__dict__)
+
+    def validate(document: dict) -> None:
+        try:
+            module.validate(document)
+        except fastjsonschema.JsonSchemaValueException as e:
+            steps = e.path[1:]
+            path = [int(step) if step.isdigit() else step for step in steps]
+            raise SchemaValidationError(e.message, path) from None
+
+    return validate
+
+
+def _import_compiled(path: Path):
+    """Import a cached compiled schema; None if it cannot be loaded."""
+    spec = importlib.util.spec_from_file_location(f"compiled_schema_{path.stem[:16]}", path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    return module
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _jsonschema_validator(schema: dict) -> Callable[[dict], None]:
+    try:
+        import jsonschema
+    except ImportError:
+        raise ImportError("Validation needs fastjsonschema or jsonschema: "
+                          "pip install fastjsonschema") from None
+
+    cls = jsonschema.validators.validator_for(schema)
+    try:
+        cls.check_schema(schema)
+    except jsonschema.SchemaError as e:
+        raise ValueError(e.message) from e
+    validator = cls(schema)
+
+    def validate(document: dict) -> None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(document))
+        if error is not None:
+            raise SchemaValidationError(error.message, list(error.absolute_path),
+                                        [suberror.message for suberror in error.context])
+
+    return validate
+
+
+def check_graph(nodes: Iterable[dict], edges: Iterable[dict]) -> dict:
+    """
+    Structural checks on schema-valid nodes and edges.
+
+    Returns:
+        Dict with 'duplicates' (repeated node IDs, in order of first repeat),
+        'invalid_edges' (descriptions of edges to missing nodes) and
+        'orphans' (labels of nodes without edges, in node order)
+    """
+    labels: Dict[int, str] = {}
+    duplicates: Dict[int, None] = {}
+    for node in nodes:
+        node_id = node['id']
+        if node_id in labels:
+            duplicates[node_id] = None
+        else:
+            labels[node_id] = node['label']
+
+    connected = set()
+    invalid_edges = []
+    for edge in edges:
+        source, target = edge['from'], edge['to']
+        connected.add(source)
+        connected.add(target)
+        if source not in labels:
+            invalid_edges.append(f"Edge from {source} -> {target}: source node {source} doesn't exist")
+        if target not in labels:
+            invalid_edges.append(f"Edge from {source} -> {target}: target node {target} doesn't exist")
+
+    orphans = [label for node_id, label in labels.items() if node_id not in connected]
+    return {'duplicates': list(duplicates), 'invalid_edges': invalid_edges, 'orphans': orphans}
+
+
+class _JsonStream:
+    """Incremental reader for one JSON document that tracks byte offsets."""
+
+    def __init__(self, f):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.scanner = json.JSONDecoder()
+        self.buffer = ''
+        self.ascii = True
+        self.pos = 0
+        self.start = 0     # buffer position of the last value read
+        self.base = 0      # file byte offset of buffer[0]
+        self.eof = False
+
+    def offset(self, pos: Optional[int] = None) -> int:
+        """File byte offset of a buffer position (default: the current one)."""
+        pos = self.pos if pos is None else pos
+        if self.ascii:
+            return self.base + pos
+        return self.base + len(self.buffer[:pos].encode('utf-8'))
+
+    def fail(self, message: str, pos: Optional[int] = None):
+        raise ValueError(f"{message} (byte {self.offset(pos)})")
+
+    def _fill(self) -> bool:
+        """Drop consumed text and read another block; False at end of file."""
+        if self.eof:
+            return False
+        block = self.f.read(STREAM_BLOCK_BYTES)
+        self.eof = not block
+        self.base = self.offset()
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(block, final=self.eof)
+        self.ascii = self.buffer.isascii()
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        """Next non-whitespace character, not consumed ('' at end of file)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            self.fail(f"Expecting {' or '.join(repr(c) for c in chars)}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """
+        Decode the next JSON value, reading more blocks as needed.
+
+        More is read only when the value may be cut off by the end of the
+        buffer; any other decode error is raised at once.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.scanner.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof or not (e.pos >= len(self.buffer) - TRUNCATED_TAIL_CHARS
+                                    or e.msg.startswith('Unterminated string')):
+                    self.fail(e.msg, e.pos)
+            else:
+                # A number may continue in the next block ("1." of "1.5", "2e" of "2e8")
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if self.eof or end < len(self.buffer) - (2 if is_number else 0):
+                    self.start, self.pos = self.pos, end
+                    return value
+            if len(self.buffer) - self.pos > MAX_VALUE_CHARS:
+                self.fail(f"Value longer than {MAX_VALUE_CHARS:,} characters")
+            self._fill()
+
+
+def _walk_graph(stream: _JsonStream):
+    """
+    Walk a graph document one value at a time.
+
+    Yields:
+        ('item', key, index, item) for each element of 'nodes' and 'edges',
+        ('end', key, count, None) after each of those arrays, and
+        ('value', key, None, value) for every other top-level value
+    """
+    stream.expect('{')
+    more = stream.peek() != '}'
+    if not more:
+        stream.pos += 1
+    while more:
+        key = stream.value()
+        if not isinstance(key, str):
+            stream.fail("Expecting property name", stream.start)
+        stream.expect(':')
+        if key not in ('nodes', 'edges') or stream.peek() != '[':
+            yield 'value', key, None, stream.value()
+        else:
+            stream.expect('[')
+            index = 0
+            while stream.peek() != ']':
+                if index:
+                    stream.expect(',')
+                try:
+                    item = stream.value()
+                except ValueError as e:
+                    raise ValueError(f"{key}[{index}]: {e}") from None
+                yield 'item', key, index, item
+                index += 1
+            stream.expect(']')
+            yield 'end', key, index, None
+        more = stream.expect(',}') == ','
+    if stream.peek():
+        stream.fail("Extra data")
+
+
+def node_labels(data_path: str, concept_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Labels of some nodes of a graph JSON file, read by streaming it again.
+
+    validate_stream() keeps only ConceptIDs; this recovers the labels of a
+    few of them (such as orphans) without loading the file.
+    """
+    wanted = set(concept_ids)
+    labels: Dict[int, str] = {}
+    with open(data_path, 'rb') as f:
+        for event, key, _, item in _walk_graph(_JsonStream(f)):
+            if event == 'item' and key == 'nodes' and item['id'] in wanted:
+                labels.setdefault(item['id'], item['label'])
+            elif event == 'end' and key == 'nodes':
+                break
+    return labels
+
+
+def stream_orphans(data_path: str, orphan_ids: List[int]) -> List[str]:
+    """
+    Orphans from validate_stream() in the form check_graph() reports them.
+
+    When there are few enough to list (SHOWN_ORPHANS) their labels are read
+    with a second streaming pass, in file order; a longer list is only
+    counted, so it is returned as ConceptIDs.
+    """
+    if not 0 < len(orphan_ids) <= SHOWN_ORPHANS:
+        return [str(node_id) for node_id in orphan_ids]
+    return list(node_labels(data_path, orphan_ids).values())
+
+
+def _resolve(root: dict, schema) -> dict:
+    """Follow local $refs ('#/definitions/node') to the subschema they name."""
+    while isinstance(schema, dict) and str(schema.get('$ref', '')).startswith('#'):
+        target = root
+        for part in schema['$ref'][1:].split('/')[1:]:
+            target = target[part.replace('~1', '/').replace('~0', '~')]
+        schema = target
+    return schema if isinstance(schema, dict) else {}
+
+
+def compile_stream_schema(schema_path: str, cache_dir: Optional[str] = None):
+    """
+    Split a graph schema for streaming validation.
+
+    Returns:
+        (validate_rest, validate_item, limits): a validator for the document
+        with 'nodes' and 'edges' emptied, validators for one node and one
+        edge by array name, and (minItems, maxItems) for each array
+    """
+    digest = file_digest(schema_path)
+    if digest in _stream_compiled:
+        return _stream_compiled[digest]
+
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+
+    rest = copy.deepcopy(schema)
+    shared = {key: schema[key] for key in ('$schema', 'definitions', '$defs') if key in schema}
+    validate_item, limits = {}, {}
+    for key in ('nodes', 'edges'):
+        array_schema = _resolve(schema, schema.get('properties', {}).get(key, {}))
+        item_schema = {**shared, **_resolve(schema, array_schema.get('items', {}))}
+        validate_item[key] = _compile(item_schema, _schema_digest(item_schema), cache_dir)
+        limits[key] = (array_schema.get('minItems', 0), array_schema.get('maxItems'))
+        if key in rest.get('properties', {}):
+            rest['properties'][key] = {'type': 'array'}
+
+    compiled = (_compile(rest, _schema_digest(rest), cache_dir), validate_item, limits)
+    _stream_compiled[digest] = compiled
+    return compiled
+
+
+def _schema_digest(schema: dict) -> str:
+    text = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def validate_stream(data_path: str, schema_path: str, cache_dir: Optional[str] = None,
+                    compiled: Optional[tuple] = None) -> dict:
+    """
+    Validate a graph JSON file without loading it whole.
+
+    Nodes and edges are decoded one at a time and checked against the item
+    subschemas as they arrive; the rest of the document is checked once the
+    file has been read.  Only node IDs (8 bytes each) and a connected flag
+    per node are kept for the structural checks, plus the endpoints of any
+    edges that appear before the nodes.
+
+    Args:
+        data_path: Graph JSON file
+        schema_path: JSON schema file
+        cache_dir: Compiled schema cache directory
+        compiled: compile_stream_schema() result for schema_path, when the
+            caller has already compiled it
+
+    Raises:
+        SchemaValidationError: with the element index in path and the
+            element's byte offset in offset
+        ValueError: malformed JSON, with the byte offset in the message
+
+    Returns:
+        Dict with the top-level values other than 'nodes' and 'edges'
+        ('document'), 'node_count', 'edge_count', 'duplicates',
+        'invalid_edges' (the first MAX_REPORTED_EDGES descriptions),
+        'invalid_edge_count' and 'orphans' (ConceptIDs, in ID order)
+    """
+    validate_rest, validate_item, limits = compiled or compile_stream_schema(schema_path, cache_dir)
+
+    document = {}
+    counts = {'nodes': 0, 'edges': 0}
+    ids = array('q')
+    in_order = True
+    duplicates: Dict[int, None] = {}
+    connected = None                # bytearray once all nodes are read
+    pending = array('q')            # from, to, index, offset of early edges
+    invalid_edges: List[str] = []
+    invalid_count = 0
+
+    def check_edge(source: int, target: int, index: int, offset: int) -> None:
+        nonlocal invalid_count
+        for end, node_id in (('source', source), ('target', target)):
+            pos = bisect_left(ids, node_id)
+            if pos < len(ids) and ids[pos] == node_id:
+                connected[pos] = 1
+                continue
+            invalid_count += 1
+            if len(invalid_edges) < MAX_REPORTED_EDGES:
+                invalid_edges.append(f"edges[{index}] at byte {offset}: Edge from {source} -> "
+                                     f"{target}: {end} node {node_id} doesn't exist")
+
+    def finish_nodes() -> None:
+        nonlocal ids, connected
+        if not in_order:
+            unique = array('q')
+            for node_id in sorted(ids):
+                if unique and unique[-1] == node_id:
+                    duplicates[node_id] = None
+                else:
+                    unique.append(node_id)
+            ids = unique
+        connected = bytearray(len(ids))
+        for i in range(0, len(pending), 4):
+            check_edge(*pending[i:i + 4])
+        del pending[:]
+
+    def check_ids(key: str, index: int, item) -> List[int]:
+        """Validate one node or edge; return its ConceptIDs."""
+        try:
+            validate_item[key](item)
+            values = [item['id']] if key == 'nodes' else [item['from'], item['to']]
+            if not all(type(value) is int for value in values):
+                raise SchemaValidationError("ConceptIDs must be integers", [])
+        except SchemaValidationError as e:
+            message = e.message
+            if message.startswith('data'):
+                message = f"data.{key}[{index}]{message[4:]}"
+            raise SchemaValidationError(message, [key, index] + e.path, e.context,
+                                        stream.offset(stream.start)) from None
+        return values
+
+    with open(data_path, 'rb') as f:
+        stream = _JsonStream(f)
+        for event, key, index, value in _walk_graph(stream):
+            if event == 'value':
+                document[key] = value
+            elif event == 'end':
+                document[key] = []
+                counts[key] = index
+                if key == 'nodes':
+                    finish_nodes()
+            elif key == 'nodes':
+                node_id, = check_ids(key, index, value)
+                if ids and node_id == ids[-1]:
+                    duplicates[node_id] = None
+                else:
+                    in_order = in_order and (not ids or node_id > ids[-1])
+                    ids.append(node_id)
+            else:
+                source, target = check_ids(key, index, value)
+                if connected is not None:
+                    check_edge(source, target, index, stream.offset(stream.start))
+                else:
+                    pending.extend((source, target, index, stream.offset(stream.start)))
+
+    if connected is None:
+        finish_nodes()
+
+    validate_rest(document)
+    for key, (minimum, maximum) in limits.items():
+        if key in document and counts[key] < minimum:
+            raise SchemaValidationError(f"{key} must contain at least {minimum} items", [key])
+        if key in document and maximum is not None and counts[key] > maximum:
+            raise SchemaValidationError(f"{key} must contain at most {maximum} items", [key])
+
+    return {'document': {key: value for key, value in document.items() if key not in counts},
+            'node_count': counts['nodes'], 'edge_count': counts['edges'],
+            'duplicates': list(duplicates), 'invalid_edges': invalid_edges,
+            'invalid_edge_count': invalid_count,
+            'orphans': [node_id for node_id, flag in zip(ids, connected) if not flag]}
+
+
+def validate_file(data_path: str, schema_path: str, stream: bool = False,
+                  cache_dir: Optional[str] = None) -> dict:
+    """
+    Validate one graph file for a batch run, reporting problems instead of raising.
+
+    Returns:
+        Dict with 'file', 'status' ('passed', 'failed', or 'error' when the
+        file cannot be read), 'seconds', 'node_count', 'edge_count',
+        'message', 'path' and 'offset' of the failure, and 'warnings'
+        (duplicate IDs, invalid edges, orphans)
+    """
+    result = {'file': data_path, 'status': 'passed', 'seconds': 0.0, 'node_count': 0,
+              'edge_count': 0, 'message': None, 'path': None, 'offset': None, 'warnings': []}
+    start = time.perf_counter()
+    try:
+        if stream:
+            checks = validate_stream(data_path, schema_path, cache_dir)
+            orphans = stream_orphans(data_path, checks['orphans'])
+            invalid_count = checks['invalid_edge_count']
+        else:
+            validate = compile_schema(schema_path, cache_dir)
+            with open(data_path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            validate(document)
+            checks = check_graph(document.get('nodes', []), document.get('edges', []))
+            checks['node_count'] = len(document.get('nodes', []))
+            checks['edge_count'] = len(document.get('edges', []))
+            orphans = checks['orphans']
+            invalid_count = len(checks['invalid_edges'])
+    except SchemaValidationError as e:
+        result.update(status='failed', message=e.message, path=e.path, offset=e.offset)
+    except ValueError as e:
+        result.update(status='failed', message=f"Not valid JSON: {e}")
+    except OSError as e:
+        result.update(status='error', message=str(e))
+    else:
+        result['node_count'], result['edge_count'] = checks['node_count'], checks['edge_count']
+        warnings = result['warnings']
+        if checks['duplicates']:
+            warnings.append(f"Duplicate node IDs: {', '.join(map(str, checks['duplicates']))}")
+        warnings.extend(checks['invalid_edges'][:5])
+        if invalid_count > 5:
+            warnings.append(f"... and {invalid_count - 5} more invalid edges")
+        if orphans:
+            shown = f": {', '.join(orphans)}" if len(orphans) <= SHOWN_ORPHANS else ""
+            warnings.append(f"{len(orphans)} orphan nodes{shown}")
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _init_worker(schema_path: str, stream: bool, cache_dir: Optional[str]) -> None:
+    # Load the compiled schema from the disk cache once per worker process
+    if stream:
+        compile_stream_schema(schema_path, cache_dir)
+    else:
+        compile_schema(schema_path, cache_dir)
+
+
+def validate_batch(data_paths: Sequence[str], schema_path: str, workers: Optional[int] = None,
+                   stream: bool = False, cache_dir: Optional[str] = None) -> List[dict]:
+    """
+    Validate many graph files against one schema.
+
+    The schema is compiled once here, which also fills the disk cache that
+    worker processes load it from.  Files are spread over a process pool;
+    with one worker (the default on a single-CPU machine) they are
+    validated in this process.
+
+    Args:
+        data_paths: Graph JSON files
+        schema_path: JSON schema file
+        workers: Worker processes (default: CPU count)
+        stream: Use validate_stream() for every file
+        cache_dir: Compiled schema cache directory
+
+    Raises:
+        ValueError: The schema is not valid JSON or not a valid schema
+
+    Returns:
+        validate_file() results, in the order of data_paths
+    """
+    _init_worker(schema_path, stream, cache_dir)
+    workers = min(workers or os.cpu_count() or 1, len(data_paths))
+    if workers <= 1:
+        return [validate_file(path, schema_path, stream, cache_dir) for path in data_paths]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(schema_path, stream, cache_dir)) as pool:
+        return list(pool.map(validate_file, data_paths, repeat(schema_path), repeat(stream),
+                             repeat(cache_dir)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python graph_validation.py <graph_json> <schema_json>")
+        print("\nTimes schema compilation, schema validation and the structural checks.")
+        print("\nExample:")
+        print("  python graph_validation.py learning-graph.json learning-graph-schema.json")
+        sys.exit(1)
+
+    json_path, schema_path = sys.argv[1:]
+    start = time.perf_counter()
+    validate = compile_schema(schema_path)
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(json_path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        validate(document)
+    except SchemaValidationError as e:
+        print(f"❌ {' -> '.join(str(p) for p in e.path)}: {e.message}")
+        sys.exit(1)
+    schema_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = check_graph(document['nodes'], document['edges'])
+    check_seconds = time.perf_counter() - start
+
+    print(f"✅ {json_path}: {len(document['nodes'])} nodes, {len(document['edges'])} edges")
+    print(f"   - Duplicate IDs: {len(result['duplicates'])}, invalid edges: "
+          f"{len(result['invalid_edges'])}, orphans: {len(result['orphans'])}")
+    print(f"   - Compile schema: {compile_seconds * 1000:.1f} ms")
+    print(f"   - Parse JSON: {load_seconds:.2f} s")
+    print(f"   - Schema validation: {schema_seconds:.2f} s")
+    print(f"   - Structural checks: {check_seconds:.2f} s")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Incremental Learning Graph
+
+Editable view of a LearningGraph that keeps a valid topological order as
+dependencies are added or removed (Pearce-Kelly dynamic topological sort).
+
+Adding a dependency only searches the nodes whose order positions lie
+between the two endpoints, so the cost is proportional to the affected
+region of the graph rather than to the whole graph.  A dependency that
+would create a cycle is rejected with the offending path.
+
+Usage: python incremental_graph.py <input_csv> <concept_id> <prerequisite_id>
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from learning_graph import LearningGraph
+
+
+class CycleError(ValueError):
+    """Raised when a dependency would make the learning graph cyclic."""
+
+    def __init__(self, message: str, path: List[int]):
+        super().__init__(message)
+        self.path = path
+
+
+class IncrementalGraph:
+    """
+    Concept dependency graph with online topological order maintenance.
+
+    Concepts are addressed by ConceptID.  Internally each concept has a
+    dense index and an order position; every prerequisite has a smaller
+    position than the concepts that depend on it.
+    """
+
+    def __init__(self, graph: LearningGraph):
+        order = graph.topological_order()
+        if len(order) != graph.node_count:
+            component = graph.cyclic_components()[0]
+            cycle = [graph.ids[i] for i in graph.witness_cycle(component)]
+            raise CycleError(f"Graph is not a DAG: {self._format_path(cycle, graph.concepts)}",
+                             cycle)
+
+        self.ids: List[int] = list(graph.ids)
+        self.labels: List[str] = list(graph.labels)
+        self.taxonomies: List[str] = list(graph.taxonomies)
+        self.index: Dict[int, int] = dict(graph.index)
+        self.prereqs: List[Set[int]] = [set(graph.prerequisites(i)) for i in range(graph.node_count)]
+        self.dependents: List[Set[int]] = [set(graph.dependents(i)) for i in range(graph.node_count)]
+
+        # position[node] is the node's slot in the order; node_at[slot] is the inverse
+        self.node_at: List[int] = list(order)
+        self.position: List[int] = [0] * graph.node_count
+        for slot, node in enumerate(order):
+            self.position[node] = slot
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> 'IncrementalGraph':
+        return cls(LearningGraph.from_csv(csv_path))
+
+    @staticmethod
+    def _format_path(path: List[int], labels: Dict[int, str]) -> str:
+        return ' → '.join(f"{labels.get(cid, cid)} ({cid})" for cid in path)
+
+    def _node(self, concept_id: int) -> int:
+        node = self.index.get(concept_id)
+        if node is None:
+            raise KeyError(f"Unknown ConceptID {concept_id}")
+        return node
+
+    def add_concept(self, concept_id: int, label: str, taxonomy: str = '') -> None:
+        """Add a concept with no dependencies at the end of the order."""
+        if concept_id in self.index:
+            raise ValueError(f"Duplicate ConceptID {concept_id}")
+
+        node = len(self.ids)
+        self.index[concept_id] = node
+        self.ids.append(concept_id)
+        self.labels.append(label)
+        self.taxonomies.append(taxonomy)
+        self.prereqs.append(set())
+        self.dependents.append(set())
+        self.position.append(len(self.node_at))
+        self.node_at.append(node)
+
+    def _reach_forward(self, start: int, upper: int) -> Tuple[List[int], Dict[int, int]]:
+        """Nodes reachable along dependent edges from start with position <= upper."""
+        parent = {start: -1}
+        visited = [start]
+        stack = [start]
+        position = self.position
+
+        while stack:
+            node = stack.pop()
+            for dependent in self.dependents[node]:
+                if dependent not in parent and position[dependent] <= upper:
+                    parent[dependent] = node
+                    visited.append(dependent)
+                    stack.append(dependent)
+
+        return visited, parent
+
+    def _reach_backward(self, start: int, lower: int) -> List[int]:
+        """Nodes reachable along prerequisite edges from start with position >= lower."""
+        seen = {start}
+        stack = [start]
+        position = self.position
+
+        while stack:
+            node = stack.pop()
+            for prereq in self.prereqs[node]:
+                if prereq not in seen and position[prereq] >= lower:
+                    seen.add(prereq)
+                    stack.append(prereq)
+
+        return list(seen)
+
+    def would_create_cycle(self, concept_id: int, prereq_id: int) -> Optional[List[int]]:
+        """
+        Check a dependency without adding it.
+
+        Returns:
+            The cycle as ConceptIDs (concept → ... → prerequisite → concept)
+            if the dependency would create one, otherwise None.
+        """
+        node = self._node(concept_id)
+        prereq = self._node(prereq_id)
+        if node == prereq:
+            return [concept_id, concept_id]
+        if self.position[prereq] < self.position[node]:
+            return None
+
+        _, parent = self._reach_forward(node, self.position[prereq])
+        return self._cycle_path(parent, prereq)
+
+    def _cycle_path(self, parent: Dict[int, int], prereq: int) -> Optional[List[int]]:
+        """The cycle closed by a new dependency on prereq, from a _reach_forward parent map."""
+        if prereq not in parent:
+            return None
+
+        path = []
+        step = prereq
+        while step != -1:
+            path.append(self.ids[step])
+            step = parent[step]
+        path.reverse()
+        return path + [path[0]]
+
+    def add_dependency(self, concept_id: int, prereq_id: int) -> None:
+        """
+        Record that a concept depends on a prerequisite.
+
+        The affected region is searched once in each direction: forward from
+        the concept (which also finds a cycle) and backward from the
+        prerequisite.
+
+        Raises:
+            CycleError: if the dependency would create a cycle
+        """
+        node = self._node(concept_id)
+        prereq = self._node(prereq_id)
+        if prereq in self.prereqs[node]:
+            return
+
+        lower = self.position[node]
+        upper = self.position[prereq]
+        cycle = [concept_id, concept_id] if node == prereq else None
+        if upper > lower:
+            forward, parent = self._reach_forward(node, upper)
+            cycle = self._cycle_path(parent, prereq)
+        if cycle is not None:
+            raise CycleError(
+                f"Making {concept_id} depend on {prereq_id} would create a cycle: "
+                f"{self._format_path(cycle, {cid: self.labels[self.index[cid]] for cid in cycle})}",
+                cycle)
+
+        if upper > lower:
+            # The prerequisite is currently ordered after the concept: move the
+            # concept's affected dependents after the prerequisite's affected
+            # ancestors, reusing the same set of order slots.
+            backward = self._reach_backward(prereq, lower)
+            forward.sort(key=self.position.__getitem__)
+            backward.sort(key=self.position.__getitem__)
+            moved = backward + forward
+            slots = sorted(self.position[i] for i in moved)
+            for i, slot in zip(moved, slots):
+                self.position[i] = slot
+                self.node_at[slot] = i
+
+        self.prereqs[node].add(prereq)
+        self.dependents[prereq].add(node)
+
+    def remove_dependency(self, concept_id: int, prereq_id: int) -> None:
+        """Remove a dependency. The current order stays valid, so nothing is reordered."""
+        node = self._node(concept_id)
+        prereq = self._node(prereq_id)
+        if prereq not in self.prereqs[node]:
+            raise KeyError(f"Concept {concept_id} does not depend on {prereq_id}")
+
+        self.prereqs[node].discard(prereq)
+        self.dependents[prereq].discard(node)
+
+    def topological_order(self) -> List[int]:
+        """ConceptIDs with every prerequisite before its dependents."""
+        return [self.ids[node] for node in self.node_at]
+
+    def to_graph(self) -> LearningGraph:
+        """Snapshot the current state as a CSR-indexed LearningGraph."""
+        dependencies = [[self.ids[p] for p in sorted(prereqs)] for prereqs in self.prereqs]
+        return LearningGraph(self.ids, self.labels, dependencies, self.taxonomies)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 4:
+        print("Usage: python incremental_graph.py <input_csv> <concept_id> <prerequisite_id>")
+        print("\nChecks whether a new dependency would create a cycle.")
+        print("\nExample:")
+        print("  python incremental_graph.py learning-graph.csv 42 17")
+        sys.exit(1)
+
+    editor = IncrementalGraph.from_csv(sys.argv[1])
+    concept_id, prereq_id = int(sys.argv[2]), int(sys.argv[3])
+    try:
+        editor.add_dependency(concept_id, prereq_id)
+    except CycleError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"✅ Concept {concept_id} can depend on {prereq_id} without creating a cycle")
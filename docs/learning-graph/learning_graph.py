@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Core Model
+
+Shared in-memory representation of a learning-graph CSV used by the
+analysis scripts in this directory.
+
+Each concept is assigned a dense internal index (0..n-1) in file order.
+Dependency edges are stored in compressed sparse row (CSR) form in both
+directions, so the prerequisites or dependents of a concept are a single
+slice of a flat integer array instead of a scan over every dependency list:
+
+- prerequisites of node i: prereq_targets[prereq_offsets[i]:prereq_offsets[i + 1]]
+- dependents of node i:    dependent_targets[dependent_offsets[i]:dependent_offsets[i + 1]]
+"""
+
+import csv
+from array import array
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+def _zeros(length: int) -> array:
+    """Return a zero-filled int32 array of the given length."""
+    return array('i', bytes(4 * length))
+
+
+def _reverse_csr(node_count: int, offsets: array, targets: array) -> Tuple[array, array]:
+    """Transpose a CSR adjacency with a counting sort in O(V+E)."""
+    rev_offsets = _zeros(node_count + 1)
+    for target in targets:
+        rev_offsets[target + 1] += 1
+    for i in range(node_count):
+        rev_offsets[i + 1] += rev_offsets[i]
+
+    cursor = array('i', rev_offsets)
+    rev_targets = _zeros(len(targets))
+    for source in range(node_count):
+        for pos in range(offsets[source], offsets[source + 1]):
+            target = targets[pos]
+            rev_targets[cursor[target]] = source
+            cursor[target] += 1
+
+    return rev_offsets, rev_targets
+
+
+class DisjointSet:
+    """
+    Union-find over dense integer elements with path halving and union by rank.
+
+    Elements are added one at a time, so edges can be merged as they are
+    read without first building an adjacency structure.
+    """
+
+    def __init__(self, size: int = 0):
+        self.parent = array('i', range(size))
+        self.rank = bytearray(size)
+        self.count = size  # number of disjoint components
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a new singleton element and return its index."""
+        element = len(self.parent)
+        self.parent.append(element)
+        self.rank.append(0)
+        self.count += 1
+        return element
+
+    def find(self, element: int) -> int:
+        """Return the root of an element's component."""
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the components of two elements. Returns False if already joined."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.count -= 1
+        return True
+
+    def component_sizes(self) -> Dict[int, int]:
+        """Mapping of component root -> number of elements."""
+        sizes: Dict[int, int] = {}
+        for element in range(len(self.parent)):
+            root = self.find(element)
+            sizes[root] = sizes.get(root, 0) + 1
+        return sizes
+
+    def components(self) -> Dict[int, List[int]]:
+        """Mapping of component root -> member elements."""
+        members: Dict[int, List[int]] = {}
+        for element in range(len(self.parent)):
+            members.setdefault(self.find(element), []).append(element)
+        return members
+
+
+def stream_components(csv_path: str) -> Tuple[DisjointSet, Dict[int, int]]:
+    """
+    Merge dependency edges into a DisjointSet straight from the CSV reader.
+
+    Only the ConceptID -> element mapping and the union-find arrays are
+    kept, so component counts and sizes are available without building
+    the full graph.
+
+    Returns:
+        (components, index) where index maps ConceptID -> element
+    """
+    components = DisjointSet()
+    index: Dict[int, int] = {}
+
+    def element(cid: int) -> int:
+        found = index.get(cid)
+        if found is None:
+            found = index[cid] = components.add()
+        return found
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            concept = element(int(row['ConceptID']))
+            if row['Dependencies']:
+                for dep in row['Dependencies'].split('|'):
+                    components.union(concept, element(int(dep)))
+
+    return components, index
+
+
+def read_rows(csv_path: str) -> Iterator[Tuple[int, str, List[int], str]]:
+    """
+    Yield (ConceptID, label, prerequisite ConceptIDs, TaxonomyID) from a CSV in file order.
+
+    Unlike LearningGraph.from_csv, duplicate ConceptIDs and dependencies on
+    unknown concepts are passed through, so report tools can still describe
+    a malformed CSV.
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            deps = row['Dependencies']
+            # Support both ConceptLabel and ConceptName column names
+            yield (int(row['ConceptID']),
+                   row.get('ConceptLabel') or row.get('ConceptName', ''),
+                   [int(d) for d in deps.split('|')] if deps else [],
+                   row.get('TaxonomyID') or '')
+
+
+class LearningGraph:
+    """
+    Concept dependency graph with CSR adjacency in both directions.
+
+    Args:
+        concept_ids: ConceptID of each node, in file order
+        labels: ConceptLabel of each node
+        dependencies: Prerequisite ConceptIDs of each node
+        taxonomies: Optional TaxonomyID of each node
+    """
+
+    def __init__(self, concept_ids: Sequence[int], labels: Sequence[str],
+                 dependencies: Sequence[Sequence[int]],
+                 taxonomies: Optional[Sequence[str]] = None):
+        self.ids = array('i', concept_ids)
+        self.labels = list(labels)
+        self.taxonomies = list(taxonomies) if taxonomies is not None else [''] * len(self.ids)
+
+        self.index: Dict[int, int] = {}
+        for i, cid in enumerate(self.ids):
+            if cid in self.index:
+                raise ValueError(f"Duplicate ConceptID {cid}")
+            self.index[cid] = i
+
+        n = len(self.ids)
+        self.prereq_offsets = _zeros(n + 1)
+        self.prereq_targets = array('i')
+        for i, deps in enumerate(dependencies):
+            for dep in deps:
+                target = self.index.get(dep)
+                if target is None:
+                    raise ValueError(
+                        f"Concept {self.ids[i]} depends on unknown ConceptID {dep}")
+                self.prereq_targets.append(target)
+            self.prereq_offsets[i + 1] = len(self.prereq_targets)
+
+        self.dependent_offsets, self.dependent_targets = _reverse_csr(
+            n, self.prereq_offsets, self.prereq_targets)
+
+        # Derived arrays are computed on first use and reused afterwards
+        self._topological_order: Optional[List[int]] = None
+        self._chain_heights: Optional[Tuple[array, array]] = None
+        self._cyclic_components: Optional[List[List[int]]] = None
+
+    @classmethod
+    def from_arrays(cls, ids: Sequence[int], labels: Sequence[str], taxonomies: Sequence[str],
+                    prereq_offsets: Sequence[int], prereq_targets: Sequence[int],
+                    dependent_offsets: Sequence[int],
+                    dependent_targets: Sequence[int]) -> 'LearningGraph':
+        """
+        Wrap prebuilt CSR arrays without copying them.
+
+        Used by the binary cache, which passes memory-mapped views.
+        """
+        graph = cls.__new__(cls)
+        graph.ids = ids
+        graph.labels = labels
+        graph.taxonomies = taxonomies
+        graph.index = {cid: i for i, cid in enumerate(ids)}
+        graph.prereq_offsets = prereq_offsets
+        graph.prereq_targets = prereq_targets
+        graph.dependent_offsets = dependent_offsets
+        graph.dependent_targets = dependent_targets
+        graph._topological_order = None
+        graph._chain_heights = None
+        graph._cyclic_components = None
+        return graph
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> 'LearningGraph':
+        """Parse a learning-graph CSV (ConceptID, ConceptLabel, Dependencies, TaxonomyID)."""
+        concept_ids = []
+        labels = []
+        dependencies = []
+        taxonomies = []
+        for concept_id, label, prereq_ids, taxonomy in read_rows(csv_path):
+            concept_ids.append(concept_id)
+            labels.append(label)
+            dependencies.append(prereq_ids)
+            taxonomies.append(taxonomy)
+        return cls(concept_ids, labels, dependencies, taxonomies)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.prereq_targets)
+
+    @property
+    def concepts(self) -> Dict[int, str]:
+        """Mapping of ConceptID -> ConceptLabel in file order."""
+        return dict(zip(self.ids, self.labels))
+
+    @property
+    def dependencies(self) -> Dict[int, List[int]]:
+        """Mapping of ConceptID -> prerequisite ConceptIDs for concepts that have any."""
+        ids = self.ids
+        offsets = self.prereq_offsets
+        targets = self.prereq_targets
+        return {ids[i]: [ids[t] for t in targets[offsets[i]:offsets[i + 1]]]
+                for i in range(len(ids)) if offsets[i + 1] > offsets[i]}
+
+    def rows(self) -> Iterator[Tuple[int, str, List[int], str]]:
+        """Yield (ConceptID, label, prerequisite ConceptIDs, TaxonomyID) in file order."""
+        ids = self.ids
+        offsets = self.prereq_offsets
+        targets = self.prereq_targets
+        for i in range(len(ids)):
+            yield (ids[i], self.labels[i],
+                   [ids[t] for t in targets[offsets[i]:offsets[i + 1]]],
+                   self.taxonomies[i])
+
+    def prerequisites(self, node: int) -> array:
+        """Dense indexes of the prerequisites of a node."""
+        return self.prereq_targets[self.prereq_offsets[node]:self.prereq_offsets[node + 1]]
+
+    def dependents(self, node: int) -> array:
+        """Dense indexes of the concepts that depend on a node."""
+        return self.dependent_targets[self.dependent_offsets[node]:self.dependent_offsets[node + 1]]
+
+    def out_degrees(self) -> List[int]:
+        """Number of prerequisites of each node."""
+        offsets = self.prereq_offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(self.ids))]
+
+    def in_degrees(self) -> List[int]:
+        """Number of dependents of each node."""
+        offsets = self.dependent_offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(self.ids))]
+
+    def topological_order(self) -> List[int]:
+        """
+        Order nodes so every prerequisite precedes its dependents (Kahn's algorithm).
+
+        Nodes that lie on or behind a cycle are omitted, so the graph is a DAG
+        exactly when the returned list covers every node.
+        """
+        if self._topological_order is not None:
+            return self._topological_order
+
+        remaining = self.out_degrees()
+        queue = deque(i for i, deg in enumerate(remaining) if deg == 0)
+        offsets = self.dependent_offsets
+        targets = self.dependent_targets
+        order = []
+
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for pos in range(offsets[node], offsets[node + 1]):
+                dependent = targets[pos]
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+
+        self._topological_order = order
+        return order
+
+    def chain_heights(self) -> Tuple[array, array]:
+        """
+        Longest prerequisite chain ending at each node.
+
+        A single dynamic-programming pass over the topological order keeps
+        only a length and a best predecessor per node.
+
+        Returns:
+            (height, predecessor) where height[i] is the number of concepts on
+            the longest chain ending at node i (1 for a foundational concept,
+            0 for nodes on or behind a cycle) and predecessor[i] is the
+            prerequisite on that chain, or -1.
+        """
+        if self._chain_heights is not None:
+            return self._chain_heights
+
+        n = len(self.ids)
+        height = _zeros(n)
+        predecessor = array('i', [-1]) * n
+        offsets = self.prereq_offsets
+        targets = self.prereq_targets
+
+        for node in self.topological_order():
+            best = 0
+            best_prereq = -1
+            for pos in range(offsets[node], offsets[node + 1]):
+                prereq = targets[pos]
+                if height[prereq] > best:
+                    best = height[prereq]
+                    best_prereq = prereq
+            height[node] = best + 1
+            predecessor[node] = best_prereq
+
+        self._chain_heights = (height, predecessor)
+        return self._chain_heights
+
+    def chain_to(self, node: int) -> List[int]:
+        """Dense indexes of the longest prerequisite chain ending at a node, foundation first."""
+        _, predecessor = self.chain_heights()
+        chain = []
+        while node != -1:
+            chain.append(node)
+            node = predecessor[node]
+        chain.reverse()
+        return chain
+
+    def cyclic_components(self) -> List[List[int]]:
+        """
+        Strongly connected components that contain a cycle (iterative Tarjan, O(V+E)).
+
+        Returns every component with more than one node, plus single nodes
+        that depend on themselves, as lists of dense indexes.
+        """
+        if self._cyclic_components is not None:
+            return self._cyclic_components
+
+        n = len(self.ids)
+        offsets = self.prereq_offsets
+        targets = self.prereq_targets
+        order = array('i', [-1]) * n
+        low = _zeros(n)
+        on_stack = bytearray(n)
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if order[root] != -1:
+                continue
+
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # Each work entry is (node, next edge position to explore)
+            work = [(root, offsets[root])]
+
+            while work:
+                node, pos = work[-1]
+                if pos < offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    next_node = targets[pos]
+                    if order[next_node] == -1:
+                        order[next_node] = low[next_node] = counter
+                        counter += 1
+                        stack.append(next_node)
+                        on_stack[next_node] = 1
+                        work.append((next_node, offsets[next_node]))
+                    elif on_stack[next_node] and order[next_node] < low[node]:
+                        low[node] = order[next_node]
+                    continue
+
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.prerequisites(node):
+                        components.append(component)
+
+        self._cyclic_components = components
+        return components
+
+    def witness_cycle(self, component: Sequence[int]) -> List[int]:
+        """
+        Shortest cycle through the first node of a cyclic component.
+
+        Runs a BFS along dependent edges restricted to the component and
+        returns the cycle as dense indexes, starting and ending at that node.
+        """
+        members = set(component)
+        start = component[0]
+        offsets = self.dependent_offsets
+        targets = self.dependent_targets
+        parent = {start: -1}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for pos in range(offsets[node], offsets[node + 1]):
+                next_node = targets[pos]
+                if next_node == start:
+                    cycle = [start]
+                    while node != -1:
+                        cycle.append(node)
+                        node = parent[node]
+                    cycle.reverse()
+                    return cycle
+                if next_node in members and next_node not in parent:
+                    parent[next_node] = node
+                    queue.append(next_node)
+
+        return []
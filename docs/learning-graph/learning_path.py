@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Learning Path Planner
+
+Answers "what must I learn, in which order, to reach concepts X, Y and Z":
+the union of the targets' transitive prerequisites (plus the targets
+themselves), listed in a valid topological order.
+
+Ancestor sets are computed on demand with a traversal of the prerequisite
+edges and kept in an LRU cache as bitsets indexed by topological position.
+A traversal stops at any concept whose set is already cached, repeated
+targets are a cache hit, and reading the set bits of the union gives the
+concepts already in learning order.
+
+With reverse=True the planner walks dependent edges instead and answers
+"what builds on these concepts", still listed in learning order.
+
+Usage: python learning_path.py <input_csv> <concept_id> [concept_id ...]
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List
+
+from graph_cache import load_graph_cached
+from learning_graph import LearningGraph
+from reachability import bit_positions
+
+# Ancestor bitsets kept per planner; each takes up to node_count / 8 bytes
+CACHE_SIZE = 1024
+
+
+class LearningPathPlanner:
+    """
+    Plans learning paths over one graph, caching ancestor sets between queries.
+
+    Args:
+        graph: Loaded learning graph
+        cache_size: Number of ancestor bitsets to keep
+        reverse: Plan over dependents (descendants) instead of prerequisites
+    """
+
+    def __init__(self, graph: LearningGraph, cache_size: int = CACHE_SIZE, reverse: bool = False):
+        self.graph = graph
+        self.cache_size = cache_size
+        self.reverse = reverse
+        if reverse:
+            self.offsets, self.targets = graph.dependent_offsets, graph.dependent_targets
+            self.order = graph.topological_order()[::-1]
+        else:
+            self.offsets, self.targets = graph.prereq_offsets, graph.prereq_targets
+            self.order = graph.topological_order()
+        # -1 marks concepts on or behind a cycle, which have no valid order
+        self.position = [-1] * graph.node_count
+        for slot, node in enumerate(self.order):
+            self.position[node] = slot
+        self._cache: 'OrderedDict[int, int]' = OrderedDict()
+
+    @classmethod
+    def from_csv(cls, csv_path: str, cache_size: int = CACHE_SIZE,
+                 reverse: bool = False) -> 'LearningPathPlanner':
+        return cls(load_graph_cached(csv_path), cache_size, reverse)
+
+    def _node(self, concept_id: int) -> int:
+        node = self.graph.index.get(concept_id)
+        if node is None:
+            raise KeyError(f"Unknown ConceptID {concept_id}")
+        if self.position[node] < 0:
+            raise ValueError(f"Concept {concept_id} is on or behind a cycle; "
+                             "run analyze-graph.py to list the cycles")
+        return node
+
+    def ancestor_bits(self, node: int) -> int:
+        """
+        Bitset (by order position) of a node's transitive prerequisites (or dependents).
+
+        Raises:
+            ValueError: when the traversal reaches a concept on or behind a
+                cycle, which has no position (only possible with reverse=True)
+        """
+        cache = self._cache
+        bits = cache.get(node)
+        if bits is not None:
+            cache.move_to_end(node)
+            return bits
+
+        offsets, targets, position = self.offsets, self.targets, self.position
+        marks = bytearray((len(self.order) + 7) // 8)
+        bits = 0
+        seen = {node}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for pos in range(offsets[current], offsets[current + 1]):
+                prereq = targets[pos]
+                if prereq in seen:
+                    continue
+                seen.add(prereq)
+                slot = position[prereq]
+                if slot < 0:
+                    raise ValueError(f"Concept {self.graph.ids[node]} leads to concept "
+                                     f"{self.graph.ids[prereq]}, which is on or behind a cycle; "
+                                     "run analyze-graph.py to list the cycles")
+                marks[slot >> 3] |= 1 << (slot & 7)
+                cached = cache.get(prereq)
+                if cached is not None:
+                    bits |= cached
+                else:
+                    stack.append(prereq)
+        bits |= int.from_bytes(marks, 'little')
+
+        cache[node] = bits
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return bits
+
+    def plan(self, target_ids: Iterable[int]) -> List[int]:
+        """
+        ConceptIDs needed to learn every target, prerequisites first.
+
+        With reverse=True: the targets and every concept that builds on
+        them, also prerequisites first.
+
+        Raises:
+            KeyError: for an unknown ConceptID
+            ValueError: for a target on or behind a cycle, or (reverse=True)
+                a target with dependents on or behind a cycle
+        """
+        bits = 0
+        for concept_id in target_ids:
+            node = self._node(concept_id)
+            bits |= self.ancestor_bits(node) | (1 << self.position[node])
+
+        order, ids = self.order, self.graph.ids
+        path = [ids[order[slot]] for slot in bit_positions(bits)]
+        if self.reverse:
+            path.reverse()
+        return path
+
+
+def plan_learning_path(csv_path: str, target_ids: Iterable[int]) -> List[int]:
+    """Plan a learning path for target concepts straight from a CSV."""
+    return LearningPathPlanner.from_csv(csv_path).plan(target_ids)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python learning_path.py <input_csv> <concept_id> [concept_id ...]")
+        print("\nLists every concept to learn, in order, to reach the target concepts.")
+        print("\nExample:")
+        print("  python learning_path.py learning-graph.csv 42 57")
+        sys.exit(1)
+
+    planner = LearningPathPlanner.from_csv(sys.argv[1])
+    targets = [int(arg) for arg in sys.argv[2:]]
+    start = time.perf_counter()
+    try:
+        path = planner.plan(targets)
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e.args[0]}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    concepts = planner.graph.concepts
+    target_set = set(targets)
+    print(f"Learning path to {', '.join(concepts[cid] for cid in targets)} "
+          f"({len(path)} concepts):\n")
+    for i, cid in enumerate(path, 1):
+        marker = " 🎯" if cid in target_set else ""
+        print(f"{i}. **{concepts[cid]}** (ID: {cid}){marker}")
+    print(f"\nPlanned in {elapsed * 1000:.1f} ms")
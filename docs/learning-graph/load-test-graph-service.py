@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Load Test for the Learning Graph Query Service
+
+Sends a mix of concept, ancestor, descendant, chain and learning-path
+queries to graph_service.py from many concurrent keep-alive connections,
+then reports p50/p99 latency and requests per second overall and per
+endpoint.
+
+Concept IDs are sampled from the same CSV the service loaded.  Without
+--url, the service is started as a subprocess on a free port and stopped
+afterwards.
+
+Usage: python load-test-graph-service.py <input_csv> [--url http://127.0.0.1:8765]
+                                         [--concurrency 32] [--requests 5000] [--seed 42]
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from graph_cache import load_graph_cached
+
+SERVICE_SCRIPT = Path(__file__).resolve().with_name('graph_service.py')
+
+# (endpoint name, relative weight)
+QUERY_MIX = [('concept', 4), ('ancestors', 3), ('descendants', 2), ('chain', 1), ('path', 1)]
+
+
+def build_requests(concept_ids: List[int], count: int, seed: int) -> List[Tuple[str, str]]:
+    """A reproducible list of (endpoint, request target) pairs."""
+    rng = random.Random(seed)
+    names, weights = zip(*QUERY_MIX)
+    requests = []
+    for name in rng.choices(names, weights, k=count):
+        if name == 'path':
+            targets = ','.join(str(cid) for cid in rng.sample(concept_ids, min(3, len(concept_ids))))
+            requests.append((name, f"/path?targets={targets}"))
+        elif name == 'concept':
+            requests.append((name, f"/concepts/{rng.choice(concept_ids)}"))
+        else:
+            requests.append((name, f"/concepts/{rng.choice(concept_ids)}/{name}"))
+    return requests
+
+
+async def fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                host: str, target: str) -> int:
+    """Send one GET on a keep-alive connection; return the status code."""
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def run_load(host: str, port: int, requests: List[Tuple[str, str]],
+                   concurrency: int) -> Tuple[float, List[Tuple[str, float, int]]]:
+    """
+    Issue all requests from concurrent workers sharing one queue.
+
+    Returns:
+        (elapsed_seconds, [(endpoint, latency_seconds, status), ...])
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+    results = []
+
+    async def worker():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not queue.empty():
+                name, target = queue.get_nowait()
+                start = time.perf_counter()
+                try:
+                    status = await fetch(reader, writer, host, target)
+                except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    status = 0
+                    writer.close()
+                    reader, writer = await asyncio.open_connection(host, port)
+                results.append((name, time.perf_counter() - start, status))
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(requests)))))
+    return time.perf_counter() - start, results
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def print_results(elapsed: float, results: List[Tuple[str, float, int]]):
+    by_endpoint: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[int, int] = defaultdict(int)
+    for name, latency, status in results:
+        by_endpoint[name].append(latency)
+        statuses[status] += 1
+
+    print("| Endpoint | Requests | p50 (ms) | p99 (ms) | Max (ms) |")
+    print("|----------|----------|----------|----------|----------|")
+    rows = [(name, by_endpoint[name]) for name, _ in QUERY_MIX if name in by_endpoint]
+    rows.append(('all', [latency for _, latency, _ in results]))
+    for name, latencies in rows:
+        latencies.sort()
+        print(f"| {name} | {len(latencies)} | {percentile(latencies, 0.50) * 1000:.2f} | "
+              f"{percentile(latencies, 0.99) * 1000:.2f} | {latencies[-1] * 1000:.2f} |")
+
+    print(f"\nThroughput: {len(results) / elapsed:,.0f} requests/s "
+          f"({len(results)} requests in {elapsed:.2f} s)")
+    print("Status codes: " + ', '.join(f"{status or 'connection error'}: {count}"
+                                       for status, count in sorted(statuses.items())))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_service(host: str, port: int, process: subprocess.Popen, timeout: float = 300):
+    """Poll /health until the service answers."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("graph_service.py exited before it was ready")
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        try:
+            if await fetch(reader, writer, host, '/health') == 200:
+                return
+        finally:
+            writer.close()
+    raise RuntimeError(f"graph_service.py did not answer on port {port} within {timeout:.0f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the learning graph query service.")
+    parser.add_argument('csv', help="learning-graph CSV (the one the service loaded)")
+    parser.add_argument('--url', help="running service to test; default starts one")
+    parser.add_argument('--concurrency', type=int, default=32, help="concurrent connections (default 32)")
+    parser.add_argument('--requests', type=int, default=5000, help="total requests (default 5000)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    graph = load_graph_cached(args.csv)
+    requests = build_requests(list(graph.ids), args.requests, args.seed)
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        process = subprocess.Popen([sys.executable, str(SERVICE_SCRIPT), args.csv, '--port', str(port)],
+                                   stdout=subprocess.DEVNULL)
+
+    try:
+        if process is not None:
+            asyncio.run(wait_for_service(host, port, process))
+        print(f"Sending {len(requests)} requests to http://{host}:{port} "
+              f"over {args.concurrency} connections...\n")
+        elapsed, results = asyncio.run(run_load(host, port, requests, args.concurrency))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print_results(elapsed, results)
+
+
+if __name__ == "__main__":
+    main()
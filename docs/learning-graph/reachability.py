@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Reachability Index
+
+Precomputes the transitive closure of a learning graph so multi-hop
+questions are answered without a fresh traversal:
+
+- all prerequisites of X (ancestors)
+- everything that depends on X (descendants, the "blast radius")
+- does A reach B, i.e. is B a transitive prerequisite of A
+
+Each concept gets one ancestor bitset and one descendant bitset, stored as
+Python integers indexed by dense node index.  Ancestor bitsets are built in
+topological order and descendant bitsets in reverse topological order, so
+every edge costs a single bitwise OR.  Counts are precomputed.
+
+With compressed=True each bitset is kept zlib-compressed and only the sets
+still needed by unprocessed nodes stay expanded during the build, trading
+a decompression per query for a much smaller resident size.
+
+Usage: python reachability.py <input_csv> ancestors <concept_id> [--compressed]
+       python reachability.py <input_csv> descendants <concept_id> [--compressed]
+       python reachability.py <input_csv> reaches <concept_id> <prerequisite_id> [--compressed]
+"""
+
+import weakref
+import zlib
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+from learning_graph import LearningGraph
+
+_INDEXES: 'weakref.WeakKeyDictionary[LearningGraph, Dict[bool, ReachabilityIndex]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def bit_positions(bits: int) -> List[int]:
+    """Indexes of the set bits of an integer, in ascending order."""
+    # Reverse the binary text so character i is bit i, then let str.find skip zeros
+    text = bin(bits)[:1:-1]
+    positions = []
+    i = text.find('1')
+    while i != -1:
+        positions.append(i)
+        i = text.find('1', i + 1)
+    return positions
+
+
+class ReachabilityIndex:
+    """
+    Ancestor and descendant bitsets for every concept of a DAG.
+
+    Args:
+        graph: Graph to index; must not contain cycles
+        compressed: Store bitsets zlib-compressed
+    """
+
+    def __init__(self, graph: LearningGraph, compressed: bool = False):
+        order = graph.topological_order()
+        if len(order) != graph.node_count:
+            raise ValueError("Reachability index requires a DAG; "
+                             "run analyze-graph.py to list the cycles")
+
+        # Keep only what queries need so the index does not pin the graph
+        self.ids = graph.ids
+        self.index = graph.index
+        self.compressed = compressed
+
+        in_degrees = graph.in_degrees()
+        out_degrees = graph.out_degrees()
+        self._ancestors, self.ancestor_counts = self._build(
+            order, graph.prereq_offsets, graph.prereq_targets, in_degrees)
+        self._descendants, self.descendant_counts = self._build(
+            order[::-1], graph.dependent_offsets, graph.dependent_targets, out_degrees)
+
+    @classmethod
+    def for_graph(cls, graph: LearningGraph, compressed: bool = False) -> 'ReachabilityIndex':
+        """Return the index for a loaded graph, building it on first use."""
+        indexes = _INDEXES.setdefault(graph, {})
+        if compressed not in indexes:
+            indexes[compressed] = cls(graph, compressed)
+        return indexes[compressed]
+
+    def _build(self, order: Sequence[int], offsets: Sequence[int], targets: Sequence[int],
+               consumers: List[int]) -> Tuple[list, array]:
+        """
+        Propagate bitsets along one edge direction.
+
+        consumers[i] is how many edges will read node i's set; in compressed
+        mode the expanded set is dropped once the last of them has run.
+        """
+        n = len(self.ids)
+        sets: list = [None] * n
+        counts = array('i', bytes(4 * n))
+        expanded: Dict[int, int] = {}
+        remaining = list(consumers)
+
+        for node in order:
+            bits = 0
+            for pos in range(offsets[node], offsets[node + 1]):
+                target = targets[pos]
+                bits |= expanded[target] | (1 << target)
+                if self.compressed:
+                    remaining[target] -= 1
+                    if remaining[target] == 0:
+                        del expanded[target]
+            counts[node] = bits.bit_count()
+
+            if self.compressed:
+                sets[node] = zlib.compress(bits.to_bytes((bits.bit_length() + 7) // 8, 'little'), 1)
+                if remaining[node]:
+                    expanded[node] = bits
+            else:
+                sets[node] = expanded[node] = bits
+
+        return sets, counts
+
+    def _node(self, concept_id: int) -> int:
+        node = self.index.get(concept_id)
+        if node is None:
+            raise KeyError(f"Unknown ConceptID {concept_id}")
+        return node
+
+    def _bits(self, sets: list, node: int) -> int:
+        if self.compressed:
+            return int.from_bytes(zlib.decompress(sets[node]), 'little')
+        return sets[node]
+
+    def ancestor_bits(self, concept_id: int) -> int:
+        """Bitset (by dense index) of a concept's transitive prerequisites."""
+        return self._bits(self._ancestors, self._node(concept_id))
+
+    def descendant_bits(self, concept_id: int) -> int:
+        """Bitset (by dense index) of the concepts that transitively depend on a concept."""
+        return self._bits(self._descendants, self._node(concept_id))
+
+    def ancestors(self, concept_id: int) -> List[int]:
+        """ConceptIDs of every transitive prerequisite of a concept."""
+        ids = self.ids
+        return [ids[i] for i in bit_positions(self.ancestor_bits(concept_id))]
+
+    def descendants(self, concept_id: int) -> List[int]:
+        """ConceptIDs of every concept that transitively depends on a concept."""
+        ids = self.ids
+        return [ids[i] for i in bit_positions(self.descendant_bits(concept_id))]
+
+    def ancestor_count(self, concept_id: int) -> int:
+        return self.ancestor_counts[self._node(concept_id)]
+
+    def descendant_count(self, concept_id: int) -> int:
+        return self.descendant_counts[self._node(concept_id)]
+
+    def reaches(self, concept_id: int, prereq_id: int) -> bool:
+        """True if prereq_id is a transitive prerequisite of concept_id."""
+        return bool(self.ancestor_bits(concept_id) >> self._node(prereq_id) & 1)
+
+    def size_bytes(self) -> int:
+        """Approximate memory held by the stored bitsets."""
+        if self.compressed:
+            return sum(len(s) for s in self._ancestors) + sum(len(s) for s in self._descendants)
+        return sum((s.bit_length() + 7) // 8 for s in self._ancestors + self._descendants)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from graph_cache import load_graph_cached
+
+    args = [arg for arg in sys.argv[1:] if arg != '--compressed']
+    compressed = '--compressed' in sys.argv
+    queries = {'ancestors': 1, 'descendants': 1, 'reaches': 2}
+
+    if len(args) < 3 or args[1] not in queries or len(args) != 2 + queries[args[1]]:
+        print("Usage: python reachability.py <input_csv> ancestors <concept_id> [--compressed]")
+        print("       python reachability.py <input_csv> descendants <concept_id> [--compressed]")
+        print("       python reachability.py <input_csv> reaches <concept_id> <prerequisite_id> [--compressed]")
+        print("\nExample:")
+        print("  python reachability.py learning-graph.csv ancestors 42")
+        sys.exit(1)
+
+    graph = load_graph_cached(args[0])
+    start = time.perf_counter()
+    index = ReachabilityIndex.for_graph(graph, compressed)
+    build_time = time.perf_counter() - start
+
+    query = args[1]
+    concept_ids = [int(arg) for arg in args[2:]]
+    start = time.perf_counter()
+    if query == 'reaches':
+        result = index.reaches(*concept_ids)
+    else:
+        result = getattr(index, query)(concept_ids[0])
+    query_time = time.perf_counter() - start
+
+    concepts = graph.concepts
+    if query == 'reaches':
+        concept_id, prereq_id = concept_ids
+        verb = 'depends on' if result else 'does not depend on'
+        print(f"{'✅' if result else '❌'} {concepts[concept_id]} ({concept_id}) {verb} "
+              f"{concepts[prereq_id]} ({prereq_id})")
+    else:
+        print(f"{len(result)} {query} of {concepts[concept_ids[0]]} ({concept_ids[0]}):\n")
+        for cid in result:
+            print(f"- **{cid}**: {concepts[cid]}")
+
+    print(f"\nIndex built in {build_time * 1000:.1f} ms ({index.size_bytes():,} bytes); "
+          f"query answered in {query_time * 1e6:.0f} µs")
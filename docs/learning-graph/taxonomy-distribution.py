@@ -6,12 +6,14 @@ Analyzes the taxonomy distribution in the concept dependency CSV
 and generates a detailed distribution report with recommendations.
 """
 
-import csv
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+from learning_graph import read_rows
 
-def analyze_taxonomy_distribution(csv_path: str, output_path: str, taxonomy_names: dict = None):
+
+def analyze_taxonomy_distribution(csv_path: str, output_path: str, taxonomy_names: dict = None,
+                                  graph=None):
     """
     Analyze taxonomy distribution and generate report.
 
@@ -19,6 +21,7 @@ def analyze_taxonomy_distribution(csv_path: str, output_path: str, taxonomy_name
         csv_path: Path to input CSV file
         output_path: Path to output markdown report
         taxonomy_names: Optional dictionary mapping taxonomy IDs to full names
+        graph: Already loaded LearningGraph for csv_path (skips loading it again)
     """
     # Default taxonomy names
     default_names = {
@@ -39,12 +42,12 @@ def analyze_taxonomy_distribution(csv_path: str, output_path: str, taxonomy_name
     taxonomy_counts = defaultdict(int)
     taxonomy_concepts = defaultdict(list)
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            tax = row['TaxonomyID']
-            taxonomy_counts[tax] += 1
-            taxonomy_concepts[tax].append((int(row['ConceptID']), row['ConceptLabel']))
+    # Only labels and taxonomies are needed, so skip building the graph
+    # (which rejects duplicate IDs and unknown dependencies)
+    rows = graph.rows() if graph is not None else read_rows(csv_path)
+    for concept_id, label, _, tax in rows:
+        taxonomy_counts[tax] += 1
+        taxonomy_concepts[tax].append((concept_id, label))
 
     total_concepts = sum(taxonomy_counts.values())
 
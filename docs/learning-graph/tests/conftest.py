@@ -0,0 +1,36 @@
+"""Shared fixtures for the learning-graph script tests."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    """Write learning-graph CSV rows (id, label, dependencies, taxonomy) and return the path."""
+    def write(rows):
+        path = tmp_path / 'learning-graph.csv'
+        lines = ['ConceptID,ConceptLabel,Dependencies,TaxonomyID']
+        lines += [','.join(str(value) for value in row) for row in rows]
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def load_script():
+    """Import one of the hyphen-named scripts (e.g. 'csv-to-json.py') as a module."""
+    def load(filename):
+        path = SCRIPT_DIR / filename
+        spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered so worker processes can unpickle the script's functions
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        return module
+    return load
@@ -0,0 +1,42 @@
+"""Centrality section of the analyze-graph.py quality report."""
+
+import csv
+import json
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from graph_metrics import approximate_betweenness, pagerank  # noqa: E402
+from learning_graph import LearningGraph  # noqa: E402
+
+# A hub (3) that every later concept passes through
+ROWS = [(1, 'Foundation', '', 'FOUND'), (2, 'Second Foundation', '', 'FOUND'),
+        (3, 'Hub', '1|2', 'CORE')] + [(cid, f'Leaf {cid}', '3', 'APPL') for cid in range(4, 16)]
+
+
+def test_report_ranks_concepts_by_pagerank_and_betweenness(write_csv, load_script, tmp_path):
+    csv_path = write_csv(ROWS)
+    report_path = tmp_path / 'quality-metrics.md'
+    analyze_graph = load_script('analyze-graph.py')
+    analyze_graph.generate_report(csv_path, str(report_path), json_path=str(tmp_path / 'metrics.json'))
+
+    with open(tmp_path / 'metrics.json', 'r', encoding='utf-8') as f:
+        centrality = json.load(f)['centrality']
+    graph = LearningGraph.from_csv(csv_path)
+    for name, scores in (('pagerank', pagerank(graph)), ('betweenness', approximate_betweenness(graph))):
+        ranked = centrality[name]
+        assert [entry['score'] for entry in ranked] == sorted(
+            (entry['score'] for entry in ranked), reverse=True)
+        for entry in ranked:
+            assert entry['score'] == pytest.approx(scores[graph.index[entry['concept']]])
+    # Every leaf reaches the foundations through the hub
+    assert centrality['betweenness'][0]['concept'] == 3
+    assert centrality['betweenness_samples'] == graph.node_count
+
+    report = report_path.read_text(encoding='utf-8')
+    assert '## Centrality Analysis' in report and '### Top 10 by PageRank' in report
+    with open(tmp_path / 'concept-metrics.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    hub = next(row for row in rows if row['ConceptID'] == '3')
+    assert float(hub['betweenness']) == pytest.approx(approximate_betweenness(graph)[2], rel=1e-5)
@@ -0,0 +1,26 @@
+"""Incremental build pipeline on a CSV the graph cannot be built from."""
+
+import json
+
+import pytest
+
+from test_report_tools import MALFORMED_ROWS
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_row_stages_run_when_the_graph_cannot_be_loaded(write_csv, load_script, workers):
+    build = load_script('build-learning-graph.py')
+    csv_path = write_csv(MALFORMED_ROWS)
+
+    results = build.build(csv_path, ['analyze', 'json', 'taxonomy', 'quality'],
+                          workers=workers, quiet=True)
+    statuses = {name: (status, error) for name, status, _, error in results}
+    assert statuses['taxonomy'] == ('ran', None)
+    assert statuses['quality'] == ('ran', None)
+    for name in ('analyze', 'json'):
+        status, error = statuses[name]
+        assert status == 'failed'
+        assert 'Duplicate ConceptID 3' in error
+
+    with open(build.Path(csv_path).with_name(build.STATE_FILE), encoding='utf-8') as f:
+        assert sorted(json.load(f)) == ['quality', 'taxonomy']
@@ -0,0 +1,73 @@
+"""Compressed siblings and partitioned output written by csv-to-json.py."""
+
+import gzip
+import hashlib
+import json
+import zlib
+
+import pytest
+
+
+def test_compressed_sibling_decompresses_to_the_json(load_script, tmp_path):
+    json_path = tmp_path / 'learning-graph.json'
+    json_path.write_text('{"nodes": [], "edges": []}\n' * 1000, encoding='utf-8')
+    siblings = load_script('csv-to-json.py').write_compressed_siblings(str(json_path), quiet=True)
+
+    gz_path = str(json_path) + '.gz'
+    assert siblings[gz_path] == len(open(gz_path, 'rb').read())
+    assert gzip.decompress(open(gz_path, 'rb').read()) == json_path.read_bytes()
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_failed_compression_keeps_the_previous_sibling(load_script, tmp_path, monkeypatch):
+    csv_to_json = load_script('csv-to-json.py')
+    json_path = tmp_path / 'learning-graph.json'
+    json_path.write_text('{"nodes": [], "edges": []}\n', encoding='utf-8')
+    gz_path = tmp_path / 'learning-graph.json.gz'
+    gz_path.write_bytes(b'previous build')
+
+    class FailingCompressor:
+        def compress(self, block):
+            return block[:10]
+
+        def flush(self):
+            raise zlib.error('disk full')
+
+    monkeypatch.setattr(csv_to_json.zlib, 'compressobj', lambda *args: FailingCompressor())
+    with pytest.raises(zlib.error):
+        csv_to_json.write_compressed_siblings(str(json_path), quiet=True)
+    assert gz_path.read_bytes() == b'previous build'
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_partitions_reassemble_to_the_unpartitioned_graph(write_csv, load_script, tmp_path):
+    # 'A/B' and 'A_B' sanitize to the same file name and must not collide
+    csv_path = write_csv([
+        (1, 'Foundation', '', 'A/B'),
+        (2, 'Same Group', '1', 'A/B'),
+        (3, 'Other Group', '1', 'A_B'),
+        (4, 'Both', '2|3', 'A_B'),
+    ])
+    csv_to_json = load_script('csv-to-json.py').csv_to_json
+    whole_dir, parts_dir = tmp_path / 'whole', tmp_path / 'parts'
+    whole_dir.mkdir()
+    parts_dir.mkdir()
+    whole = csv_to_json(csv_path, str(whole_dir / 'learning-graph.json'))
+    manifest = csv_to_json(csv_path, str(parts_dir / 'learning-graph.json'), partition=True)
+
+    files = {entry['file'] for entry in manifest['partitions'].values()}
+    assert len(files) == 2
+    chunks = {}
+    for entry in list(manifest['partitions'].values()) + [manifest['crossEdges']]:
+        data = (parts_dir / entry['file']).read_bytes()
+        assert (len(data), hashlib.sha256(data).hexdigest()) == (entry['bytes'], entry['sha256'])
+        chunks[entry['file']] = json.loads(data)
+
+    group_of = {node['id']: node['group'] for node in whole['nodes']}
+    cross = chunks[manifest['crossEdges']['file']]['edges']
+    assert all(group_of[edge['from']] != group_of[edge['to']] for edge in cross)
+    nodes = [node for chunk in chunks.values() for node in chunk.get('nodes', [])]
+    edges = [edge for chunk in chunks.values() for edge in chunk['edges']]
+    assert sorted(nodes, key=lambda node: node['id']) == whole['nodes']
+    assert sorted(map(json.dumps, edges)) == sorted(map(json.dumps, whole['edges']))
+    assert manifest['totals']['nodes'] == 4 and manifest['totals']['edges'] == len(whole['edges'])
@@ -0,0 +1,41 @@
+"""Binary graph files written by csv-to-json.py --binary."""
+
+import json
+import os
+
+import pytest
+
+from graph_binary import load_json_graph, read_graph_binary
+
+ROWS = [
+    (1, 'Foundation', '', 'FOUND'),
+    (2, 'Définition — ünïcode', '1', 'DEF'),
+    (3, 'Core Idea', '1|2', 'CORE'),
+    (4, 'Second Foundation', '', 'FOUND'),
+    (5, 'Application', '3|4', 'APPL'),
+    (6, 'Cross Link', '2|5', 'CORE'),
+]
+
+
+@pytest.mark.parametrize('options', [{}, {'layout': True}, {'partition': True},
+                                     {'layout': True, 'partition': True}],
+                         ids=['plain', 'layout', 'partitioned', 'layout-partitioned'])
+def test_binary_file_reads_back_as_the_json(write_csv, load_script, tmp_path, options):
+    if options.get('layout'):
+        pytest.importorskip('numpy')
+    csv_to_json = load_script('csv-to-json.py').csv_to_json
+    json_path = str(tmp_path / 'learning-graph.json')
+    csv_to_json(write_csv(ROWS), json_path, binary=True, **options)
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        assert ('partitions' in json.load(f)) == bool(options.get('partition'))
+    expected = load_json_graph(json_path)
+    actual = read_graph_binary(os.path.splitext(json_path)[0] + '.lgbin')
+    if options.get('partition'):
+        # Chunks are grouped by taxonomy; load_json_graph sorts them by ConceptID
+        actual['nodes'].sort(key=lambda node: node['id'])
+        actual['edges'].sort(key=lambda edge: (edge['from'], edge['to']))
+
+    assert actual == expected
+    assert len(actual['nodes']) == len(ROWS)
+    assert all(('x' in node) == bool(options.get('layout')) for node in actual['nodes'])
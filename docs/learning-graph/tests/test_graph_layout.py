@@ -0,0 +1,54 @@
+"""Edge crossing count of the layered layout against brute force."""
+
+import random
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from graph_layout import edge_crossings, layered_layout  # noqa: E402
+from learning_graph import LearningGraph  # noqa: E402
+
+
+def random_dag(count, seed):
+    rng = random.Random(seed)
+    dependencies = [rng.sample(range(1, cid), min(cid - 1, rng.randint(0, 3)))
+                    for cid in range(1, count + 1)]
+    return LearningGraph(range(1, count + 1), [f'Concept {cid}' for cid in range(1, count + 1)],
+                         dependencies)
+
+
+def brute_crossings(graph, x, y):
+    """Split every edge into one straight segment per layer gap and compare all pairs."""
+    layer_y = sorted(set(y.tolist()))
+    segments = []
+    for node in range(graph.node_count):
+        for prereq in graph.prerequisites(node):
+            top, bottom = layer_y.index(y[prereq]), layer_y.index(y[node])
+            span = bottom - top
+            for step in range(span):
+                upper = x[prereq] + (x[node] - x[prereq]) * step / span
+                lower = x[prereq] + (x[node] - x[prereq]) * (step + 1) / span
+                segments.append((top + step, upper, lower))
+    return sum(1 for (gap1, upper1, lower1), (gap2, upper2, lower2) in combinations(segments, 2)
+               if gap1 == gap2 and (upper1 - upper2) * (lower1 - lower2) < 0)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_crossings_match_brute_force(seed):
+    graph = random_dag(30, seed)
+    x, y = layered_layout(graph)
+    assert edge_crossings(graph, x, y) == brute_crossings(graph, x, y)
+
+    # Unordered and randomly shuffled layouts, with ties between x positions
+    x, y = layered_layout(graph, sweeps=0)
+    assert edge_crossings(graph, x, y) == brute_crossings(graph, x, y)
+    shuffled = np.random.default_rng(seed).integers(0, 5, graph.node_count) * 150
+    assert edge_crossings(graph, shuffled, y) == brute_crossings(graph, shuffled, y)
+
+
+def test_sweeps_do_not_add_crossings():
+    graph = random_dag(200, 1)
+    ordered = edge_crossings(graph, *layered_layout(graph))
+    assert ordered <= edge_crossings(graph, *layered_layout(graph, sweeps=0))
@@ -0,0 +1,102 @@
+"""PageRank and sampled betweenness in graph_metrics against brute force."""
+
+import random
+from collections import deque
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from graph_metrics import (approximate_betweenness, betweenness_sample_size,  # noqa: E402
+                           csr_arrays, pagerank)
+from learning_graph import LearningGraph  # noqa: E402
+
+
+def random_graph(count, seed):
+    """Mostly-DAG graph with a few back edges, so some concepts sit on cycles."""
+    rng = random.Random(seed)
+    dependencies = [sorted(rng.sample(range(1, cid), min(cid - 1, rng.randint(0, 3))))
+                    for cid in range(1, count + 1)]
+    for _ in range(3):
+        prereq = rng.randint(2, count)
+        dependencies[rng.randint(0, prereq - 2)].append(prereq)
+    return LearningGraph(range(1, count + 1), [f'Concept {cid}' for cid in range(1, count + 1)],
+                         [sorted(set(deps)) for deps in dependencies])
+
+
+def brute_pagerank(graph, damping=0.85, iterations=1000):
+    n = graph.node_count
+    prereqs = [list(graph.prerequisites(i)) for i in range(n)]
+    rank = [1.0 / n] * n
+    for _ in range(iterations):
+        updated = [(1 - damping) / n] * n
+        for i in range(n):
+            targets = prereqs[i] or range(n)
+            for target in targets:
+                updated[target] += damping * rank[i] / len(targets)
+        rank = updated
+    return rank
+
+
+def brute_betweenness(graph, sources=None):
+    """Brandes' algorithm over prerequisite edges, normalized by (n-1)(n-2)."""
+    n = graph.node_count
+    sources = range(n) if sources is None else sources
+    scores = [0.0] * n
+    for source in sources:
+        sigma, distance, order = [0] * n, [-1] * n, []
+        parents = [[] for _ in range(n)]
+        sigma[source], distance[source] = 1, 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for prereq in graph.prerequisites(node):
+                if distance[prereq] < 0:
+                    distance[prereq] = distance[node] + 1
+                    queue.append(prereq)
+                if distance[prereq] == distance[node] + 1:
+                    sigma[prereq] += sigma[node]
+                    parents[prereq].append(node)
+        dependency = [0.0] * n
+        for node in reversed(order):
+            for parent in parents[node]:
+                dependency[parent] += sigma[parent] / sigma[node] * (1 + dependency[node])
+            if node != source:
+                scores[node] += dependency[node]
+    return [score * n / len(sources) / ((n - 1) * (n - 2)) for score in scores]
+
+
+def test_csr_arrays_are_views_of_the_graph():
+    graph = random_graph(20, 0)
+    offsets, targets = csr_arrays(graph)
+    assert offsets.dtype == targets.dtype == np.int32
+    assert not offsets.flags.owndata and not targets.flags.owndata
+    assert offsets.tolist() == list(graph.prereq_offsets)
+    assert targets.tolist() == list(graph.prereq_targets)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pagerank_matches_power_iteration(seed):
+    graph = random_graph(40, seed)
+    rank = pagerank(graph)
+    assert rank.sum() == pytest.approx(1.0)
+    assert rank == pytest.approx(brute_pagerank(graph), abs=1e-8)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_betweenness_is_exact_when_every_concept_is_a_source(seed):
+    graph = random_graph(40, seed)
+    assert approximate_betweenness(graph) == pytest.approx(brute_betweenness(graph), abs=1e-12)
+
+
+def test_sampled_betweenness_scales_the_sampled_sources():
+    graph = random_graph(300, 7)
+    epsilon, delta, seed = 0.3, 0.1, 3
+    samples = betweenness_sample_size(graph.node_count, epsilon, delta)
+    assert samples < graph.node_count
+    sampled = approximate_betweenness(graph, epsilon=epsilon, delta=delta, seed=seed)
+
+    sources = np.random.default_rng(seed).choice(graph.node_count, samples, replace=False)
+    assert sampled == pytest.approx(brute_betweenness(graph, sources.tolist()), abs=1e-12)
+    assert np.abs(sampled - brute_betweenness(graph)).max() <= epsilon
@@ -0,0 +1,102 @@
+"""One request per endpoint of the learning-graph query service."""
+
+import asyncio
+import json
+
+import pytest
+
+from graph_service import GraphQueryService
+from learning_graph import LearningGraph
+
+# 1 and 2 are foundational; 3 needs both; 4 needs 3; 5 needs 4 and 1
+ROWS = [
+    (1, 'Foundation', '', 'FOUND'),
+    (2, 'Second Foundation', '', 'FOUND'),
+    (3, 'Core', '1|2', 'CORE'),
+    (4, 'Advanced', '3', 'ADV'),
+    (5, 'Capstone', '4|1', 'CAP'),
+]
+
+
+@pytest.fixture
+def service(write_csv):
+    return GraphQueryService(LearningGraph.from_csv(write_csv(ROWS)), metrics=False)
+
+
+def test_health_and_summary(service):
+    assert service.respond('GET', '/health') == (200, {'status': 'ok'})
+    assert service.respond('GET', '/summary') == (200, {
+        'concepts': 5, 'dependencies': 5, 'is_dag': True, 'max_chain_length': 4,
+        'metrics': False})
+
+
+def test_concept_endpoints(service):
+    status, concept = service.respond('GET', '/concepts/3')
+    assert status == 200
+    assert concept == {'id': 3, 'label': 'Core', 'taxonomy': 'CORE', 'prerequisites': [1, 2],
+                       'in_degree': 1, 'out_degree': 2}
+
+    status, ancestors = service.respond('GET', '/concepts/5/ancestors')
+    assert status == 200 and ancestors['count'] == 4
+    assert sorted(ancestors['ancestors']) == [1, 2, 3, 4]
+    assert ancestors['ancestors'].index(3) > ancestors['ancestors'].index(1)
+
+    status, descendants = service.respond('GET', '/concepts/2/descendants')
+    assert (status, descendants) == (200, {'id': 2, 'count': 3, 'descendants': [3, 4, 5]})
+
+    status, chain = service.respond('GET', '/concepts/5/chain')
+    assert status == 200 and chain['length'] == 4
+    assert [step['id'] for step in chain['chain']][1:] == [3, 4, 5]
+
+
+def test_path_endpoint(service):
+    status, path = service.respond('GET', '/path?targets=4,2')
+    assert status == 200
+    assert path['targets'] == [4, 2] and path['count'] == 4
+    assert {step['id'] for step in path['path']} == {1, 2, 3, 4}
+    assert path['path'][-1] == {'id': 4, 'label': 'Advanced'}
+
+
+@pytest.mark.parametrize('method, target, status', [
+    ('GET', '/concepts/x', 400),
+    ('GET', '/path', 400),
+    ('GET', '/concepts/99', 404),
+    ('GET', '/nowhere', 404),
+    ('POST', '/health', 405),
+])
+def test_errors(service, method, target, status):
+    code, payload = service.respond(method, target)
+    assert code == status and 'error' in payload
+
+
+def test_http_keep_alive(service):
+    async def exchange():
+        server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            responses = []
+            for target, connection in (('/health', 'keep-alive'), ('/concepts/4', 'close')):
+                writer.write(f"GET {target} HTTP/1.1\r\nHost: test\r\n"
+                             f"Connection: {connection}\r\n\r\n".encode('latin-1'))
+                status = (await reader.readline()).split()[1]
+                headers = {}
+                while (line := await reader.readline()) != b'\r\n':
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.lower()] = value.strip()
+                body = await reader.readexactly(int(headers['content-length']))
+                responses.append((int(status), headers['connection'], json.loads(body)))
+            writer.close()
+            return responses
+
+    health, concept = asyncio.run(exchange())
+    assert health == (200, 'keep-alive', {'status': 'ok'})
+    assert concept[:2] == (200, 'close') and concept[2]['label'] == 'Advanced'
+
+
+def test_concept_metrics_with_numpy(write_csv):
+    pytest.importorskip('numpy')
+    service = GraphQueryService(LearningGraph.from_csv(write_csv(ROWS)))
+    status, concept = service.respond('GET', '/concepts/4')
+    assert status == 200
+    assert concept['metrics']['ancestors'] == 3 and concept['metrics']['descendants'] == 1
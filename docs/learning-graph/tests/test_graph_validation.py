@@ -0,0 +1,54 @@
+"""Streaming JSON reader used by validate-learning-graph.py --stream."""
+
+import io
+import json
+
+import pytest
+
+import graph_validation
+from graph_validation import _JsonStream, _walk_graph
+
+
+def graph_document(node_count):
+    return {
+        'metadata': {'title': 'Café — \U0001F4D8', 'version': 1.5e10},
+        'revision': 12.5e-3,
+        'nodes': [{'id': i, 'label': f'Concept {i} é\\"', 'weight': -0.125 * i,
+                   'padding': 'x' * 200} for i in range(1, node_count + 1)],
+        'edges': [{'from': i, 'to': i - 1, 'required': i % 2 == 0, 'note': None}
+                  for i in range(2, node_count + 1)],
+    }
+
+
+def walk(text):
+    stream = _JsonStream(io.BytesIO(text.encode('utf-8')))
+    document = {'nodes': [], 'edges': []}
+    for event, key, _, item in _walk_graph(stream):
+        if event == 'item':
+            document[key].append(item)
+        elif event == 'value':
+            document[key] = item
+    return document
+
+
+@pytest.mark.parametrize('block_bytes', [1, 3, 7, 64, 1 << 16])
+def test_values_split_across_blocks_decode_like_json_loads(monkeypatch, block_bytes):
+    monkeypatch.setattr(graph_validation, 'STREAM_BLOCK_BYTES', block_bytes)
+    text = json.dumps(graph_document(20), indent=1)
+    assert walk(text) == json.loads(text)
+    ascii_text = json.dumps(graph_document(20), ensure_ascii=True)
+    assert walk(ascii_text) == json.loads(ascii_text)
+
+
+def test_syntax_error_is_reported_where_it_is_not_after_buffering():
+    text = json.dumps(graph_document(100_000))
+    broken = text.replace('{"id": 6,', '{id": 6,', 1)
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(broken)
+
+    f = io.BytesIO(broken.encode('utf-8'))
+    with pytest.raises(ValueError) as error:
+        for _ in _walk_graph(_JsonStream(f)):
+            pass
+    assert str(error.value) == f"nodes[5]: {expected.value.msg} (byte {expected.value.pos})"
+    assert f.tell() <= graph_validation.STREAM_BLOCK_BYTES
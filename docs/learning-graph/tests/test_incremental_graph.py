@@ -0,0 +1,82 @@
+"""Online topological order maintenance in IncrementalGraph."""
+
+import random
+
+import pytest
+
+from incremental_graph import CycleError, IncrementalGraph
+from learning_graph import LearningGraph
+
+
+def reaches(prereqs, start, target):
+    """Brute force: does start depend on target, directly or transitively?"""
+    seen, stack = {start}, [start]
+    while stack:
+        for prereq in prereqs[stack.pop()]:
+            if prereq == target:
+                return True
+            if prereq not in seen:
+                seen.add(prereq)
+                stack.append(prereq)
+    return False
+
+
+def assert_topological(editor, prereqs):
+    position = {cid: slot for slot, cid in enumerate(editor.topological_order())}
+    assert sorted(position) == sorted(prereqs)
+    for cid, deps in prereqs.items():
+        assert all(position[prereq] < position[cid] for prereq in deps)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_edits_keep_the_order_topological(seed):
+    rng = random.Random(seed)
+    count = rng.randint(2, 40)
+    # Shuffled IDs so the initial order is not simply ascending
+    ids = rng.sample(range(1, 1000), count)
+    prereqs = {cid: set() for cid in ids}
+    for i, cid in enumerate(ids):
+        prereqs[cid] = set(rng.sample(ids[:i], min(i, rng.randint(0, 3))))
+    editor = IncrementalGraph(LearningGraph(ids, [f'Concept {cid}' for cid in ids],
+                                            [sorted(prereqs[cid]) for cid in ids]))
+    assert_topological(editor, prereqs)
+
+    for _ in range(200):
+        action = rng.random()
+        if action < 0.05:
+            cid = max(prereqs) + 1
+            editor.add_concept(cid, f'Concept {cid}')
+            prereqs[cid] = set()
+        elif action < 0.2 and any(prereqs.values()):
+            cid = rng.choice([cid for cid, deps in prereqs.items() if deps])
+            prereq = rng.choice(sorted(prereqs[cid]))
+            editor.remove_dependency(cid, prereq)
+            prereqs[cid].discard(prereq)
+        else:
+            cid, prereq = rng.choice(list(prereqs)), rng.choice(list(prereqs))
+            creates_cycle = cid == prereq or reaches(prereqs, prereq, cid)
+            assert (editor.would_create_cycle(cid, prereq) is not None) == creates_cycle
+            if creates_cycle:
+                with pytest.raises(CycleError) as error:
+                    editor.add_dependency(cid, prereq)
+                path = error.value.path
+                # concept → its dependents ... → prerequisite, then back to the concept
+                assert path[0] == path[-1] == cid and path[-2] == prereq
+                assert all(a in prereqs[b] for a, b in zip(path, path[1:-1]))
+            else:
+                editor.add_dependency(cid, prereq)
+                prereqs[cid].add(prereq)
+        assert_topological(editor, prereqs)
+
+    snapshot = editor.to_graph()
+    assert {cid: set(deps) for cid, _, deps, _ in snapshot.rows()} == prereqs
+
+
+def test_cyclic_graph_is_rejected(write_csv):
+    graph = LearningGraph.from_csv(write_csv([
+        (1, 'Foundation', '', 'FOUND'),
+        (2, 'Cycle A', '1|3', 'CORE'),
+        (3, 'Cycle B', '2', 'CORE'),
+    ]))
+    with pytest.raises(CycleError):
+        IncrementalGraph(graph)
@@ -0,0 +1,34 @@
+"""Learning path planner and query service on graphs with cycles."""
+
+import pytest
+
+from graph_service import GraphQueryService
+from learning_graph import LearningGraph
+from learning_path import LearningPathPlanner
+
+# 1 is a DAG concept; 2 and 3 depend on each other and on 1; 4 builds on 1 only
+CYCLE_BELOW_DAG_NODE = [
+    (1, 'Foundation', '', 'FOUND'),
+    (2, 'Cycle A', '1|3', 'CORE'),
+    (3, 'Cycle B', '2', 'CORE'),
+    (4, 'Leaf', '1', 'CORE'),
+]
+
+
+def test_descendants_reaching_a_cycle_are_rejected(write_csv):
+    graph = LearningGraph.from_csv(write_csv(CYCLE_BELOW_DAG_NODE))
+    planner = LearningPathPlanner(graph, reverse=True)
+    with pytest.raises(ValueError, match='cycle'):
+        planner.plan([1])
+    assert planner.plan([4]) == [4]
+
+
+def test_service_returns_conflict_for_cyclic_descendants_and_chains(write_csv):
+    service = GraphQueryService(LearningGraph.from_csv(write_csv(CYCLE_BELOW_DAG_NODE)),
+                                metrics=False)
+    assert service.respond('GET', '/concepts/1/descendants')[0] == 409
+    assert service.respond('GET', '/concepts/2/chain')[0] == 409
+    status, payload = service.respond('GET', '/concepts/4/chain')
+    assert status == 200 and [c['id'] for c in payload['chain']] == [1, 4]
+    status, payload = service.respond('GET', '/concepts/1/ancestors')
+    assert status == 200 and payload['ancestors'] == []
@@ -0,0 +1,70 @@
+"""Ancestor and descendant queries of the bitset reachability index."""
+
+import random
+
+import pytest
+
+from learning_graph import LearningGraph
+from reachability import ReachabilityIndex
+
+
+def random_dag(count, seed):
+    """DAG with shuffled ConceptIDs, so dense indexes differ from IDs and from order."""
+    rng = random.Random(seed)
+    ids = rng.sample(range(1, 10 * count), count)
+    dependencies = [rng.sample(ids[:i], min(i, rng.randint(0, 3))) for i in range(count)]
+    order = list(range(count))
+    rng.shuffle(order)
+    return LearningGraph([ids[i] for i in order], [f'Concept {ids[i]}' for i in order],
+                         [dependencies[i] for i in order])
+
+
+def closure(edges, start):
+    seen, stack = set(), [start]
+    while stack:
+        for nxt in edges[stack.pop()]:
+            if nxt not in seen:
+                seen.add(nxt)
+                stack.append(nxt)
+    return seen
+
+
+@pytest.mark.parametrize('compressed', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_queries_match_brute_force(seed, compressed):
+    graph = random_dag(60, seed)
+    prereqs = {cid: deps for cid, _, deps, _ in graph.rows()}
+    dependents = {cid: [] for cid in prereqs}
+    for cid, deps in prereqs.items():
+        for prereq in deps:
+            dependents[prereq].append(cid)
+
+    index = ReachabilityIndex(graph, compressed=compressed)
+    for cid in prereqs:
+        ancestors, descendants = closure(prereqs, cid), closure(dependents, cid)
+        assert sorted(index.ancestors(cid)) == sorted(ancestors)
+        assert sorted(index.descendants(cid)) == sorted(descendants)
+        assert index.ancestor_count(cid) == len(ancestors)
+        assert index.descendant_count(cid) == len(descendants)
+        for other in prereqs:
+            assert index.reaches(cid, other) == (other in ancestors)
+
+
+def test_index_is_shared_per_graph_and_mode():
+    graph = random_dag(10, 0)
+    assert ReachabilityIndex.for_graph(graph) is ReachabilityIndex.for_graph(graph)
+    assert ReachabilityIndex.for_graph(graph, compressed=True) is not ReachabilityIndex.for_graph(graph)
+
+
+def test_cycles_and_unknown_concepts_are_rejected(write_csv):
+    graph = LearningGraph.from_csv(write_csv([
+        (1, 'Foundation', '', 'FOUND'),
+        (2, 'Cycle A', '1|3', 'CORE'),
+        (3, 'Cycle B', '2', 'CORE'),
+    ]))
+    with pytest.raises(ValueError, match='DAG'):
+        ReachabilityIndex(graph)
+
+    index = ReachabilityIndex(random_dag(5, 0))
+    with pytest.raises(KeyError):
+        index.ancestors(-1)
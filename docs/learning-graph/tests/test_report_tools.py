@@ -0,0 +1,19 @@
+"""Report tools that must keep working on a malformed learning-graph CSV."""
+
+# Concept 2 depends on a concept that does not exist, and ConceptID 3 is repeated
+MALFORMED_ROWS = [
+    (1, 'Foundation', '', 'FOUND'),
+    (2, 'Dangling', '9', 'CORE'),
+    (3, 'First Copy', '1', 'CORE'),
+    (3, 'Second Copy', '1', 'CORE'),
+]
+
+
+def test_find_missing_terms_reads_labels_from_malformed_csv(write_csv, load_script, tmp_path):
+    glossary = tmp_path / 'glossary.md'
+    glossary.write_text("# Glossary\n\n#### Dangling\n\n#### Foundation\n\n#### Unused\n",
+                        encoding='utf-8')
+    find_missing_terms = load_script('find-missing-terms.py').find_missing_terms
+    missing, extra = find_missing_terms(write_csv(MALFORMED_ROWS), str(glossary))
+    assert missing == {'First Copy', 'Second Copy'}
+    assert extra == {'Unused'}
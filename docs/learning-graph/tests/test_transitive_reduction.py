@@ -0,0 +1,19 @@
+"""Transitive reduction of prerequisite edges."""
+
+from learning_graph import LearningGraph, read_rows
+from transitive_reduction import redundant_edges, write_reduced_csv
+
+
+def test_duplicated_dependency_keeps_one_copy(write_csv, tmp_path):
+    graph = LearningGraph.from_csv(write_csv([
+        (1, 'Foundation', '', 'FOUND'),
+        (2, 'Duplicate', '1|1', 'CORE'),
+        (3, 'Shortcut', '2|1', 'CORE'),
+    ]))
+    redundant = redundant_edges(graph)
+    assert sorted(redundant) == [(2, 1), (3, 1)]
+
+    reduced = tmp_path / 'reduced.csv'
+    write_reduced_csv(graph, redundant, str(reduced))
+    assert [(cid, prereqs) for cid, _, prereqs, _ in read_rows(str(reduced))] == [
+        (1, []), (2, [1]), (3, [2])]
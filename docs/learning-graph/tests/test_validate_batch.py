@@ -0,0 +1,71 @@
+"""Batch validation reports written by validate-learning-graph.py --batch."""
+
+import importlib.util
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+if not (importlib.util.find_spec('fastjsonschema') or importlib.util.find_spec('jsonschema')):
+    pytest.skip("needs fastjsonschema or jsonschema", allow_module_level=True)
+
+SCHEMA = {
+    'type': 'object',
+    'required': ['metadata', 'nodes', 'edges'],
+    'properties': {
+        'metadata': {'type': 'object'},
+        'nodes': {'type': 'array', 'items': {'$ref': '#/definitions/node'}},
+        'edges': {'type': 'array', 'items': {'$ref': '#/definitions/edge'}},
+    },
+    'definitions': {
+        'node': {'type': 'object', 'required': ['id', 'label'],
+                 'properties': {'id': {'type': 'integer'}, 'label': {'type': 'string'}}},
+        'edge': {'type': 'object', 'required': ['from', 'to'],
+                 'properties': {'from': {'type': 'integer'}, 'to': {'type': 'integer'}}},
+    },
+}
+
+GOOD = {'metadata': {'title': 'Good'},
+        'nodes': [{'id': 1, 'label': 'A'}, {'id': 2, 'label': 'B'}, {'id': 3, 'label': 'Alone'}],
+        'edges': [{'from': 2, 'to': 1}, {'from': 2, 'to': 9}]}
+WRONG_TYPE = {'metadata': {}, 'nodes': [{'id': 1, 'label': 'A'}, {'id': '2', 'label': 'B'}],
+              'edges': []}
+
+
+@pytest.mark.parametrize('stream', [False, True])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_batch_reports_mixed_results(load_script, tmp_path, monkeypatch, stream, workers):
+    monkeypatch.setenv('LEARNING_GRAPH_CACHE_DIR', str(tmp_path / 'cache'))
+    schema = tmp_path / 'schema.json'
+    schema.write_text(json.dumps(SCHEMA), encoding='utf-8')
+    files = {name: tmp_path / f'{name}.json' for name in ('good', 'wrong-type', 'broken', 'missing')}
+    files['good'].write_text(json.dumps(GOOD), encoding='utf-8')
+    files['wrong-type'].write_text(json.dumps(WRONG_TYPE), encoding='utf-8')
+    files['broken'].write_text('{"metadata": {}, "nodes": [{"id": 1,}]}', encoding='utf-8')
+
+    validator = load_script('validate-learning-graph.py')
+    summary = validator.run_batch(str(schema), [str(path) for path in files.values()],
+                                  workers, stream)
+    validator.write_json_report(summary, str(tmp_path / 'results.json'))
+    validator.write_junit_report(summary, str(tmp_path / 'results.xml'))
+
+    with open(tmp_path / 'results.json', 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    assert (report['files'], report['passed'], report['failed']) == (4, 1, 3)
+    results = {result['file']: result for result in report['results']}
+    good = results[str(files['good'])]
+    assert (good['status'], good['node_count'], good['edge_count']) == ('passed', 3, 2)
+    assert any('target node 9' in warning for warning in good['warnings'])
+    assert any(warning.startswith('1 orphan nodes: Alone') for warning in good['warnings'])
+    wrong = results[str(files['wrong-type'])]
+    assert wrong['status'] == 'failed' and wrong['path'][-2:] == [1, 'id']
+    assert results[str(files['broken'])]['status'] == 'failed'
+    assert results[str(files['missing'])]['status'] == 'error'
+
+    suite = ET.parse(tmp_path / 'results.xml').getroot()
+    assert (suite.get('tests'), suite.get('failures'), suite.get('errors')) == ('4', '2', '1')
+    outcomes = {case.get('name'): [child.tag for child in case] for case in suite}
+    assert outcomes == {str(files['good']): ['system-out'],
+                        str(files['wrong-type']): ['failure'],
+                        str(files['broken']): ['failure'],
+                        str(files['missing']): ['error']}
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Learning Graph Transitive Reduction
+
+Finds redundant prerequisite edges: A → C is redundant when A also reaches
+C through another prerequisite (A → B → ... → C).  Removing them leaves
+the same learning order with fewer edges, which shrinks learning-graph.json
+and speeds up the vis-network physics layout in the graph viewer.
+
+Concepts are visited in topological order carrying a bitset of everything
+they transitively depend on (bits indexed by topological position).  A
+concept's prerequisites are checked latest-first: a prerequisite already in
+the accumulated bitset is reachable through a later one, so its edge is
+redundant.  Each bitset is dropped once its last dependent has been
+visited, so only the active frontier is held in memory.
+
+Usage: python transitive_reduction.py <input_csv> [reduced_csv]
+"""
+
+import csv
+import json
+from array import array
+from collections import Counter
+from typing import List, Tuple
+
+from learning_graph import LearningGraph
+
+# Listed redundant edges in the console summary
+SHOWN_EDGES = 20
+
+
+def redundant_edges(graph: LearningGraph) -> List[Tuple[int, int]]:
+    """
+    Find every prerequisite edge implied by a longer path.
+
+    Returns:
+        (concept_id, prereq_id) pairs, in topological order of the concept
+
+    Raises:
+        ValueError: if the graph has a cycle (the reduction is only unique for a DAG)
+    """
+    order = graph.topological_order()
+    if len(order) != graph.node_count:
+        raise ValueError("Transitive reduction requires a DAG; "
+                         "run analyze-graph.py to list the cycles")
+
+    position = array('i', bytes(4 * graph.node_count))
+    for slot, node in enumerate(order):
+        position[node] = slot
+
+    offsets, targets, ids = graph.prereq_offsets, graph.prereq_targets, graph.ids
+    remaining = graph.in_degrees()  # dependents still to read each bitset
+    reach = {}
+    redundant = []
+
+    for node in order:
+        prereqs = sorted(targets[offsets[node]:offsets[node + 1]],
+                         key=position.__getitem__, reverse=True)
+        bits = 0
+        for prereq in prereqs:
+            if bits >> position[prereq] & 1:
+                redundant.append((ids[node], ids[prereq]))
+            else:
+                bits |= reach[prereq]
+
+        for prereq in prereqs:
+            remaining[prereq] -= 1
+            if remaining[prereq] == 0:
+                del reach[prereq]
+        if remaining[node]:
+            reach[node] = bits | (1 << position[node])
+
+    return redundant
+
+
+def edge_json_bytes(concept_id: int, prereq_id: int) -> int:
+    """Bytes one edge takes in learning-graph.json as written by csv-to-json.py."""
+    text = json.dumps({'from': concept_id, 'to': prereq_id}, indent=2)
+    # Four lines nested two levels deeper (4 spaces each), plus the ",\n" separator
+    return len(text) + 4 * 4 + 2
+
+
+def write_reduced_csv(graph: LearningGraph, redundant: List[Tuple[int, int]], output_path: str):
+    """
+    Write the learning-graph CSV without the redundant edges.
+
+    Each flagged pair removes one occurrence, so a duplicated dependency
+    ("1|1", flagged once) keeps its first copy.
+    """
+    removed = Counter(redundant)
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ConceptID', 'ConceptLabel', 'Dependencies', 'TaxonomyID'])
+        for cid, label, prereq_ids, taxonomy in graph.rows():
+            kept = []
+            for pid in prereq_ids:
+                if removed[(cid, pid)]:
+                    removed[(cid, pid)] -= 1
+                else:
+                    kept.append(pid)
+            writer.writerow([cid, label, '|'.join(map(str, kept)), taxonomy])
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from graph_cache import load_graph_cached
+
+    if len(sys.argv) < 2:
+        print("Usage: python transitive_reduction.py <input_csv> [reduced_csv]")
+        print("\nExample:")
+        print("  python transitive_reduction.py learning-graph.csv learning-graph-reduced.csv")
+        sys.exit(1)
+
+    graph = load_graph_cached(sys.argv[1])
+    start = time.perf_counter()
+    try:
+        redundant = redundant_edges(graph)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    saved_bytes = sum(edge_json_bytes(cid, pid) for cid, pid in redundant)
+    share = len(redundant) / graph.edge_count if graph.edge_count else 0
+    concepts = graph.concepts
+
+    print(f"Redundant prerequisite edges: {len(redundant)} of {graph.edge_count} ({share:.1%})")
+    for cid, pid in redundant[:SHOWN_EDGES]:
+        print(f"  - {concepts[cid]} ({cid}) → {concepts[pid]} ({pid})")
+    if len(redundant) > SHOWN_EDGES:
+        print(f"  ...and {len(redundant) - SHOWN_EDGES} more")
+    print(f"\nRemoving them saves {len(redundant)} edges and {saved_bytes:,} bytes of learning-graph.json")
+    print(f"Reduction computed in {elapsed * 1000:.1f} ms")
+
+    if len(sys.argv) > 2:
+        write_reduced_csv(graph, redundant, sys.argv[2])
+        print(f"✅ Reduced CSV written: {sys.argv[2]}")
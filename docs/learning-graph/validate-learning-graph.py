@@ -3,45 +3,82 @@
 validate-learning-graph.py
 Validates a learning graph JSON file against the learning-graph-schema.json
 
-Usage: python3 validate-learning-graph.py <data-file> <schema-file>
+The schema is compiled once and cached on disk by its hash (see
+graph_validation.py); duplicate IDs, dangling edges and orphans are found
+in a single linear pass.  --stream parses nodes and edges incrementally
+for files too large to load whole; errors then report the element index
+and byte offset.
+
+--batch validates many files in one run: the schema is compiled once and
+shared by a pool of worker processes, and --json / --junit write a
+machine-readable summary with per-file timings for CI.
+
+Usage: python3 validate-learning-graph.py <data-file> <schema-file> [--stream]
+       python3 validate-learning-graph.py --batch <schema-file> <data-file>...
+                   [--workers N] [--stream] [--json results.json] [--junit results.xml]
 """
 
 import json
 import sys
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from graph_validation import (SHOWN_ORPHANS, SchemaValidationError, check_graph, compile_schema,
+                              compile_stream_schema, stream_orphans, validate_batch,
+                              validate_stream)
+
 # ANSI color codes
 GREEN = '\033[0;32m'
 RED = '\033[0;31m'
 YELLOW = '\033[1;33m'
 NC = '\033[0m'  # No Color
 
-def validate_learning_graph(data_path, schema_path):
-    """Validate a learning graph JSON file against the schema."""
 
-    # Try to import jsonschema
+def load_schema(schema_path, stream=False):
+    """
+    Compile the schema, printing why it cannot be used; None on failure.
+
+    With stream=True the schema is split for validate_stream().
+    """
     try:
-        import jsonschema
-        from jsonschema import validate, ValidationError, SchemaError
+        if stream:
+            return compile_stream_schema(schema_path)
+        return compile_schema(schema_path)
     except ImportError:
-        print(f"{RED}Error: jsonschema library not found{NC}")
+        print(f"{RED}Error: no JSON schema library found{NC}")
         print("\nPlease install it with:")
-        print("  pip install jsonschema")
+        print("  pip install fastjsonschema    (or: pip install jsonschema)")
         print("\nOr with conda:")
-        print("  conda install -c conda-forge jsonschema")
-        return False
-
-    # Load schema
-    try:
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
+        print("  conda install -c conda-forge fastjsonschema")
+        return None
     except json.JSONDecodeError as e:
         print(f"{RED}✗ Schema file is not valid JSON: {e}{NC}")
-        return False
+        return None
+    except ValueError as e:
+        print(f"{RED}✗ Schema itself is invalid: {e}{NC}")
+        return None
     except Exception as e:
         print(f"{RED}✗ Error reading schema file: {e}{NC}")
+        return None
+
+
+def validate_learning_graph(data_path, schema_path, stream=False):
+    """
+    Validate a learning graph JSON file against the schema.
+
+    With stream=True nodes and edges are parsed and validated one at a
+    time, so memory stays flat however large the file is.
+    """
+
+    # Compile the schema (cached on disk when fastjsonschema is installed)
+    validate = load_schema(schema_path, stream)
+    if validate is None:
         return False
 
+    if stream:
+        return _validate_stream(data_path, schema_path, validate)
+
     # Load data
     try:
         with open(data_path, 'r') as f:
@@ -55,72 +92,15 @@ def validate_learning_graph(data_path, schema_path):
 
     # Validate
     try:
-        validate(instance=data, schema=schema)
-        print(f"{GREEN}✓ Validation successful!{NC}")
-        print("")
-        print("Summary:")
-        print(f"  Title: {data.get('metadata', {}).get('title', 'N/A')}")
-        print(f"  Creator: {data.get('metadata', {}).get('creator', 'N/A')}")
-        print(f"  Version: {data.get('metadata', {}).get('version', 'N/A')}")
-        print(f"  Date: {data.get('metadata', {}).get('date', 'N/A')}")
-        print(f"  License: {data.get('metadata', {}).get('license', 'N/A')}")
-        print(f"  Groups: {len(data.get('groups', {}))}")
-        print(f"  Nodes: {len(data.get('nodes', []))}")
-        print(f"  Edges: {len(data.get('edges', []))}")
-
-        # Check for orphan nodes
-        if 'nodes' in data and 'edges' in data:
-            node_ids = {node['id'] for node in data['nodes']}
-            connected_ids = set()
-            for edge in data['edges']:
-                connected_ids.add(edge['from'])
-                connected_ids.add(edge['to'])
-            orphans = node_ids - connected_ids
-            if orphans:
-                print(f"  {YELLOW}Orphan nodes: {len(orphans)} (nodes with no connections){NC}")
-                if len(orphans) <= 10:
-                    orphan_labels = [node['label'] for node in data['nodes'] if node['id'] in orphans]
-                    print(f"    {', '.join(orphan_labels)}")
-            else:
-                print(f"  Orphan nodes: 0")
-
-        # Check for duplicate node IDs
-        node_ids_list = [node['id'] for node in data['nodes']]
-        if len(node_ids_list) != len(set(node_ids_list)):
-            duplicates = [id for id in node_ids_list if node_ids_list.count(id) > 1]
-            print(f"  {RED}Warning: Duplicate node IDs found: {set(duplicates)}{NC}")
-
-        # Check for edges referencing non-existent nodes
-        if 'nodes' in data and 'edges' in data:
-            node_ids = {node['id'] for node in data['nodes']}
-            invalid_edges = []
-            for edge in data['edges']:
-                if edge['from'] not in node_ids:
-                    invalid_edges.append(f"Edge from {edge['from']} -> {edge['to']}: source node {edge['from']} doesn't exist")
-                if edge['to'] not in node_ids:
-                    invalid_edges.append(f"Edge from {edge['from']} -> {edge['to']}: target node {edge['to']} doesn't exist")
-            if invalid_edges:
-                print(f"  {RED}Warning: Invalid edges found:{NC}")
-                for invalid in invalid_edges[:5]:  # Show first 5
-                    print(f"    - {invalid}")
-                if len(invalid_edges) > 5:
-                    print(f"    ... and {len(invalid_edges) - 5} more")
-
+        validate(data)
+        # Duplicate IDs, edges to missing nodes and orphans in one pass
+        result = check_graph(data.get('nodes', []), data.get('edges', []))
+        print_summary(data, len(data.get('nodes', [])), len(data.get('edges', [])), result,
+                      check_orphans='nodes' in data and 'edges' in data)
         return True
 
-    except ValidationError as e:
-        print(f"{RED}✗ Validation failed!{NC}")
-        print("")
-        print(f"Error path: {' -> '.join(str(p) for p in e.absolute_path)}")
-        print(f"Error: {e.message}")
-        if e.context:
-            print("\nAdditional errors:")
-            for suberror in e.context:
-                print(f"  - {suberror.message}")
-        return False
-
-    except SchemaError as e:
-        print(f"{RED}✗ Schema itself is invalid: {e}{NC}")
+    except SchemaValidationError as e:
+        print_schema_error(e)
         return False
 
     except Exception as e:
@@ -130,18 +110,181 @@ def validate_learning_graph(data_path, schema_path):
         return False
 
 
+def _validate_stream(data_path, schema_path, compiled):
+    """Validate without loading the data file whole (see graph_validation.validate_stream)."""
+    try:
+        result = validate_stream(data_path, schema_path, compiled=compiled)
+    except SchemaValidationError as e:
+        print_schema_error(e)
+        return False
+    except ValueError as e:
+        print(f"{RED}✗ Data file is not valid JSON: {e}{NC}")
+        return False
+    except Exception as e:
+        print(f"{RED}✗ Error reading data file: {e}{NC}")
+        return False
+
+    # Only ConceptIDs are kept while streaming; labels are read back when listed
+    result['orphans'] = stream_orphans(data_path, result['orphans'])
+    print_summary(result['document'], result['node_count'], result['edge_count'], result,
+                  check_orphans=True)
+    return True
+
+
+def print_summary(data, node_count, edge_count, result, check_orphans):
+    """Print the summary of a valid graph and its structural warnings."""
+    print(f"{GREEN}✓ Validation successful!{NC}")
+    print("")
+    print("Summary:")
+    print(f"  Title: {data.get('metadata', {}).get('title', 'N/A')}")
+    print(f"  Creator: {data.get('metadata', {}).get('creator', 'N/A')}")
+    print(f"  Version: {data.get('metadata', {}).get('version', 'N/A')}")
+    print(f"  Date: {data.get('metadata', {}).get('date', 'N/A')}")
+    print(f"  License: {data.get('metadata', {}).get('license', 'N/A')}")
+    print(f"  Groups: {len(data.get('groups', {}))}")
+    print(f"  Nodes: {node_count}")
+    print(f"  Edges: {edge_count}")
+
+    # Check for orphan nodes
+    if check_orphans:
+        orphans = result['orphans']
+        if orphans:
+            print(f"  {YELLOW}Orphan nodes: {len(orphans)} (nodes with no connections){NC}")
+            if len(orphans) <= SHOWN_ORPHANS:
+                print(f"    {', '.join(orphans)}")
+        else:
+            print(f"  Orphan nodes: 0")
+
+    # Check for duplicate node IDs
+    if result['duplicates']:
+        print(f"  {RED}Warning: Duplicate node IDs found: {set(result['duplicates'])}{NC}")
+
+    # Check for edges referencing non-existent nodes
+    invalid_edges = result['invalid_edges']
+    invalid_count = result.get('invalid_edge_count', len(invalid_edges))
+    if invalid_edges:
+        print(f"  {RED}Warning: Invalid edges found:{NC}")
+        for invalid in invalid_edges[:5]:  # Show first 5
+            print(f"    - {invalid}")
+        if invalid_count > 5:
+            print(f"    ... and {invalid_count - 5} more")
+
+
+def print_schema_error(e):
+    print(f"{RED}✗ Validation failed!{NC}")
+    print("")
+    print(f"Error path: {' -> '.join(str(p) for p in e.path)}")
+    if e.offset is not None:
+        print(f"Byte offset: {e.offset}")
+    print(f"Error: {e.message}")
+    if e.context:
+        print("\nAdditional errors:")
+        for message in e.context:
+            print(f"  - {message}")
+
+
+def run_batch(schema_path, data_paths, workers=None, stream=False):
+    """Validate many files with one compiled schema; print a line per file."""
+    if load_schema(schema_path, stream) is None:
+        return None
+    start = time.perf_counter()
+    try:
+        results = validate_batch(data_paths, schema_path, workers, stream)
+    except Exception as e:
+        print(f"{RED}✗ Batch validation failed: {e}{NC}")
+        return None
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        seconds = f"({result['seconds']:.2f}s)"
+        if result['status'] == 'passed':
+            warned = f" {YELLOW}{len(result['warnings'])} warnings{NC}" if result['warnings'] else ""
+            print(f"{GREEN}✓{NC} {result['file']} {seconds}{warned}")
+        else:
+            where = ' -> '.join(str(p) for p in result['path'] or [])
+            where += f" (byte {result['offset']})" if result['offset'] is not None else ""
+            print(f"{RED}✗ {result['file']} {seconds}: {where + ': ' if where else ''}"
+                  f"{result['message']}{NC}")
+
+    passed = sum(result['status'] == 'passed' for result in results)
+    print("")
+    print(f"Validated {len(results)} files in {elapsed:.2f}s: {passed} passed, "
+          f"{len(results) - passed} failed")
+    return {'schema': schema_path, 'files': len(results), 'passed': passed,
+            'failed': len(results) - passed, 'seconds': round(elapsed, 3), 'results': results}
+
+
+def write_json_report(summary, output_path):
+    """Write the batch summary as JSON."""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+        f.write('\n')
+
+
+def write_junit_report(summary, output_path):
+    """Write the batch summary as a JUnit XML test suite, one test case per file."""
+    suite = ET.Element('testsuite', name='learning-graph-validation', tests=str(summary['files']),
+                       failures=str(sum(r['status'] == 'failed' for r in summary['results'])),
+                       errors=str(sum(r['status'] == 'error' for r in summary['results'])),
+                       time=f"{summary['seconds']:.3f}")
+    for result in summary['results']:
+        case = ET.SubElement(suite, 'testcase', classname='learning-graph', name=result['file'],
+                             time=f"{result['seconds']:.3f}")
+        if result['status'] != 'passed':
+            where = ' -> '.join(str(p) for p in result['path'] or [])
+            if result['offset'] is not None:
+                where += f" (byte {result['offset']})"
+            element = ET.SubElement(case, 'failure' if result['status'] == 'failed' else 'error',
+                                    message=result['message'])
+            element.text = f"{where}: {result['message']}" if where else result['message']
+        else:
+            details = [f"Nodes: {result['node_count']}", f"Edges: {result['edge_count']}"]
+            ET.SubElement(case, 'system-out').text = '\n'.join(details + result['warnings'])
+    ET.ElementTree(suite).write(output_path, encoding='utf-8', xml_declaration=True)
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) != 3:
+    args = sys.argv[1:]
+    stream = '--stream' in args
+    batch = '--batch' in args
+    args = [arg for arg in args if arg not in ('--stream', '--batch')]
+    options = {'--workers': None, '--json': None, '--junit': None}
+    for option in options:
+        if option in args:
+            i = args.index(option)
+            if i + 1 >= len(args):
+                args = []
+                break
+            options[option] = args[i + 1]
+            del args[i:i + 2]
+
+    if len(args) < 2 or (not batch and (len(args) != 2 or any(options.values()))):
         print(f"{RED}Error: Wrong number of arguments{NC}")
-        print(f"Usage: {sys.argv[0]} <data-file> <schema-file>")
+        print(f"Usage: {sys.argv[0]} <data-file> <schema-file> [--stream]")
+        print(f"       {sys.argv[0]} --batch <schema-file> <data-file>... [--workers N]")
+        print("           [--stream] [--json results.json] [--junit results.xml]")
+        print("\nExample:")
+        print(f"  {sys.argv[0]} --batch learning-graph-schema.json courses/*/learning-graph.json \\")
+        print("      --junit validation.xml")
         sys.exit(1)
 
-    data_file = sys.argv[1]
-    schema_file = sys.argv[2]
+    if batch:
+        workers = int(options['--workers']) if options['--workers'] else None
+        summary = run_batch(args[0], args[1:], workers, stream)
+        if summary is None:
+            sys.exit(1)
+        if options['--json']:
+            write_json_report(summary, options['--json'])
+        if options['--junit']:
+            write_junit_report(summary, options['--junit'])
+        sys.exit(0 if summary['failed'] == 0 else 1)
+
+    data_file = args[0]
+    schema_file = args[1]
 
     # Validate the learning graph
-    success = validate_learning_graph(data_file, schema_file)
+    success = validate_learning_graph(data_file, schema_file, stream=stream)
     sys.exit(0 if success else 1)
 
 
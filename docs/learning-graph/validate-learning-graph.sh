@@ -2,7 +2,7 @@
 
 # validate-learning-graph.sh
 # Validates a learning graph JSON file against the learning-graph-schema.json
-# Usage: ./validate-learning-graph.sh <path-to-learning-graph.json>
+# Usage: ./validate-learning-graph.sh <path-to-learning-graph.json> [--stream]
 
 set -e
 
@@ -19,7 +19,7 @@ SCHEMA_FILE="$SCRIPT_DIR/learning-graph-schema.json"
 # Check if a file was provided
 if [ $# -eq 0 ]; then
     echo -e "${RED}Error: No learning graph file specified${NC}"
-    echo "Usage: $0 <path-to-learning-graph.json>"
+    echo "Usage: $0 <path-to-learning-graph.json> [--stream]"
     echo ""
     echo "Example:"
     echo "  $0 ../../docs/vis/combined-viewer/learning-graph.json"
@@ -47,7 +47,7 @@ echo "Schema file: $SCHEMA_FILE"
 echo ""
 
 # Run Python validation on the input file against the schema
-python3 "$SCRIPT_DIR/validate-learning-graph.py" "$INPUT_FILE" "$SCHEMA_FILE"
+python3 "$SCRIPT_DIR/validate-learning-graph.py" "$INPUT_FILE" "$SCHEMA_FILE" "${@:2}"
 
 # Capture exit code
 EXIT_CODE=$?
@@ -1,6 +1,13 @@
 // Global variables
 var nodes, edges, network;
 
+var GRAPH_URL = '../../learning-graph/learning-graph.json';
+var GRAPH_DIR = GRAPH_URL.substring(0, GRAPH_URL.lastIndexOf('/') + 1);
+
+// Set when learning-graph.json is a partition manifest (csv-to-json.py --partition)
+var manifest = null;
+var partitionLoads = {};
+
 // ========== UTILITY FUNCTIONS ==========
 
 function toggleSidebar() {
@@ -28,10 +35,11 @@ function updateStatistics() {
   var visibleNodes = allNodes.filter(node => !node.hidden);
 
   // Filter visible edges (both connected nodes must be visible)
+  // (with partitions, an edge may point at a node that is not loaded yet)
   var visibleEdges = allEdges.filter(edge => {
     var fromNode = nodes.get(edge.from);
     var toNode = nodes.get(edge.to);
-    return (!fromNode.hidden && !toNode.hidden);
+    return (fromNode && toNode && !fromNode.hidden && !toNode.hidden);
   });
 
   var nodeCount = visibleNodes.length;
@@ -55,6 +63,10 @@ function updateStatistics() {
 // Function to toggle groups
 function toggleGroup(groupName) {
   const visible = document.getElementById(`group${groupName}`).checked;
+  if (visible && manifest && !partitionLoads[groupName]) {
+    loadPartition(groupName).then(updateStatistics);
+    return;
+  }
   nodes.update(
     nodes.get({ filter: node => node.group === groupName })
          .map(node => ({ id: node.id, hidden: !visible }))
@@ -66,6 +78,9 @@ function toggleGroup(groupName) {
 function checkAllGroups() {
   document.querySelectorAll('input[id^="group"]').forEach(cb => { cb.checked = true; });
   nodes.update(nodes.get().map(node => ({ id: node.id, hidden: false })));
+  if (manifest) {
+    Promise.all(Object.keys(manifest.partitions).map(loadPartition)).then(updateStatistics);
+  }
 }
 
 // Function to uncheck all groups
@@ -151,7 +166,23 @@ function setMetadata(metadata) {
 
 // ========== INITIALIZATION ==========
 
-function initializeNetwork(graphData) {
+// 'positions', 'levels' or null (physics), from what csv-to-json.py wrote on the nodes
+function detectLayout(graphNodes) {
+  if (graphNodes.length === 0) {
+    return null;
+  }
+  if (graphNodes.every(function(node) {
+        return typeof node.x === 'number' && typeof node.y === 'number';
+      })) {
+    return 'positions';
+  }
+  if (graphNodes.every(function(node) { return typeof node.level === 'number'; })) {
+    return 'levels';
+  }
+  return null;
+}
+
+function initializeNetwork(graphData, layoutMode) {
   // Set metadata (title, description)
   if (graphData.metadata) {
     setMetadata(graphData.metadata);
@@ -196,6 +227,27 @@ function initializeNetwork(graphData) {
     }
   };
 
+  // csv-to-json.py --layout writes precomputed x/y coordinates; draw the
+  // nodes where they are with no layout or physics work at all.  Otherwise
+  // it writes a topological level on every node of an acyclic graph; use it
+  // for a hierarchical layout with no physics simulation
+  layoutMode = layoutMode === undefined ? detectLayout(graphData.nodes) : layoutMode;
+  if (layoutMode === 'positions') {
+    options.edges.smooth = false;
+    options.physics = false;
+  } else if (layoutMode === 'levels') {
+    options.layout = {
+      hierarchical: {
+        enabled: true,
+        direction: 'UD',
+        levelSeparation: 150,
+        nodeSpacing: 120
+      }
+    };
+    options.edges.smooth = { type: 'cubicBezier', forceDirection: 'vertical' };
+    options.physics = false;
+  }
+
   network = new vis.Network(container, data, options);
 
   // Initialize search functionality
@@ -263,19 +315,150 @@ function initializeSearch() {
   });
 }
 
-// ========== LOAD DATA AND START APPLICATION ==========
+// ========== PARTITIONED GRAPHS ==========
 
-// Load the graph data from JSON file
-fetch('../../learning-graph/learning-graph.json')
-  .then(response => {
+function fetchJson(url) {
+  return fetch(url).then(response => {
     if (!response.ok) {
-      throw new Error('Failed to load learning-graph.json');
+      throw new Error('Failed to load ' + url);
     }
     return response.json();
-  })
-  .then(graphData => {
-    initializeNetwork(graphData);
-  })
+  });
+}
+
+// Fetch one TaxonomyID partition (once) and add its nodes and edges
+function loadPartition(taxonomy) {
+  if (!partitionLoads[taxonomy]) {
+    partitionLoads[taxonomy] = fetchJson(GRAPH_DIR + manifest.partitions[taxonomy].file)
+      .then(chunk => {
+        nodes.add(chunk.nodes);
+        edges.add(chunk.edges);
+      });
+  }
+  return partitionLoads[taxonomy];
+}
+
+// Start from the manifest alone, then fetch only the partitions to show.
+// ?groups=A,B limits the initial fetch; other groups load when checked.
+function initializePartitioned(graphManifest) {
+  manifest = graphManifest;
+  initializeNetwork({
+    metadata: manifest.metadata,
+    groups: manifest.groups,
+    nodes: [],
+    edges: []
+  }, manifest.layout || null);
+
+  var requested = new URLSearchParams(window.location.search).get('groups');
+  var initial = requested ? requested.split(',') : Object.keys(manifest.partitions);
+  Object.keys(manifest.groups || {}).forEach(function(groupName) {
+    var checkbox = document.getElementById(`group${groupName}`);
+    if (checkbox) {
+      checkbox.checked = initial.includes(groupName);
+    }
+  });
+
+  // Edges between groups are drawn once both of their ends are loaded
+  var loads = initial.filter(taxonomy => taxonomy in manifest.partitions)
+    .map(taxonomy => loadPartition(taxonomy).then(updateStatistics));
+  loads.push(fetchJson(GRAPH_DIR + manifest.crossEdges.file)
+    .then(chunk => { edges.add(chunk.edges); }));
+  return Promise.all(loads).then(updateStatistics);
+}
+
+// ========== BINARY GRAPHS ==========
+
+// Decode csv-to-json.py --binary output (layout in graph_binary.py): the
+// Int32 sections are wrapped in place, only the strings are decoded
+function decodeBinaryGraph(buffer) {
+  var header = new DataView(buffer, 0, 32);
+  var magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 8));
+  if (magic !== 'LGBIN001') {
+    throw new Error('Not a learning graph binary file');
+  }
+  var n = header.getUint32(8, true);
+  var e = header.getUint32(12, true);
+  var g = header.getUint32(16, true);
+  var flags = header.getUint32(20, true);
+  var headBytes = header.getUint32(24, true);
+  var stringBytes = header.getUint32(28, true);
+
+  var pos = 32;
+  function ints(length) {
+    var section = new Int32Array(buffer, pos, length);
+    pos += 4 * length;
+    return section;
+  }
+  var ids = ints(n), groups = ints(n);
+  var levels = (flags & 1) ? ints(n) : null;
+  var xs = (flags & 2) ? ints(n) : null;
+  var ys = (flags & 2) ? ints(n) : null;
+  var edgeFrom = ints(e), edgeTo = ints(e);
+  var offsets = ints(n + g + 1);
+
+  var decoder = new TextDecoder();
+  var head = JSON.parse(decoder.decode(new Uint8Array(buffer, pos, headBytes)));
+  var strings = new Uint8Array(buffer, pos + headBytes, stringBytes);
+  function string(i) {
+    return decoder.decode(strings.subarray(offsets[i], offsets[i + 1]));
+  }
+
+  var hasPrerequisites = new Set(edgeFrom);
+  var groupNames = [];
+  for (var j = 0; j < g; j++) {
+    groupNames.push(string(n + j));
+  }
+  var graphNodes = new Array(n);
+  for (var i = 0; i < n; i++) {
+    var node = { id: ids[i], label: string(i), group: groupNames[groups[i]] };
+    if (levels && levels[i] >= 0) {
+      node.level = levels[i];
+    }
+    if (xs) {
+      node.x = xs[i];
+      node.y = ys[i];
+    }
+    if (!hasPrerequisites.has(ids[i])) {
+      node.shape = 'box';
+    }
+    graphNodes[i] = node;
+  }
+  var graphEdges = new Array(e);
+  for (var k = 0; k < e; k++) {
+    graphEdges[k] = { from: edgeFrom[k], to: edgeTo[k] };
+  }
+  return { metadata: head.metadata, groups: head.groups, nodes: graphNodes, edges: graphEdges };
+}
+
+// ========== LOAD DATA AND START APPLICATION ==========
+
+function loadGraph() {
+  // ?format=binary loads learning-graph.lgbin instead of the JSON
+  if (new URLSearchParams(window.location.search).get('format') === 'binary') {
+    var binaryUrl = GRAPH_URL.replace(/\.json$/, '.lgbin');
+    return fetch(binaryUrl)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error('Failed to load ' + binaryUrl);
+        }
+        return response.arrayBuffer();
+      })
+      .then(buffer => {
+        initializeNetwork(decodeBinaryGraph(buffer));
+      });
+  }
+
+  // Load the graph data (or its partition manifest) from JSON file
+  return fetchJson(GRAPH_URL)
+    .then(graphData => {
+      if (graphData.partitions) {
+        return initializePartitioned(graphData);
+      }
+      initializeNetwork(graphData);
+    });
+}
+
+loadGraph()
   .catch(error => {
     console.error('Error loading graph data:', error);
     document.getElementById('mynetwork').innerHTML =